@@ -0,0 +1,91 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY_MODULES = ("deep_translator", "cryptography", "PyQt5.QtSvg", "ctypes.wintypes")
+
+
+def measure(module, runs):
+    totals = []
+    imported = {}
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import " + module],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else "import failed")
+        total = 0
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            parts = [x.strip() for x in line[len("import time:"):].split("|")]
+            if not parts[0].isdigit():
+                continue
+            name = parts[2]
+            cumulative = int(parts[1])
+            imported[name.strip()] = cumulative
+            if name == module:
+                total = cumulative
+        totals.append(total)
+    totals.sort()
+    return {
+        "module":     module,
+        "runs":       runs,
+        "median_ms":  round(totals[len(totals) // 2] / 1000.0, 2),
+        "min_ms":     round(totals[0] / 1000.0, 2),
+        "slowest":    sorted(imported.items(), key=lambda kv: kv[1], reverse=True)[:15],
+        "imported":   sorted(imported),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Import-time benchmark for Cysra Anome.")
+    ap.add_argument("--module", default="cysrabrowser")
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--save", help="write results as JSON to this path")
+    ap.add_argument("--baseline", help="compare against a JSON file written by --save")
+    ap.add_argument("--max-regression", type=float, default=0.2,
+                    help="allowed slowdown against the baseline (0.2 = 20%%)")
+    ap.add_argument("--check", action="store_true",
+                    help="exit non-zero if a lazy module is imported eagerly or the baseline regresses")
+    args = ap.parse_args()
+
+    try:
+        res = measure(args.module, args.runs)
+    except RuntimeError as exc:
+        print(f"cannot import {args.module}: {exc}")
+        sys.exit(2)
+    print(f"import {res['module']}: median {res['median_ms']} ms, min {res['min_ms']} ms ({res['runs']} runs)")
+    for name, us in res["slowest"]:
+        print(f"  {us / 1000.0:>9.2f} ms  {name}")
+
+    failures = []
+    eager = [m for m in LAZY_MODULES if m in res["imported"]]
+    if eager:
+        failures.append("imported at startup: " + ", ".join(eager))
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            base = json.load(f)
+        delta = res["median_ms"] - base["median_ms"]
+        print(f"baseline {base['median_ms']} ms -> {res['median_ms']} ms ({delta:+.2f} ms)")
+        if res["median_ms"] > base["median_ms"] * (1.0 + args.max_regression):
+            failures.append(f"import time regressed by {delta:+.2f} ms")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(res, f, indent=2)
+
+    for msg in failures:
+        print("FAIL: " + msg)
+    if args.check and failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
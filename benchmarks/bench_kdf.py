@@ -0,0 +1,59 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cysra.crypto import calibrate_kdf, derive_master, new_kdf  # noqa: E402
+from cysra.paths import DATA_FILE  # noqa: E402
+
+
+def confirm(cost, runs):
+    cost = dict(cost)
+    kdf = new_kdf(cost.pop("algo"), cost)
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        derive_master("calibrate", kdf)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return round(statistics.median(samples), 1)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Calibrate the master password KDF cost for this machine.")
+    ap.add_argument("--algo", choices=("scrypt", "pbkdf2"), default="scrypt")
+    ap.add_argument("--target-ms", type=float, default=250.0, help="wanted unlock time")
+    ap.add_argument("--runs", type=int, default=3)
+    ap.add_argument("--apply", nargs="?", const=DATA_FILE, metavar="DATA_FILE",
+                    help="store the cost as kdf_cost in the data file (used for the next master password)")
+    args = ap.parse_args()
+
+    cost, samples = calibrate_kdf(args.algo, args.target_ms)
+    for s in samples:
+        label = ", ".join(f"{k}={v}" for k, v in s.items() if k != "ms")
+        print(f"  {label:<24}{s['ms']:>10.1f} ms")
+    median = confirm(cost, args.runs)
+    print(json.dumps({
+        "python":    platform.python_version(),
+        "platform":  platform.platform(),
+        "target_ms": args.target_ms,
+        "cost":      cost,
+        "median_ms": median,
+    }, indent=2))
+
+    if args.apply:
+        with open(args.apply, encoding="utf-8") as f:
+            data = json.load(f)
+        data["kdf_cost"] = cost
+        with open(args.apply, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        print("kdf_cost written to " + args.apply + "; the vault is re-keyed on the next unlock")
+
+
+if __name__ == "__main__":
+    main()
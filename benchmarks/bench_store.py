@@ -0,0 +1,149 @@
+import argparse
+import base64
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cysra.history import filter_history, most_visited  # noqa: E402
+from cysra.store import DataStore  # noqa: E402
+
+HISTORY_SCALES = (2000, 20000, 200000)
+FAVORITES = 1000
+PASSWORDS = 500
+WORDS = ("news", "docs", "mail", "video", "shop", "wiki", "maps", "cloud",
+         "forum", "music", "code", "photos", "travel", "sports", "games")
+
+
+def make_url(rng, i):
+    host = rng.choice(WORDS) + str(rng.randint(0, 400)) + ".example.com"
+    return f"https://{host}/{rng.choice(WORDS)}/{i}"
+
+
+def make_data(rng, n_history):
+    history = []
+    for i in range(n_history):
+        url = make_url(rng, i)
+        history.append({"url": url, "title": rng.choice(WORDS).title() + " page " + str(i),
+                        "ts": "01 Jan 12:00"})
+    favorites = [{"url": h["url"], "title": h["title"]}
+                 for h in rng.sample(history, min(FAVORITES, len(history)))]
+    passwords = [{"site": f"https://login.{rng.choice(WORDS)}{i}.com", "user": f"user{i}",
+                  "pwd": base64.b64encode(f"secret-{i}".encode()).decode()}
+                 for i in range(PASSWORDS)]
+    return {"history": history, "favorites": favorites, "passwords": passwords,
+            "master_pwd": None, "perf_mode": "medium"}
+
+
+def timed(fn, reps, setup=None):
+    samples = []
+    for _ in range(reps):
+        if setup:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return {
+        "reps":      reps,
+        "median_us": round(statistics.median(samples), 1),
+        "min_us":    round(min(samples), 1),
+        "mean_us":   round(statistics.fmean(samples), 1),
+    }
+
+
+def bench_scale(n, workdir, seed):
+    rng = random.Random(seed + n)
+    data = make_data(rng, n)
+    path = os.path.join(workdir, f"data_{n}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    reps = max(3, min(50, 100000 // n))
+    res = {"history": n, "favorites": len(data["favorites"]),
+           "passwords": len(data["passwords"]),
+           "file_bytes": os.path.getsize(path)}
+
+    res["load"] = timed(lambda: DataStore(path), reps)
+    store = DataStore(path)
+    res["save"] = timed(store._save, reps)
+
+    base_history = data["history"]
+
+    def reset_history():
+        store._data["history"] = list(base_history)
+
+    new_urls = iter(make_url(rng, n + i) for i in range(10 ** 6))
+    res["add_history_new"] = timed(lambda: store.add_history(next(new_urls), "New"),
+                                   reps, reset_history)
+    revisit = base_history[len(base_history) // 2]["url"]
+    res["add_history_revisit"] = timed(lambda: store.add_history(revisit, "Again"),
+                                       reps, reset_history)
+    reset_history()
+
+    fav_hits = [f["url"] for f in data["favorites"]]
+    misses = [make_url(rng, -i) for i in range(len(fav_hits))]
+    lookups = 1000
+    res["is_favorite_hit_x1000"] = timed(
+        lambda: [store.is_favorite(fav_hits[i % len(fav_hits)]) for i in range(lookups)], reps)
+    res["is_favorite_miss_x1000"] = timed(
+        lambda: [store.is_favorite(misses[i % len(misses)]) for i in range(lookups)], reps)
+
+    res["home_most_visited"] = timed(lambda: most_visited(store.history), reps)
+    res["home_payload_json"] = timed(lambda: json.dumps({
+        "favorites": store.favorites,
+        "most_visited": most_visited(store.history),
+        "theme": "dark",
+    }), reps)
+
+    res["history_filter_common"] = timed(lambda: filter_history(store.history, "docs"), reps)
+    res["history_filter_rare"] = timed(lambda: filter_history(store.history, "zzz-no-match"), reps)
+
+    store.set_master_pwd("bench")
+    res["unlock_master"] = timed(lambda: store.unlock_master("bench"), 3)
+    res["passwords_list"] = timed(lambda: store.passwords, reps)
+    last = store.passwords[-1]
+    res["password_reveal_one"] = timed(lambda: store.reveal_password(last["site"], last["user"]), reps)
+    res["credentials_for_x1000"] = timed(
+        lambda: [store.credentials_for(last["site"]) for _ in range(lookups)], reps)
+    return res
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Headless DataStore benchmarks.")
+    ap.add_argument("--scales", default=",".join(str(s) for s in HISTORY_SCALES),
+                    help="comma-separated history sizes")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--out", help="write JSON results to this path")
+    args = ap.parse_args()
+
+    scales = [int(x) for x in args.scales.split(",") if x.strip()]
+    results = {
+        "python":   platform.python_version(),
+        "platform": platform.platform(),
+        "scales":   [],
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in scales:
+            res = bench_scale(n, workdir, args.seed)
+            results["scales"].append(res)
+            print(f"history={n} ({res['file_bytes'] // 1024} KB)")
+            for key, val in res.items():
+                if isinstance(val, dict):
+                    print(f"  {key:<26}{val['median_us']:>14.1f} us  (min {val['min_us']:.1f}, n={val['reps']})")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("QTWEBENGINE_CHROMIUM_FLAGS", "--disable-gpu")
+
+from PyQt5.QtCore import QEventLoop, QTimer  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from cysra.cpu import process_cpu_seconds  # noqa: E402
+from cysra.home import register_scheme  # noqa: E402
+from cysra.store import DataStore  # noqa: E402
+from cysra.tab import BrowserTab  # noqa: E402
+from cysra.window import MainWindow  # noqa: E402
+
+TAB_COUNTS = (1, 10, 50, 100)
+BUSY_TABS = 5
+PAINTED = "cysra-bench-painted"
+BUSY_JS = "<script>setInterval(function(){var x=0;for(var i=0;i<2e5;i++)x+=i;},16);</script>"
+
+PAGE = """<!DOCTYPE html><html><head><meta charset="utf-8"><title>page {n}</title>
+<style>body{{font-family:sans-serif}} li{{padding:4px}}</style></head><body>
+<h1>Benchmark page {n}</h1><ul>{items}</ul>
+<script>
+requestAnimationFrame(function(){{requestAnimationFrame(function(){{document.title="%s";}});}});
+</script></body></html>""" % PAINTED
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        n = self.path.strip("/").split("/")[-1] or "0"
+        items = "".join(f"<li>Item {i} of page {n}</li>" for i in range(200))
+        body = PAGE.format(n=n, items=items)
+        if self.path.startswith("/busy/"):
+            body = body.replace("</body>", BUSY_JS + "</body>")
+        body = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def rss_kb():
+    try:
+        with open("/proc/self/status", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except Exception:
+        pass
+    return None
+
+
+def wait_until(pred, timeout_ms=15000):
+    if pred():
+        return True
+    loop = QEventLoop()
+    poll = QTimer()
+    poll.timeout.connect(lambda: pred() and loop.quit())
+    poll.start(2)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec_()
+    poll.stop()
+    return pred()
+
+
+def summary(samples):
+    if not samples:
+        return None
+    return {
+        "n":         len(samples),
+        "median_ms": round(statistics.median(samples), 2),
+        "min_ms":    round(min(samples), 2),
+        "max_ms":    round(max(samples), 2),
+    }
+
+
+def open_tab(win, url):
+    painted = {"done": False}
+    t0 = time.perf_counter()
+    tab = win.add_tab()
+    tab.view.titleChanged.connect(lambda t: t == PAINTED and painted.update(done=True))
+    tab.navigate(url)
+    ok = wait_until(lambda: painted["done"])
+    return (time.perf_counter() - t0) * 1000.0 if ok else None
+
+
+def bench_count(win, base, count):
+    res = {"tabs": count}
+    while win.tabs.count() > 1:
+        win._close_tab(win.tabs.count() - 1)
+    wait_until(lambda: False, 200)
+
+    opens = []
+    for i in range(count):
+        ms = open_tab(win, f"{base}/page/{count}-{i}")
+        if ms is not None:
+            opens.append(ms)
+    res["open_to_first_paint"] = summary(opens)
+
+    switches = []
+    total = win.tabs.count()
+    for i in range(min(total * 2, 200)):
+        target = (i * 7 + 3) % total
+        if target == win.tabs.currentIndex():
+            target = (target + 1) % total
+        t0 = time.perf_counter()
+        win.tabs.setCurrentIndex(target)
+        QApplication.processEvents()
+        switches.append((time.perf_counter() - t0) * 1000.0)
+    res["switch"] = summary(switches)
+
+    for label, fn in (
+        ("theme_light", lambda: win._set_theme("light")),
+        ("theme_dark",  lambda: win._set_theme("dark")),
+    ):
+        t0 = time.perf_counter()
+        fn()
+        QApplication.processEvents()
+        res[label] = round((time.perf_counter() - t0) * 1000.0, 2)
+    start_mode = win.store.perf_mode
+    for mode in ("lowest", "low", "medium", "high"):
+        t0 = time.perf_counter()
+        win._apply_perf_mode(mode)
+        QApplication.processEvents()
+        res["perf_" + mode] = round((time.perf_counter() - t0) * 1000.0, 2)
+    win._apply_perf_mode(start_mode)
+
+    closes = []
+    rss_before = rss_kb()
+    while win.tabs.count() > 1:
+        idx = win.tabs.count() - 1
+        tab = win.tabs.widget(idx)
+        gone = {"done": False}
+        tab.destroyed.connect(lambda *_: gone.update(done=True))
+        t0 = time.perf_counter()
+        win._close_tab(idx)
+        if wait_until(lambda: gone["done"]):
+            closes.append((time.perf_counter() - t0) * 1000.0)
+    res["close_and_reclaim"] = summary(closes)
+    wait_until(lambda: False, 1200)
+    rss_after = rss_kb()
+    if rss_before is not None and rss_after is not None:
+        res["rss_before_close_kb"] = rss_before
+        res["rss_after_close_kb"] = rss_after
+    return res
+
+
+def renderer_cpu_pct(tabs, window_ms=3000):
+    pids = {t.cpu_pid() for t in tabs if t.cpu_pid()}
+    before = {pid: process_cpu_seconds(pid) for pid in pids}
+    t0 = time.perf_counter()
+    wait_until(lambda: False, window_ms)
+    elapsed = time.perf_counter() - t0
+    total = 0.0
+    for pid, start in before.items():
+        end = process_cpu_seconds(pid)
+        if start is not None and end is not None:
+            total += end - start
+    return round(100.0 * total / elapsed, 1)
+
+
+def bench_background(win, base):
+    while win.tabs.count() > 1:
+        win._close_tab(win.tabs.count() - 1)
+    busy = []
+    for i in range(BUSY_TABS):
+        open_tab(win, f"{base}/busy/{i}")
+        busy.append(win.tabs.widget(win.tabs.count() - 1))
+    open_tab(win, f"{base}/page/idle")
+    res = {"busy_tabs": BUSY_TABS}
+    res["background_cpu_pct_unthrottled"] = renderer_cpu_pct(busy)
+    for tab in busy:
+        tab.set_background(True)
+    wait_until(lambda: False, 500)
+    res["background_cpu_pct_throttled"] = renderer_cpu_pct(busy)
+    res["states"] = [tab.state_label() for tab in busy]
+    return res
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Offscreen MainWindow tab benchmarks.")
+    ap.add_argument("--tabs", default=",".join(str(c) for c in TAB_COUNTS),
+                    help="comma-separated tab counts")
+    ap.add_argument("--out", default="bench_ui.json", help="JSON report path")
+    args = ap.parse_args()
+
+    server, base = start_server()
+    register_scheme()
+    app = QApplication(sys.argv)
+    results = {
+        "python":   platform.python_version(),
+        "platform": platform.platform(),
+        "qpa":      os.environ.get("QT_QPA_PLATFORM"),
+        "runs":     [],
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        store = DataStore(os.path.join(workdir, "cysra_data.json"))
+        win = MainWindow(store)
+        win.show()
+        wait_until(lambda: win.tabs.count() >= 1 and isinstance(win.tabs.widget(0), BrowserTab))
+        for count in [int(x) for x in args.tabs.split(",") if x.strip()]:
+            res = bench_count(win, base, count)
+            results["runs"].append(res)
+            print(json.dumps(res))
+        results["background"] = bench_background(win, base)
+        print(json.dumps(results["background"]))
+        win.close()
+    server.shutdown()
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print("wrote " + args.out)
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import sys
+import os
+import traceback
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt
+
+from .home import register_scheme
+from .storage import evict_pending
+from .store import DataStore
+from .trace import STARTUP_TRACE
+from .window import MainWindow
+
+
+def main():
+    if "--trace-startup" in sys.argv:
+        sys.argv.remove("--trace-startup")
+        STARTUP_TRACE.enabled = True
+    STARTUP_TRACE.mark("imports")
+
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps,    True)
+
+    store = DataStore()
+    perf_mode = store.perf_mode
+    STARTUP_TRACE.mark("data store")
+
+    if perf_mode == "lowest":
+        os.environ["QTWEBENGINE_DISABLE_GPU"] = "1"
+        sys.argv.append("--disable-gpu")
+        sys.argv.append("--disable-software-rasterizer")
+    else:
+        os.environ.pop("QTWEBENGINE_DISABLE_GPU", None)
+
+    evict_pending(store)
+    STARTUP_TRACE.mark("site eviction")
+
+    register_scheme()
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")
+    STARTUP_TRACE.mark("qt application")
+
+    try:
+        win = MainWindow(store)
+        win.show()
+        sys.exit(app.exec_())
+    except Exception:
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+
+from PyQt5.QtCore import QObject
+
+from .perf import perf_limit
+
+BFCACHE_HISTORY = 50
+
+
+class BackForwardCache(QObject):
+    # Pages a tab navigated away from stay alive, frozen, so back/forward
+    # swaps them in instead of reloading. All tabs share one budget: the
+    # page left longest ago is dropped first and its entry falls back to a
+    # plain load of the URL.
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self._held = OrderedDict()
+        self.stats = {"stored": 0, "hits": 0, "misses": 0, "evicted": 0}
+
+    def limit(self):
+        return perf_limit(self.store.perf_mode, "bfcache_pages")
+
+    def push(self, stack, page):
+        # Records a page the tab just left on one of its stacks.
+        entry = {"page": None, "url": page.url()}
+        if self.limit() > 0:
+            entry["page"] = page
+            self._held[id(entry)] = entry
+            self.stats["stored"] += 1
+            self.trim()
+        else:
+            page.deleteLater()
+        stack.append(entry)
+        if len(stack) > BFCACHE_HISTORY:
+            self.release(stack.pop(0))
+        return entry
+
+    def restore(self, entry):
+        # Returns the live page and hands it back to the tab, or None.
+        self._held.pop(id(entry), None)
+        page, entry["page"] = entry["page"], None
+        self.stats["hits" if page is not None else "misses"] += 1
+        return page
+
+    def release(self, entry):
+        self._held.pop(id(entry), None)
+        page, entry["page"] = entry["page"], None
+        if page is not None:
+            page.deleteLater()
+
+    def trim(self):
+        limit = max(0, self.limit())
+        while len(self._held) > limit:
+            _key, entry = self._held.popitem(last=False)
+            page, entry["page"] = entry["page"], None
+            page.deleteLater()
+            self.stats["evicted"] += 1
+
+    def summary(self):
+        st = self.stats
+        lines = [f"{len(self._held)} of {self.limit()} pages held · {st['stored']} stored"
+                 f" · {st['evicted']} evicted"]
+        total = st["hits"] + st["misses"]
+        if total:
+            lines.append(f"{st['hits']}/{total} back/forward served from cache"
+                         f" ({100.0 * st['hits'] / total:.0f}% hit) · {st['misses']} reloaded")
+        return lines
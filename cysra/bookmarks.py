@@ -0,0 +1,95 @@
+import html
+import time
+from html.parser import HTMLParser
+
+
+def export_netscape(favorites):
+    now = str(int(time.time()))
+    tree = {"links": [], "folders": {}}
+    for fav in favorites:
+        node = tree
+        for part in [x for x in (fav.get("folder") or "").split("/") if x]:
+            node = node["folders"].setdefault(part, {"links": [], "folders": {}})
+        node["links"].append(fav)
+
+    def link(fav, indent):
+        tags = fav.get("tags") or []
+        attrs = ' HREF="' + html.escape(fav.get("url", "")) + '" ADD_DATE="' + now + '"'
+        if tags:
+            attrs += ' TAGS="' + html.escape(",".join(tags)) + '"'
+        return indent + "<DT><A" + attrs + ">" + html.escape(fav.get("title") or fav.get("url", "")) + "</A>"
+
+    def emit(node, depth, out):
+        indent = "    " * depth
+        for fav in node["links"]:
+            out.append(link(fav, indent))
+        for name in sorted(node["folders"]):
+            out.append(indent + '<DT><H3 ADD_DATE="' + now + '">' + html.escape(name) + "</H3>")
+            out.append(indent + "<DL><p>")
+            emit(node["folders"][name], depth + 1, out)
+            out.append(indent + "</DL><p>")
+
+    lines = [
+        "<!DOCTYPE NETSCAPE-Bookmark-file-1>",
+        '<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">',
+        "<TITLE>Bookmarks</TITLE>",
+        "<H1>Bookmarks</H1>",
+        "<DL><p>",
+    ]
+    emit(tree, 1, lines)
+    lines.append("</DL><p>")
+    return "\n".join(lines) + "\n"
+
+
+class _NetscapeParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.entries = []
+        self._folders = []
+        self._pending_folder = None
+        self._in_h3 = False
+        self._link = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "h3":
+            self._in_h3 = True
+            self._pending_folder = ""
+        elif tag == "dl":
+            name = self._pending_folder
+            self._pending_folder = None
+            self._folders.append(name.strip() if name else None)
+        elif tag == "a" and attrs.get("href"):
+            tags = [t.strip() for t in (attrs.get("tags") or "").split(",") if t.strip()]
+            self._link = {"url": attrs["href"], "title": "", "tags": tags}
+
+    def handle_endtag(self, tag):
+        if tag == "h3":
+            self._in_h3 = False
+        elif tag == "dl":
+            if self._folders:
+                self._folders.pop()
+        elif tag == "a" and self._link is not None:
+            link = self._link
+            self._link = None
+            if link["url"].startswith(("http://", "https://", "file://")):
+                folder = "/".join(f for f in self._folders if f)
+                entry = {"url": link["url"], "title": link["title"].strip() or link["url"]}
+                if folder:
+                    entry["folder"] = folder
+                if link["tags"]:
+                    entry["tags"] = link["tags"]
+                self.entries.append(entry)
+
+    def handle_data(self, data):
+        if self._in_h3 and self._pending_folder is not None:
+            self._pending_folder += data
+        elif self._link is not None:
+            self._link["title"] += data
+
+
+def parse_netscape(text):
+    parser = _NetscapeParser()
+    parser.feed(text or "")
+    parser.close()
+    return parser.entries
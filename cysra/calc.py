@@ -0,0 +1,138 @@
+import ast
+import math
+import operator
+import re
+import time
+from functools import lru_cache
+
+MAX_BITS = 4096
+MAX_DIGITS = 1234
+TIME_LIMIT = 0.05
+CACHE_SIZE = 256
+
+_MATHY = re.compile(r"^[\d\s.+\-*/%(),a-z_]*$")
+_HAS_OP = re.compile(r"\d\s*[-+*/%]|[a-z_]+\s*\(|\*\*")
+
+CONSTANTS = {"pi": math.pi, "e": math.e}
+
+
+class CalcError(Exception):
+    pass
+
+
+def _check_size(value):
+    if isinstance(value, int) and not isinstance(value, bool) and value.bit_length() > MAX_BITS:
+        raise CalcError("result too large")
+    return value
+
+
+def _number(value):
+    # Tuples only exist as argument lists; arithmetic on them (repetition in
+    # particular) could build arbitrarily large objects.
+    if not isinstance(value, (int, float)):
+        raise CalcError("numbers only")
+    return value
+
+
+def _pow(a, b, mod=None):
+    if mod is not None:
+        return pow(a, b, mod)
+    if isinstance(a, int) and isinstance(b, int) and b > 0 and abs(a) > 1:
+        if b * math.log2(abs(a)) > MAX_BITS:
+            raise CalcError("result too large")
+    return pow(a, b)
+
+
+def _mul(a, b):
+    if isinstance(a, int) and isinstance(b, int) and a.bit_length() + b.bit_length() > MAX_BITS:
+        raise CalcError("result too large")
+    return a * b
+
+
+def _round(x, ndigits=None):
+    # round() builds 10 ** -ndigits; a huge ndigits would run for minutes
+    # before any deadline check could see it.
+    if ndigits is None:
+        return round(_number(x))
+    if not isinstance(ndigits, int) or abs(ndigits) > MAX_DIGITS:
+        raise CalcError("ndigits out of range")
+    return round(_number(x), ndigits)
+
+
+FUNCTIONS = {
+    "abs": abs, "round": _round, "min": min, "max": max, "sum": sum,
+    "pow": _pow, "int": int, "float": float, "len": len, "sqrt": math.sqrt,
+}
+
+BIN_OPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: _mul,
+    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod, ast.Pow: _pow,
+}
+
+UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+
+def _build(node):
+    # Turns the whitelisted AST into nested closures; anything else is rejected
+    # here, before evaluation ever starts.
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        value = _check_size(node.value)
+        return lambda deadline: value
+    if isinstance(node, ast.Name):
+        if node.id not in CONSTANTS:
+            raise CalcError("name '" + node.id + "' not allowed")
+        value = CONSTANTS[node.id]
+        return lambda deadline: value
+    if isinstance(node, ast.BinOp) and type(node.op) in BIN_OPS:
+        fn, left, right = BIN_OPS[type(node.op)], _build(node.left), _build(node.right)
+
+        def binop(deadline):
+            a, b = _number(left(deadline)), _number(right(deadline))
+            if time.perf_counter() > deadline:
+                raise CalcError("took too long")
+            return _check_size(fn(a, b))
+        return binop
+    if isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPS:
+        fn, operand = UNARY_OPS[type(node.op)], _build(node.operand)
+        return lambda deadline: fn(_number(operand(deadline)))
+    if isinstance(node, (ast.Tuple, ast.List)):
+        items = [_build(elt) for elt in node.elts]
+        return lambda deadline: tuple(item(deadline) for item in items)
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+            name = getattr(node.func, "id", "call")
+            raise CalcError("name '" + name + "' not allowed")
+        if node.keywords:
+            raise CalcError("keyword arguments not allowed")
+        fn, args = FUNCTIONS[node.func.id], [_build(arg) for arg in node.args]
+
+        def call(deadline):
+            values = [arg(deadline) for arg in args]
+            if time.perf_counter() > deadline:
+                raise CalcError("took too long")
+            return _check_size(fn(*values))
+        return call
+    raise CalcError(type(node).__name__ + " not allowed")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expr(expr):
+    try:
+        tree = ast.parse(expr.strip(), mode="eval")
+    except SyntaxError as exc:
+        raise CalcError("invalid syntax") from exc
+    return _build(tree.body)
+
+
+def looks_like_math(text):
+    text = (text or "").strip().lower()
+    return bool(text) and len(text) <= 200 and bool(_MATHY.match(text)) and bool(_HAS_OP.search(text))
+
+
+def safe_eval(expr, time_limit=TIME_LIMIT):
+    try:
+        fn = compile_expr(expr)
+        return _number(fn(time.perf_counter() + time_limit))
+    except Exception as exc:
+        return "Error: " + str(exc)
@@ -0,0 +1,78 @@
+import os
+import sys
+
+from .lazy import lazy
+
+
+def _load_psutil():
+    import psutil
+    return psutil
+
+
+_CLK_TCK = None
+
+# Windows: OpenProcess access right and FILETIME resolution (100 ns).
+_QUERY_LIMITED_INFORMATION = 0x1000
+_FILETIME_SECS = 1e-7
+
+
+def _windows_cpu_seconds(pid):
+    import ctypes
+    from ctypes import wintypes
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.OpenProcess(_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+    try:
+        times = [wintypes.FILETIME() for _ in range(4)]
+        if not kernel32.GetProcessTimes(handle, *[ctypes.byref(t) for t in times]):
+            return None
+        kernel, user = times[2], times[3]
+        total = sum((t.dwHighDateTime << 32) | t.dwLowDateTime for t in (kernel, user))
+        return total * _FILETIME_SECS
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def process_cpu_seconds(pid):
+    global _CLK_TCK
+    if not pid:
+        return None
+    if sys.platform.startswith("linux"):
+        try:
+            with open(f"/proc/{pid}/stat", encoding="ascii") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            if _CLK_TCK is None:
+                _CLK_TCK = os.sysconf("SC_CLK_TCK")
+            return (int(fields[11]) + int(fields[12])) / _CLK_TCK
+        except (OSError, ValueError, IndexError):
+            return None
+    if sys.platform == "win32":
+        try:
+            return _windows_cpu_seconds(pid)
+        except (OSError, AttributeError):
+            return None
+    # Elsewhere (macOS) per-process times need the optional psutil.
+    psutil = lazy("psutil", _load_psutil)
+    if psutil is None:
+        return None
+    try:
+        t = psutil.Process(pid).cpu_times()
+        return t.user + t.system
+    except Exception:
+        return None
+
+
+class CpuSampler:
+    def __init__(self):
+        self._last = {}
+
+    def sample(self, pid, now):
+        secs = process_cpu_seconds(pid)
+        if secs is None:
+            return None, None
+        prev = self._last.get(pid)
+        self._last[pid] = (now, secs)
+        if prev is None or now <= prev[0]:
+            return secs, None
+        return secs, 100.0 * (secs - prev[1]) / (now - prev[0])
@@ -0,0 +1,194 @@
+import base64
+import hashlib
+import os
+import sys
+import time
+
+from .lazy import lazy
+
+
+def _load_dpapi():
+    import ctypes
+    from ctypes import wintypes
+
+    class DATA_BLOB(ctypes.Structure):
+        _fields_ = [("cbData", wintypes.DWORD), ("pbData", ctypes.POINTER(ctypes.c_byte))]
+
+    return ctypes, DATA_BLOB
+
+
+def sha256(text):
+    return hashlib.sha256((text or "").encode("utf-8"))
+
+
+def entropy_from_master(master_pwd):
+    return sha256(master_pwd).digest()
+
+
+KDF_DEFAULTS = {
+    "scrypt": {"n": 2 ** 15, "r": 8, "p": 1},
+    "pbkdf2": {"iterations": 600000},
+}
+
+
+def new_kdf(algo="scrypt", cost=None):
+    if algo not in KDF_DEFAULTS:
+        raise ValueError("unknown KDF " + str(algo))
+    params = dict(KDF_DEFAULTS[algo])
+    params.update({k: int(v) for k, v in (cost or {}).items() if k in params})
+    params["algo"] = algo
+    params["salt"] = base64.b64encode(os.urandom(16)).decode("utf-8")
+    return params
+
+
+def derive_master(master_pwd, kdf):
+    pwd = (master_pwd or "").encode("utf-8")
+    salt = base64.b64decode(kdf["salt"].encode("utf-8"))
+    if kdf["algo"] == "pbkdf2":
+        return hashlib.pbkdf2_hmac("sha256", pwd, salt, int(kdf["iterations"]), dklen=64)
+    n, r, p_ = int(kdf["n"]), int(kdf["r"]), int(kdf["p"])
+    return hashlib.scrypt(pwd, salt=salt, n=n, r=r, p=p_,
+                          maxmem=256 * n * r * p_ + 32 * 1024 * 1024, dklen=64)
+
+
+def split_master(raw):
+    # First half only ever proves the password; second half keys the vault.
+    return hashlib.sha256(raw[:32]).hexdigest(), raw[32:]
+
+
+def calibrate_kdf(algo="scrypt", target_ms=250.0):
+    samples = []
+    if algo == "pbkdf2":
+        probe = {"algo": "pbkdf2", "salt": "AAAAAAAAAAAAAAAAAAAAAA==", "iterations": 50000}
+        t0 = time.perf_counter()
+        derive_master("calibrate", probe)
+        ms = (time.perf_counter() - t0) * 1000.0
+        samples.append({"iterations": probe["iterations"], "ms": round(ms, 1)})
+        iterations = int(probe["iterations"] * target_ms / max(ms, 0.001)) // 10000 * 10000
+        return {"algo": "pbkdf2", "iterations": max(100000, iterations)}, samples
+    best = 2 ** 14
+    for log_n in range(14, 21):
+        probe = {"algo": "scrypt", "salt": "AAAAAAAAAAAAAAAAAAAAAA==", "n": 2 ** log_n, "r": 8, "p": 1}
+        t0 = time.perf_counter()
+        derive_master("calibrate", probe)
+        ms = (time.perf_counter() - t0) * 1000.0
+        samples.append({"n": probe["n"], "ms": round(ms, 1)})
+        if ms > target_ms:
+            break
+        best = probe["n"]
+    return {"algo": "scrypt", "n": best, "r": 8, "p": 1}, samples
+
+
+def _dpapi_blob(ctypes, DATA_BLOB, b):
+    buf = (ctypes.c_byte * len(b)).from_buffer_copy(b)
+    return DATA_BLOB(len(b), ctypes.cast(buf, ctypes.POINTER(ctypes.c_byte)))
+
+
+def dpapi_protect(plaintext_bytes, entropy):
+    if plaintext_bytes is None:
+        plaintext_bytes = b""
+    ctypes, DATA_BLOB = lazy("dpapi", _load_dpapi)
+
+    in_blob = _dpapi_blob(ctypes, DATA_BLOB, plaintext_bytes)
+    ent_blob = _dpapi_blob(ctypes, DATA_BLOB, entropy or b"")
+    out_blob = DATA_BLOB()
+
+    if not ctypes.windll.crypt32.CryptProtectData(ctypes.byref(in_blob), None, ctypes.byref(ent_blob), None, None, 0, ctypes.byref(out_blob)):
+        raise RuntimeError("CryptProtectData failed")
+    try:
+        out = ctypes.string_at(out_blob.pbData, out_blob.cbData)
+        return out
+    finally:
+        ctypes.windll.kernel32.LocalFree(out_blob.pbData)
+
+
+def dpapi_unprotect(cipher_bytes, entropy):
+    if cipher_bytes is None:
+        return b""
+    ctypes, DATA_BLOB = lazy("dpapi", _load_dpapi)
+
+    in_blob = _dpapi_blob(ctypes, DATA_BLOB, cipher_bytes)
+    ent_blob = _dpapi_blob(ctypes, DATA_BLOB, entropy or b"")
+    out_blob = DATA_BLOB()
+
+    if not ctypes.windll.crypt32.CryptUnprotectData(ctypes.byref(in_blob), None, ctypes.byref(ent_blob), None, None, 0, ctypes.byref(out_blob)):
+        raise RuntimeError("CryptUnprotectData failed")
+    try:
+        out = ctypes.string_at(out_blob.pbData, out_blob.cbData)
+        return out
+    finally:
+        ctypes.windll.kernel32.LocalFree(out_blob.pbData)
+
+
+def _load_aesgcm():
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    return AESGCM
+
+
+class SecretBackend:
+    name = ""
+
+    def available(self):
+        return False
+
+    def derive_key(self, master_key):
+        return hashlib.sha256(self.name.encode("utf-8") + b":" + master_key).digest()
+
+    def legacy_key(self, master_pwd, salt):
+        raise NotImplementedError
+
+    def protect(self, plaintext, key):
+        raise NotImplementedError
+
+    def unprotect(self, ciphertext, key):
+        raise NotImplementedError
+
+
+class DpapiBackend(SecretBackend):
+    name = "dpapi"
+
+    def available(self):
+        return sys.platform == "win32"
+
+    def legacy_key(self, master_pwd, salt):
+        return entropy_from_master(master_pwd)
+
+    def protect(self, plaintext, key):
+        return dpapi_protect(plaintext, key)
+
+    def unprotect(self, ciphertext, key):
+        return dpapi_unprotect(ciphertext, key)
+
+
+class AesGcmBackend(SecretBackend):
+    name = "aesgcm"
+
+    def available(self):
+        return lazy("aesgcm", _load_aesgcm) is not None
+
+    def legacy_key(self, master_pwd, salt):
+        return hashlib.scrypt(
+            (master_pwd or "").encode("utf-8"), salt=salt,
+            n=2 ** 14, r=8, p=1, maxmem=64 * 1024 * 1024, dklen=32,
+        )
+
+    def protect(self, plaintext, key):
+        nonce = os.urandom(12)
+        return nonce + lazy("aesgcm", _load_aesgcm)(key).encrypt(nonce, plaintext or b"", None)
+
+    def unprotect(self, ciphertext, key):
+        return lazy("aesgcm", _load_aesgcm)(key).decrypt(ciphertext[:12], ciphertext[12:], None)
+
+
+BACKENDS = {b.name: b for b in (DpapiBackend(), AesGcmBackend())}
+
+
+def get_backend(name):
+    return BACKENDS.get(name)
+
+
+def default_backend():
+    for backend in BACKENDS.values():
+        if backend.available():
+            return backend
+    return None
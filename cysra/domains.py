@@ -0,0 +1,63 @@
+from urllib.parse import urlsplit
+
+# Common multi-label public suffixes. Without a full public suffix list this
+# keeps "shop.example.co.uk" and "mail.example.co.uk" under the same site.
+MULTI_SUFFIXES = frozenset((
+    "co.uk", "org.uk", "ac.uk", "gov.uk", "me.uk", "net.uk", "ltd.uk", "plc.uk",
+    "com.au", "net.au", "org.au", "edu.au", "gov.au",
+    "co.nz", "org.nz", "net.nz", "govt.nz",
+    "co.jp", "ne.jp", "or.jp", "ac.jp", "go.jp",
+    "co.kr", "or.kr", "ne.kr",
+    "com.tr", "net.tr", "org.tr", "edu.tr", "gov.tr", "gen.tr", "web.tr",
+    "com.br", "net.br", "org.br", "gov.br",
+    "com.cn", "net.cn", "org.cn", "gov.cn",
+    "com.tw", "org.tw", "com.hk", "org.hk", "com.sg", "edu.sg",
+    "co.in", "net.in", "org.in", "gov.in", "ac.in",
+    "com.mx", "org.mx", "com.ar", "com.co", "co.za", "org.za",
+    "com.ua", "com.pl", "com.ru", "co.il", "co.id", "com.my", "com.ph",
+    "github.io", "gitlab.io", "herokuapp.com", "appspot.com", "blogspot.com",
+    "netlify.app", "vercel.app", "pages.dev", "workers.dev",
+))
+
+
+def host_of(url):
+    if not url:
+        return ""
+    text = url.strip()
+    if "://" not in text:
+        text = "//" + text
+    try:
+        host = urlsplit(text).hostname or ""
+    except ValueError:
+        return ""
+    return host.rstrip(".").lower()
+
+
+def registrable_domain(url):
+    host = host_of(url)
+    if not host or host.replace(".", "").isdigit() or ":" in host:
+        return host
+    labels = host.split(".")
+    if len(labels) <= 2:
+        return host
+    if ".".join(labels[-2:]) in MULTI_SUFFIXES:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+def site_origin(site):
+    # Saved sites may omit the scheme; those are taken as https.
+    text = (site or "").strip()
+    if "://" not in text:
+        text = "https://" + text
+    try:
+        parts = urlsplit(text)
+        host, port = parts.hostname, parts.port
+    except ValueError:
+        return ""
+    if not host:
+        return ""
+    scheme = parts.scheme.lower()
+    if port == {"http": 80, "https": 443}.get(scheme):
+        port = None
+    return scheme + "://" + host.rstrip(".").lower() + (":" + str(port) if port else "")
@@ -0,0 +1,110 @@
+import os
+import json
+import base64
+import hashlib
+import threading
+
+from PyQt5.QtCore import QBuffer, QIODevice
+
+from .domains import host_of
+from .fileio import atomic_write
+from .paths import FAVICON_DIR
+from .workers import submit
+
+FAVICON_SIZE = 32
+
+
+def icon_png(icon, size=FAVICON_SIZE):
+    # QPixmap work has to stay on the GUI thread; only bytes leave it.
+    if icon is None or icon.isNull():
+        return None
+    pix = icon.pixmap(size, size)
+    if pix.isNull():
+        return None
+    buf = QBuffer()
+    buf.open(QIODevice.WriteOnly)
+    pix.save(buf, "PNG")
+    return bytes(buf.data())
+
+
+class FaviconStore:
+    # Icons are stored once per content hash and mapped from hosts, so the
+    # dozens of pages of one site (or sites sharing a CDN icon) cost one file.
+    def __init__(self, root=None):
+        self._root = root or FAVICON_DIR
+        self._index_path = os.path.join(self._root, "index.json")
+        self._lock = threading.Lock()
+        self._uris = {}
+        try:
+            with open(self._index_path, encoding="utf-8") as f:
+                self._index = json.load(f)
+        except Exception:
+            self._index = {}
+
+    def _path(self, digest):
+        return os.path.join(self._root, digest + ".png")
+
+    def capture(self, url, icon):
+        host = host_of(url)
+        if not host or not url.startswith(("http://", "https://")):
+            return
+        data = icon_png(icon)
+        if data:
+            submit(self.put, host, data)
+
+    def put(self, host, data):
+        digest = hashlib.sha256(data).hexdigest()[:32]
+        with self._lock:
+            if self._index.get(host) == digest:
+                return False
+            path = self._path(digest)
+            if not os.path.exists(path):
+                atomic_write(path, data)
+            self._index[host] = digest
+            self._uris.pop(host, None)
+            atomic_write(self._index_path, json.dumps(self._index, indent=2, sort_keys=True))
+        return True
+
+    def data_uri(self, url):
+        host = host_of(url)
+        with self._lock:
+            if host in self._uris:
+                return self._uris[host]
+            digest = self._index.get(host)
+        uri = None
+        if digest:
+            try:
+                with open(self._path(digest), "rb") as f:
+                    uri = "data:image/png;base64," + base64.b64encode(f.read()).decode("ascii")
+            except OSError:
+                uri = None
+        with self._lock:
+            self._uris[host] = uri
+        return uri
+
+    def uris_for(self, urls):
+        icons = {}
+        for url in urls:
+            uri = self.data_uri(url)
+            if uri:
+                icons[url] = uri
+        return icons
+
+    def prune(self):
+        # Drops files no host points at any more. Held under the lock so a
+        # concurrent put cannot write a file between the check and the remove.
+        removed = 0
+        with self._lock:
+            live = set(self._index.values())
+            try:
+                names = os.listdir(self._root)
+            except OSError:
+                return 0
+            for name in names:
+                if name.endswith(".png") and name[:-4] not in live:
+                    try:
+                        os.remove(os.path.join(self._root, name))
+                        removed += 1
+                    except OSError:
+                        pass
+        return removed
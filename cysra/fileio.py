@@ -0,0 +1,23 @@
+import os
+import tempfile
+
+
+def atomic_write(path, data):
+    # Write to a sibling temp file and rename over the target, so readers
+    # never see a half-written file even if the app dies mid-save.
+    folder = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+    binary = isinstance(data, (bytes, bytearray))
+    fd, tmp = tempfile.mkstemp(prefix=".tmp-", dir=folder)
+    try:
+        with os.fdopen(fd, "wb" if binary else "w", **({} if binary else {"encoding": "utf-8"})) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,42 @@
+SKIP_PATTERNS = ("cysra_home.html", "cysra://", "about:blank", "about:", "view-source:")
+HISTORY_LIMIT = 2000
+
+
+def is_recordable(url):
+    if not url:
+        return False
+    for pat in SKIP_PATTERNS:
+        if pat in url:
+            return False
+    return True
+
+
+def most_visited(history, limit=3):
+    counts = {}
+    first = {}
+    for entry in history:
+        url = entry.get("url", "")
+        if url:
+            counts[url] = counts.get(url, 0) + 1
+            if url not in first:
+                first[url] = entry
+    top = sorted(counts, key=counts.get, reverse=True)[:limit]
+    return [
+        {"url": url, "title": first[url].get("title", url), "count": counts[url]}
+        for url in top
+    ]
+
+
+def entry_matches(entry, needle):
+    if not needle:
+        return True
+    return (
+        needle in (entry.get("url") or "").lower()
+        or needle in (entry.get("title") or "").lower()
+        or needle in (entry.get("ts") or "").lower()
+    )
+
+
+def filter_history(entries, text):
+    needle = (text or "").lower()
+    return [e for e in entries if entry_matches(e, needle)]
@@ -0,0 +1,123 @@
+import os
+import json
+
+from PyQt5.QtWebEngineCore import (
+    QWebEngineUrlRequestJob, QWebEngineUrlScheme, QWebEngineUrlSchemeHandler
+)
+from PyQt5.QtCore import QBuffer, QIODevice, QUrl
+
+from .history import most_visited
+from .paths import HOME_HTML, ROOT_DIR
+from .theme import current_theme
+
+HOME_SCHEME = b"cysra"
+HOME_URL = "cysra://home"
+
+# Files the home page references relatively, served next to it.
+HOME_ASSETS = {"/icon.png": ("icon.png", b"image/png")}
+
+_template = {"mtime": None, "html": ""}
+_assets = {}
+
+
+def register_scheme():
+    # Must run before the QApplication exists.
+    scheme = QWebEngineUrlScheme(HOME_SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    scheme.setFlags(QWebEngineUrlScheme.SecureScheme)
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+def scheme_registered():
+    return bool(QWebEngineUrlScheme.schemeByName(HOME_SCHEME).name())
+
+
+def is_home_url(url):
+    # Exact match only: any web page can put "cysra_home.html" in its URL,
+    # and the home page is handed favorites and history.
+    qurl = QUrl(url)
+    if qurl.scheme() == HOME_SCHEME.decode("ascii"):
+        return qurl.host() == "home" and qurl.path() in ("", "/")
+    if not qurl.isLocalFile():
+        return False
+    path = os.path.normcase(os.path.abspath(qurl.toLocalFile()))
+    return path == os.path.normcase(os.path.abspath(HOME_HTML))
+
+
+def home_data(store, favicons, predictor=None, secret=False, tab_bytes=0):
+    mv = most_visited(store.history)
+    icon_urls = [f.get("url", "") for f in store.favorites] + [m["url"] for m in mv]
+    return {
+        "favorites":    store.favorites,
+        "most_visited": mv,
+        "favicons":     favicons.uris_for(icon_urls),
+        "theme":        current_theme(),
+        "preconnect":   [] if secret or predictor is None else predictor.predict(resolve=False),
+        "data_saver":   {
+            "enabled":     store.data_saver,
+            "tab_bytes":   tab_bytes,
+            "total_bytes": store.data_saved_bytes,
+        },
+    }
+
+
+def render_home(data):
+    # The template is re-read only when the file changes on disk.
+    try:
+        mtime = os.path.getmtime(HOME_HTML)
+    except OSError:
+        mtime = None
+    if mtime != _template["mtime"]:
+        try:
+            with open(HOME_HTML, encoding="utf-8") as f:
+                _template["html"] = f.read()
+        except OSError:
+            _template["html"] = "<!DOCTYPE html><html><head></head><body></body></html>"
+        _template["mtime"] = mtime
+    # Titles come from web pages; nothing in the payload may look like markup
+    # or a line terminator to the HTML parser around the inline script.
+    payload = json.dumps(data)
+    for ch, esc in (("<", "\\u003c"), (">", "\\u003e"), ("&", "\\u0026"),
+                    ("\u2028", "\\u2028"), ("\u2029", "\\u2029")):
+        payload = payload.replace(ch, esc)
+    script = "<script>window._CYSRA=" + payload + ";</script>"
+    return _template["html"].replace("</head>", script + "</head>", 1).encode("utf-8")
+
+
+def _asset(path):
+    if path not in _assets:
+        try:
+            with open(os.path.join(ROOT_DIR, HOME_ASSETS[path][0]), "rb") as f:
+                _assets[path] = f.read()
+        except OSError:
+            _assets[path] = None
+    return _assets[path]
+
+
+class HomeSchemeHandler(QWebEngineUrlSchemeHandler):
+    # Serves cysra://home from memory with its data already embedded, so
+    # the first paint is complete and no runJavaScript push is needed.
+    def __init__(self, data_fn, parent=None):
+        super().__init__(parent)
+        self._data_fn = data_fn
+
+    def requestStarted(self, job):
+        url = job.requestUrl()
+        path = url.path() or "/"
+        if url.host() != "home":
+            job.fail(QWebEngineUrlRequestJob.UrlNotFound)
+            return
+        if path == "/":
+            body, mime = render_home(self._data_fn()), b"text/html"
+        elif path in HOME_ASSETS:
+            body, mime = _asset(path), HOME_ASSETS[path][1]
+            if body is None:
+                job.fail(QWebEngineUrlRequestJob.UrlNotFound)
+                return
+        else:
+            job.fail(QWebEngineUrlRequestJob.UrlNotFound)
+            return
+        buf = QBuffer(job)
+        buf.setData(body)
+        buf.open(QIODevice.ReadOnly)
+        job.reply(mime, buf)
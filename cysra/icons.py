@@ -0,0 +1,70 @@
+import os
+from PyQt5.QtCore import Qt, QSize, QRect
+from PyQt5.QtGui import QColor, QFont, QPainter, QPainterPath, QPixmap, QIcon
+
+from .lazy import lazy
+
+
+def _load_svg_renderer():
+    from PyQt5.QtSvg import QSvgRenderer
+    return QSvgRenderer
+
+
+_ICON_CACHE = {}
+
+
+def get_svg_icon(path, color):
+    cache_key = (path, color)
+    if cache_key in _ICON_CACHE:
+        return _ICON_CACHE[cache_key]
+
+    if not os.path.exists(path):
+        return QIcon()
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            svg_data = f.read()
+
+        if 'fill="currentColor"' in svg_data:
+            svg_data = svg_data.replace('fill="currentColor"', f'fill="{color}"')
+        if 'stroke="currentColor"' in svg_data:
+            svg_data = svg_data.replace('stroke="currentColor"', f'stroke="{color}"')
+        if 'fill="currentColor"' not in svg_data and 'stroke="currentColor"' not in svg_data:
+            if "fill=" not in svg_data:
+                svg_data = svg_data.replace("<svg", f'<svg fill="{color}"')
+            if "stroke=" not in svg_data:
+                svg_data = svg_data.replace("<svg", f'<svg stroke="{color}"')
+
+        QSvgRenderer = lazy("svg", _load_svg_renderer)
+        if QSvgRenderer is None:
+            return QIcon()
+        pm = QPixmap(QSize(64, 64))
+        pm.fill(Qt.transparent)
+        painter = QPainter(pm)
+        painter.setRenderHint(QPainter.Antialiasing)
+        renderer = QSvgRenderer(svg_data.encode("utf-8"))
+        renderer.render(painter)
+        painter.end()
+
+        icon = QIcon(pm)
+        _ICON_CACHE[cache_key] = icon
+        return icon
+    except Exception:
+        return QIcon()
+
+
+def make_letter_pixmap(letter, color_hex, size=34):
+    pm = QPixmap(size, size)
+    pm.fill(Qt.transparent)
+    painter = QPainter(pm)
+    painter.setRenderHint(QPainter.Antialiasing)
+    path = QPainterPath()
+    path.addEllipse(0, 0, size, size)
+    painter.fillPath(path, QColor(color_hex))
+    painter.setPen(QColor("#ffffff"))
+    font = QFont("-apple-system", int(size * 0.38))
+    font.setWeight(QFont.Bold)
+    painter.setFont(font)
+    painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, letter.upper())
+    painter.end()
+    return pm
@@ -0,0 +1,41 @@
+from PyQt5.QtWebEngineWidgets import QWebEngineScript
+
+from .scripts import CLICK_PATCH_JS, SECRET_JS
+
+# Privacy shims must run in the page's own world before any page script;
+# optimisers only touch the DOM, so they stay isolated from page globals.
+MAIN = QWebEngineScript.MainWorld
+ISOLATED = QWebEngineScript.ApplicationWorld
+
+CREATION = QWebEngineScript.DocumentCreation
+READY = QWebEngineScript.DocumentReady
+
+
+def make_script(name, source, point, world, subframes=False):
+    script = QWebEngineScript()
+    script.setName(name)
+    script.setSourceCode(source)
+    script.setInjectionPoint(point)
+    script.setWorldId(world)
+    script.setRunsOnSubFrames(subframes)
+    return script
+
+
+def sync_scripts(collection, wanted):
+    # wanted: {name: (source, point, world, subframes)}, or None to drop the
+    # script. Entries whose source is unchanged are left alone.
+    for name, spec in wanted.items():
+        current = collection.findScript(name)
+        if not current.isNull():
+            if spec is not None and current.sourceCode() == spec[0]:
+                continue
+            collection.remove(current)
+        if spec is not None:
+            collection.insert(make_script(name, *spec))
+
+
+def install_profile_scripts(profile, secret=False):
+    wanted = {"cysra-click-patch": (CLICK_PATCH_JS, READY, MAIN, False)}
+    if secret:
+        wanted["cysra-secret"] = (SECRET_JS, CREATION, MAIN, True)
+    sync_scripts(profile.scripts(), wanted)
@@ -0,0 +1,45 @@
+import os
+import json
+
+COMPACT_AFTER = 500
+
+
+class Journal:
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+
+    def append(self, *ops):
+        if not ops:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            for op in ops:
+                f.write(json.dumps(op, ensure_ascii=False) + "\n")
+        self.count += len(ops)
+
+    def read(self):
+        ops = []
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        ops.append(json.loads(line))
+                    except ValueError:
+                        break
+        except OSError:
+            pass
+        self.count = len(ops)
+        return ops
+
+    def clear(self):
+        self.count = 0
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def needs_compaction(self):
+        return self.count >= COMPACT_AFTER
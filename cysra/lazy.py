@@ -0,0 +1,10 @@
+_LAZY = {}
+
+
+def lazy(name, loader):
+    if name not in _LAZY:
+        try:
+            _LAZY[name] = loader()
+        except ImportError:
+            _LAZY[name] = None
+    return _LAZY[name]
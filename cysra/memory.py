@@ -0,0 +1,34 @@
+import gc
+from PyQt5.QtWebEngineWidgets import QWebEngineProfile
+from PyQt5.QtCore import QTimer, QObject
+
+from .storage import cache_budget
+
+
+class MemoryManager(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.optimize)
+        self.timer.start(60000)
+
+    def optimize(self):
+        gc.collect()
+
+    def apply_perf_mode(self, mode):
+        try:
+            profile = QWebEngineProfile.defaultProfile()
+            if mode == "lowest":
+                profile.setHttpCacheType(QWebEngineProfile.MemoryHttpCache)
+                profile.setHttpCacheMaximumSize(10 * 1024 * 1024)
+            elif mode == "low":
+                profile.setHttpCacheType(QWebEngineProfile.MemoryHttpCache)
+                profile.setHttpCacheMaximumSize(30 * 1024 * 1024)
+            elif mode == "medium":
+                profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+                profile.setHttpCacheMaximumSize(cache_budget(profile.cachePath(), 100 * 1024 * 1024))
+            elif mode == "high":
+                profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+                profile.setHttpCacheMaximumSize(cache_budget(profile.cachePath(), 250 * 1024 * 1024))
+        except Exception:
+            pass
@@ -0,0 +1,75 @@
+import threading
+from PyQt5.QtWebEngineCore import QWebEngineUrlRequestInfo, QWebEngineUrlRequestInterceptor
+
+
+class DNTInterceptor(QWebEngineUrlRequestInterceptor):
+    def interceptRequest(self, info):
+        info.setHttpHeader(b"DNT", b"1")
+
+
+# Rough average transfer sizes; blocked requests never report a real size,
+# so every saved figure built from these is an estimate.
+SAVED_ESTIMATE = {
+    "image": 45 * 1024,
+    "font":  35 * 1024,
+    "media": 600 * 1024,
+}
+
+# Images larger than this (in CSS pixels) wait for a click instead of
+# loading when they scroll into view.
+SAVER_MAX_PIXELS = 640 * 480
+
+# Elements checked for CSS background images per page, in idle time.
+SAVER_MAX_BG_SCAN = 5000
+
+_SAVER_TYPES = {
+    QWebEngineUrlRequestInfo.ResourceTypeImage:        "image",
+    QWebEngineUrlRequestInfo.ResourceTypeFontResource: "font",
+    QWebEngineUrlRequestInfo.ResourceTypeMedia:        "media",
+}
+
+
+class DataSaverInterceptor(QWebEngineUrlRequestInterceptor):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._allowed = set()
+        self._held = {}
+        self.saved_bytes = 0
+        self.pending_bytes = 0
+        self.blocked = {"image": 0, "font": 0, "media": 0}
+
+    def allow(self, urls):
+        # A released request loads after all, so it no longer counts as saved.
+        with self._lock:
+            for url in urls:
+                self._allowed.add(url)
+                self._held.pop(url, None)
+
+    def take_pending(self):
+        with self._lock:
+            n, self.pending_bytes = self.pending_bytes, 0
+        return n
+
+    def reset_page(self):
+        # Whatever is still blocked when the page is left stayed blocked.
+        with self._lock:
+            n = sum(self._held.values())
+            self.saved_bytes += n
+            self.pending_bytes += n
+            self._held.clear()
+            self._allowed.clear()
+
+    def interceptRequest(self, info):
+        kind = _SAVER_TYPES.get(info.resourceType())
+        if kind is None:
+            return
+        url = info.requestUrl()
+        if url.scheme() not in ("http", "https"):
+            return
+        with self._lock:
+            if kind != "font" and url.toString() in self._allowed:
+                return
+            self.blocked[kind] += 1
+            self._held[url.toString()] = SAVED_ESTIMATE[kind]
+        info.block(True)
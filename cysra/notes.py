@@ -0,0 +1,188 @@
+import os
+import re
+import json
+import time
+import uuid
+import threading
+
+from .fileio import atomic_write
+from .paths import NOTES_DIR, NOTES_FILE
+
+LARGE_NOTE = 256 * 1024
+SNIPPET = 60
+
+_WORD = re.compile(r"\w+")
+
+
+def _title_from(text):
+    for line in text.splitlines():
+        line = line.strip()
+        if line:
+            return line[:60]
+    return "Untitled"
+
+
+def _terms(text):
+    return frozenset(_WORD.findall(text.lower()))
+
+
+class NotesStore:
+    def __init__(self, root=None, legacy=None):
+        self._root = root or NOTES_DIR
+        self._legacy = NOTES_FILE if legacy is None else legacy
+        self._index_path = os.path.join(self._root, "index.json")
+        self._lock = threading.Lock()
+        self._versions = {}
+        self._index = {}
+        self._terms = None
+        self._load()
+
+    def _path(self, note_id):
+        return os.path.join(self._root, note_id + ".txt")
+
+    def _load(self):
+        try:
+            with open(self._index_path, encoding="utf-8") as f:
+                self._index = json.load(f)
+        except Exception:
+            self._index = self._rebuild()
+        if self._legacy and os.path.exists(self._legacy):
+            # Imported once; the old file is renamed so deleting every note
+            # does not bring it back on the next start.
+            try:
+                with open(self._legacy, encoding="utf-8") as f:
+                    text = f.read()
+                if text.strip():
+                    self.write(self.create(_title_from(text)), text)
+                os.replace(self._legacy, self._legacy + ".migrated")
+            except Exception:
+                pass
+
+    def _rebuild(self):
+        index = {}
+        if not os.path.isdir(self._root):
+            return index
+        for name in os.listdir(self._root):
+            if not name.endswith(".txt"):
+                continue
+            path = os.path.join(self._root, name)
+            try:
+                with open(path, encoding="utf-8", errors="replace") as f:
+                    head = f.read(4096)
+                st = os.stat(path)
+            except OSError:
+                continue
+            index[name[:-4]] = {"title": _title_from(head), "size": st.st_size, "updated": st.st_mtime}
+        return index
+
+    def _save_index(self):
+        atomic_write(self._index_path, json.dumps(self._index, indent=2, ensure_ascii=False))
+
+    def notes(self):
+        with self._lock:
+            items = [dict(meta, id=note_id) for note_id, meta in self._index.items()]
+        return sorted(items, key=lambda n: n.get("updated", 0), reverse=True)
+
+    def meta(self, note_id):
+        with self._lock:
+            meta = self._index.get(note_id)
+            return dict(meta, id=note_id) if meta else None
+
+    def is_large(self, note_id):
+        meta = self.meta(note_id)
+        return bool(meta) and meta.get("size", 0) > LARGE_NOTE
+
+    def create(self, title="Untitled"):
+        note_id = uuid.uuid4().hex[:12]
+        with self._lock:
+            self._index[note_id] = {"title": title, "size": 0, "updated": time.time()}
+            if self._terms is not None:
+                self._terms[note_id] = frozenset()
+            atomic_write(self._path(note_id), "")
+            self._save_index()
+        return note_id
+
+    def read(self, note_id):
+        try:
+            with open(self._path(note_id), encoding="utf-8", errors="replace") as f:
+                return f.read()
+        except OSError:
+            return ""
+
+    def write(self, note_id, text, version=None):
+        # Autosaves run on worker threads and may finish out of order;
+        # a write older than the last one stored for this note is dropped.
+        with self._lock:
+            if note_id not in self._index:
+                return False
+            if version is not None:
+                if version <= self._versions.get(note_id, -1):
+                    return False
+                self._versions[note_id] = version
+            atomic_write(self._path(note_id), text)
+            self._index[note_id] = {
+                "title":   _title_from(text),
+                "size":    len(text.encode("utf-8")),
+                "updated": time.time(),
+            }
+            if self._terms is not None:
+                self._terms[note_id] = _terms(text)
+            self._save_index()
+        return True
+
+    def delete(self, note_id):
+        with self._lock:
+            if self._index.pop(note_id, None) is None:
+                return False
+            self._versions.pop(note_id, None)
+            if self._terms is not None:
+                self._terms.pop(note_id, None)
+            try:
+                os.remove(self._path(note_id))
+            except OSError:
+                pass
+            self._save_index()
+        return True
+
+    def search(self, query):
+        needle = (query or "").strip().lower()
+        if not needle:
+            return self.notes()
+        # Every word of the query is part of some word of a matching note, so
+        # the term index rules notes out without opening them.
+        words = _WORD.findall(needle)
+        terms = self._term_index() if words else None
+        hits = []
+        for note in self.notes():
+            if needle in note.get("title", "").lower():
+                hits.append(dict(note, snippet=""))
+                continue
+            if terms is not None and not self._may_contain(terms.get(note["id"], ()), words):
+                continue
+            snippet = self._scan(note["id"], needle)
+            if snippet is not None:
+                hits.append(dict(note, snippet=snippet))
+        return hits
+
+    def _term_index(self):
+        # Built on the first search and kept current by create/write/delete.
+        with self._lock:
+            if self._terms is None:
+                self._terms = {note_id: _terms(self.read(note_id)) for note_id in self._index}
+            return dict(self._terms)
+
+    @staticmethod
+    def _may_contain(have, words):
+        return all(w in have or any(w in t for t in have) for w in words)
+
+    def _scan(self, note_id, needle):
+        try:
+            with open(self._path(note_id), encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    pos = line.lower().find(needle)
+                    if pos >= 0:
+                        start = max(0, pos - SNIPPET // 2)
+                        return line[start:start + SNIPPET].strip()
+        except OSError:
+            pass
+        return None
@@ -0,0 +1,12 @@
+import os
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ICONS_DIR = os.path.join(ROOT_DIR, "icons")
+HOME_HTML = os.path.join(ROOT_DIR, "cysra_home.html")
+NOTES_FILE = os.path.join(ROOT_DIR, "cysra_notes.txt")
+NOTES_DIR = os.path.join(ROOT_DIR, "cysra_notes")
+FAVICON_DIR = os.path.join(ROOT_DIR, "cysra_favicons")
+DATA_FILE = os.path.join(ROOT_DIR, "cysra_data.json")
+APPS_DIR = os.path.join(ROOT_DIR, "myapps")
+EXTENSIONS_DIR = os.path.join(ROOT_DIR, "extensions")
+TRACE_FILE = os.path.join(ROOT_DIR, "cysra_startup_trace.json")
@@ -0,0 +1,48 @@
+# Resource budgets that scale with the perf mode. Anything that keeps extra
+# pages alive or delays work for background tabs reads its limit from here.
+PERF_LIMITS = {
+    "lowest": {
+        "throttle_delay_ms": 1000,
+        "opt_budget_ms":     2,
+        "prewarm_favorites": 0,
+        "predict_origins":   0,
+        "prerender_pages":   0,
+        "warm_home":         0,
+        "spare_tabs":        0,
+        "bfcache_pages":     0,
+    },
+    "low": {
+        "throttle_delay_ms": 3000,
+        "opt_budget_ms":     3,
+        "prewarm_favorites": 0,
+        "predict_origins":   3,
+        "prerender_pages":   1,
+        "warm_home":         1,
+        "spare_tabs":        0,
+        "bfcache_pages":     2,
+    },
+    "medium": {
+        "throttle_delay_ms": 10000,
+        "opt_budget_ms":     4,
+        "prewarm_favorites": 5,
+        "predict_origins":   6,
+        "prerender_pages":   2,
+        "warm_home":         1,
+        "spare_tabs":        1,
+        "bfcache_pages":     4,
+    },
+    "high": {
+        "throttle_delay_ms": 30000,
+        "opt_budget_ms":     6,
+        "prewarm_favorites": 10,
+        "predict_origins":   10,
+        "prerender_pages":   4,
+        "warm_home":         1,
+        "spare_tabs":        2,
+        "bfcache_pages":     8,
+    },
+}
+
+
+def perf_limit(mode, key):
+    return PERF_LIMITS.get(mode, PERF_LIMITS["medium"])[key]
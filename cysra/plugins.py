@@ -0,0 +1,40 @@
+import os
+
+from .lazy import lazy
+from .paths import APPS_DIR, EXTENSIONS_DIR
+
+
+def _load_plugin_loader():
+    import importlib.util
+    return importlib.util
+
+
+def list_plugins(apps_dir=APPS_DIR):
+    if not os.path.exists(apps_dir):
+        try:
+            os.makedirs(apps_dir)
+        except Exception:
+            pass
+    try:
+        return sorted(f for f in os.listdir(apps_dir) if f.endswith(".py"))
+    except Exception:
+        return []
+
+
+def load_plugin(path):
+    loader = lazy("plugins", _load_plugin_loader)
+    spec = loader.spec_from_file_location("cysra_plugin", path)
+    mod = loader.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def install_extensions(profile, extensions_dir=EXTENSIONS_DIR):
+    if not os.path.exists(extensions_dir):
+        os.makedirs(extensions_dir)
+    if not hasattr(profile, "installExtension"):
+        return
+    for ext_name in os.listdir(extensions_dir):
+        ext_path = os.path.join(extensions_dir, ext_name)
+        if os.path.isdir(ext_path):
+            profile.installExtension(ext_path)
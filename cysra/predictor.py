@@ -0,0 +1,139 @@
+import socket
+import time
+from urllib.parse import urlsplit
+
+from PyQt5.QtCore import QObject
+
+from .history import most_visited
+from .perf import perf_limit
+from .workers import submit
+
+DNS_TTL = 300
+MAX_INFLIGHT = 4
+HISTORY_POOL = 50
+
+
+def origin_of(url):
+    try:
+        parts = urlsplit(url or "")
+        host, port = parts.hostname, parts.port
+    except ValueError:
+        return None
+    if parts.scheme not in ("http", "https") or not host:
+        return None
+    return parts.scheme + "://" + host + (":" + str(port) if port else "")
+
+
+def _bare(text):
+    text = text.strip().lower()
+    for prefix in ("https://", "http://", "www."):
+        if text.startswith(prefix):
+            text = text[len(prefix):]
+    return text
+
+
+def _resolve(host, port):
+    start = time.perf_counter()
+    socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    return (time.perf_counter() - start) * 1000
+
+
+class Predictor(QObject):
+    # Guesses the next origins from favorites and most-visited history. The
+    # home page preconnects to them; typed prefixes warm the system resolver
+    # on a worker. Navigation timing afterwards tells whether it paid off.
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self._resolved = {}
+        self._inflight = set()
+        self._predicted = {}
+        self.stats = {
+            "predicted": 0, "resolved": 0, "dns_ms": 0.0,
+            "navigations": 0, "hits": 0,
+            "hit_ms": 0.0, "hit_samples": 0, "miss_ms": 0.0, "miss_samples": 0,
+        }
+
+    def candidates(self, text="", limit=None):
+        if limit is None:
+            limit = perf_limit(self.store.perf_mode, "predict_origins")
+        needle = _bare(text)
+        if limit <= 0 or " " in needle:
+            return []
+        urls = [f.get("url", "") for f in self.store.favorites]
+        urls += [e["url"] for e in most_visited(self.store.history, HISTORY_POOL)]
+        origins = []
+        for url in urls:
+            origin = origin_of(url)
+            if not origin or origin in origins:
+                continue
+            if needle and not _bare(origin).startswith(needle):
+                continue
+            origins.append(origin)
+            if len(origins) >= limit:
+                break
+        return origins
+
+    def predict(self, text="", resolve=True):
+        origins = self.candidates(text)
+        now = time.monotonic()
+        if len(self._predicted) > 500:
+            self._predicted = {o: t for o, t in self._predicted.items() if now - t < DNS_TTL}
+        for origin in origins:
+            prev = self._predicted.get(origin)
+            if prev is None or now - prev >= DNS_TTL:
+                self.stats["predicted"] += 1
+            self._predicted[origin] = now
+            if resolve:
+                self._prefetch_dns(origin, now)
+        return origins
+
+    def _prefetch_dns(self, origin, now):
+        parts = urlsplit(origin)
+        host = parts.hostname
+        if (self._resolved.get(host, 0) > now or host in self._inflight
+                or len(self._inflight) >= MAX_INFLIGHT):
+            return
+        self._inflight.add(host)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        submit(_resolve, host, port,
+               on_done=lambda ms: self._on_resolved(host, ms),
+               on_error=lambda _exc: self._on_resolved(host, None))
+
+    def _on_resolved(self, host, ms):
+        self._inflight.discard(host)
+        self._resolved[host] = time.monotonic() + DNS_TTL
+        if ms is not None:
+            self.stats["resolved"] += 1
+            self.stats["dns_ms"] += ms
+
+    def record_navigation(self, url, setup_ms):
+        # setup_ms: DNS + connect time from the page's navigation timing.
+        origin = origin_of(url)
+        if origin is None:
+            return
+        when = self._predicted.get(origin)
+        hit = when is not None and time.monotonic() - when < DNS_TTL
+        self.stats["navigations"] += 1
+        if hit:
+            self.stats["hits"] += 1
+        if isinstance(setup_ms, (int, float)):
+            key = "hit" if hit else "miss"
+            self.stats[key + "_ms"] += setup_ms
+            self.stats[key + "_samples"] += 1
+
+    def summary(self):
+        st = self.stats
+        lines = [f"{st['predicted']} origins predicted · {st['resolved']} resolved ahead"]
+        if st["resolved"]:
+            lines.append(f"background DNS avg {st['dns_ms'] / st['resolved']:.1f} ms")
+        if st["navigations"]:
+            rate = 100.0 * st["hits"] / st["navigations"]
+            lines.append(f"{st['hits']}/{st['navigations']} navigations predicted ({rate:.0f}%)")
+        if st["hit_samples"] and st["miss_samples"]:
+            hit_avg = st["hit_ms"] / st["hit_samples"]
+            miss_avg = st["miss_ms"] / st["miss_samples"]
+            saved = max(0.0, miss_avg - hit_avg)
+            lines.append(f"setup {hit_avg:.0f} ms predicted vs {miss_avg:.0f} ms not"
+                         f" · ~{saved:.0f} ms saved per hit, {saved * st['hits'] / 1000:.1f} s total")
+        return lines
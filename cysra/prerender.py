@@ -0,0 +1,135 @@
+import time
+from collections import OrderedDict
+
+from PyQt5.QtWebEngineWidgets import QWebEngineSettings
+from PyQt5.QtCore import QObject, QTimer, QUrl
+
+from .home import HOME_URL
+from .perf import perf_limit
+from .tab import SecurePage
+
+PRERENDER_TTL = 60
+WARM_HOME_DELAY_MS = 1000
+
+
+def prerender_key(url):
+    return QUrl(url).adjusted(QUrl.StripTrailingSlash | QUrl.RemoveFragment).toString()
+
+
+class Prerenderer(QObject):
+    # Hidden pages loaded ahead of a likely click. They share the requesting
+    # tab's profile, so cookies and cache line up with the real navigation,
+    # and a tab takes one over instead of starting a cold load.
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self._pages = OrderedDict()
+        self._home = None
+        self.stats = {"started": 0, "used": 0, "discarded": 0}
+        self._sweep = QTimer(self)
+        self._sweep.setInterval(PRERENDER_TTL * 1000 // 2)
+        self._sweep.timeout.connect(self._expire)
+
+    def limit(self):
+        if not self.store.prerender or self.store.data_saver:
+            return 0
+        return perf_limit(self.store.perf_mode, "prerender_pages")
+
+    def start(self, url, profile):
+        if not url.startswith(("http://", "https://")):
+            return
+        key = prerender_key(url)
+        limit = self.limit()
+        if key in self._pages or limit <= 0:
+            return
+        while len(self._pages) >= limit:
+            self._drop(next(iter(self._pages)))
+
+        page = SecurePage(profile, self)
+        page.setAudioMuted(True)
+        settings = page.settings()
+        for name, val in self.store.site_settings(url, self.store.perf_mode).items():
+            settings.setAttribute(getattr(QWebEngineSettings, name), val)
+        entry = {"page": page, "started": time.monotonic(), "loaded": False}
+        page.loadFinished.connect(lambda ok: entry.update(loaded=ok))
+        self._pages[key] = entry
+        self.stats["started"] += 1
+        page.load(QUrl(url))
+        if not self._sweep.isActive():
+            self._sweep.start()
+
+    def warm_home(self, profile):
+        # Keeps one hidden cysra://home ready so a new tab paints at once.
+        if perf_limit(self.store.perf_mode, "warm_home") <= 0:
+            self.drop_home()
+            return
+        if self._home is not None:
+            return
+        page = SecurePage(profile, self)
+        page.setAudioMuted(True)
+        entry = {"page": page, "loaded": False}
+        page.loadFinished.connect(lambda ok: entry.update(loaded=ok))
+        self._home = entry
+        page.load(QUrl(HOME_URL))
+
+    def take_home(self, profile):
+        entry, self._home = self._home, None
+        if entry is None:
+            return None
+        if entry["page"].profile() is not profile:
+            entry["page"].deleteLater()
+            return None
+        QTimer.singleShot(WARM_HOME_DELAY_MS, lambda: self.warm_home(profile))
+        return entry["page"], entry["loaded"]
+
+    def drop_home(self):
+        entry, self._home = self._home, None
+        if entry is not None:
+            entry["page"].deleteLater()
+
+    def take(self, url, profile):
+        # Returns (page, loaded) and hands ownership to the caller, or None.
+        entry = self._pages.pop(prerender_key(url), None)
+        if entry is None:
+            return None
+        page = entry["page"]
+        if page.profile() is not profile:
+            self._discard(page)
+            return None
+        self.stats["used"] += 1
+        return page, entry["loaded"]
+
+    def cancel(self, url):
+        key = prerender_key(url)
+        if key in self._pages:
+            self._drop(key)
+
+    def clear(self):
+        for key in list(self._pages):
+            self._drop(key)
+
+    def _drop(self, key):
+        self._discard(self._pages.pop(key)["page"])
+
+    def _discard(self, page):
+        self.stats["discarded"] += 1
+        page.triggerAction(SecurePage.Stop)
+        page.deleteLater()
+
+    def _expire(self):
+        now = time.monotonic()
+        for key, entry in list(self._pages.items()):
+            if now - entry["started"] > PRERENDER_TTL:
+                self._drop(key)
+        if not self._pages:
+            self._sweep.stop()
+
+    def summary(self):
+        st = self.stats
+        lines = [f"{len(self._pages)} of {self.limit()} pages held"
+                 + ("" if self.store.prerender else " · off")]
+        if st["started"]:
+            lines.append(f"{st['started']} started · {st['used']} used · {st['discarded']} discarded"
+                         f" ({100.0 * st['used'] / st['started']:.0f}% hit)")
+        lines.extend("  " + key for key in self._pages)
+        return lines
@@ -0,0 +1,77 @@
+from PyQt5.QtWebEngineWidgets import QWebEngineProfile
+from PyQt5.QtCore import QObject
+
+from .injection import install_profile_scripts
+
+MAX_PROFILES = 4
+
+
+class PrivateSessions(QObject):
+    # Secret tabs share a small pool of off-the-record profiles instead of
+    # getting one each. Profiles are built lazily, handed out round-robin,
+    # and all of them are wiped once the last secret tab lets go.
+    def __init__(self, download_handler, size=1, parent=None, on_profile=None):
+        super().__init__(parent)
+        self._download_handler = download_handler
+        self._on_profile = on_profile
+        self._size = max(1, min(MAX_PROFILES, int(size)))
+        self._profiles = []
+        self._users = {}
+        self._next = 0
+
+    @property
+    def size(self):
+        return self._size
+
+    def set_size(self, size):
+        # Takes effect for new tabs; existing profiles live until wiped.
+        self._size = max(1, min(MAX_PROFILES, int(size)))
+
+    def active(self):
+        return sum(self._users.values())
+
+    def profiles(self):
+        return list(self._profiles)
+
+    def _new_profile(self):
+        profile = QWebEngineProfile(self)
+        profile.downloadRequested.connect(self._download_handler)
+        install_profile_scripts(profile, secret=True)
+        if self._on_profile is not None:
+            self._on_profile(profile)
+        return profile
+
+    def acquire(self):
+        if len(self._profiles) < self._size:
+            profile = self._new_profile()
+            self._profiles.append(profile)
+        else:
+            profile = self._profiles[self._next % len(self._profiles)]
+            self._next += 1
+        self._users[id(profile)] = self._users.get(id(profile), 0) + 1
+        return profile
+
+    def release(self, profile):
+        key = id(profile)
+        if key not in self._users:
+            return
+        self._users[key] -= 1
+        if self._users[key] <= 0:
+            del self._users[key]
+        if not self._users:
+            self.wipe()
+
+    def wipe(self):
+        # Pages are deleted before their profile: callers release after the
+        # tab's deleteLater, so the deferred deletes run in that order.
+        profiles, self._profiles = self._profiles, []
+        self._users.clear()
+        self._next = 0
+        for profile in profiles:
+            try:
+                profile.clearHttpCache()
+                profile.cookieStore().deleteAllCookies()
+                profile.clearAllVisitedLinks()
+            except Exception:
+                pass
+            profile.deleteLater()
@@ -0,0 +1,301 @@
+OPT_JS = """
+(function(BUDGET, TOKEN){
+    if(window.__cysra__)return;
+    window.__cysra__=true;
+    // Only subtrees added since the last frame are visited, and each frame
+    // stops once BUDGET ms are spent; leftovers roll over to the next frame.
+    var SEL='img,iframe,video,ul,ol,tbody,[style*="display"]';
+    var LONG_LIST=50;
+    var stats={nodes:0,lazy:0,lists:0,videos:0,pruned:0,frames:0,ms:0,max_ms:0};
+    var roots=[document.documentElement],ri=0,items=[];
+    var sched=false,reportTimer=0;
+    var vio=new IntersectionObserver(function(entries){
+        entries.forEach(function(e){
+            var v=e.target;
+            if(!e.isIntersecting){
+                if(!v.paused){v._cysraOff=true;stats.videos++;try{v.pause();}catch(x){}}
+            }else if(v._cysraOff){
+                v._cysraOff=false;try{v.play();}catch(x){}
+            }
+        });
+    });
+    var retry=function(){
+        if(!this._r){this._r=true;var s=this.src;this.src='';this.src=s;}
+    };
+    var visit=function(el,vh){
+        var tag=el.tagName;
+        if(tag==='IMG'||tag==='IFRAME'){
+            if(tag==='IMG'&&!el._c){el._c=true;el.addEventListener('error',retry);}
+            if(!el.hasAttribute('loading')&&!el.complete&&el.getBoundingClientRect().top>vh*2){
+                el.setAttribute('loading','lazy');stats.lazy++;
+            }
+        }else if(tag==='VIDEO'){
+            vio.observe(el);
+        }else if(tag==='UL'||tag==='OL'||tag==='TBODY'){
+            if(el.childElementCount>=LONG_LIST&&!el.classList.contains('__cysra_cv')){
+                el.classList.add('__cysra_cv');stats.lists++;
+            }
+        }
+        if(el.style&&el.style.display==='none'&&!el.id&&!el.className&&!el.firstChild){
+            try{el.remove();stats.pruned++;}catch(x){}
+        }
+    };
+    var report=function(){
+        reportTimer=0;
+        stats.ms=Math.round(stats.ms*10)/10;
+        stats.max_ms=Math.round(stats.max_ms*10)/10;
+        stats.queued=items.length+roots.length-ri;
+        console.log('cysra:opt:'+TOKEN+' '+JSON.stringify(stats));
+    };
+    var run=function(){
+        sched=false;
+        var t0=performance.now(),deadline=t0+BUDGET,vh=window.innerHeight,n=0;
+        while((items.length||ri<roots.length)&&performance.now()<deadline){
+            if(!items.length){
+                var r=roots[ri++];
+                if(ri===roots.length){roots=[];ri=0;}
+                if(!r.isConnected)continue;
+                if(r.matches(SEL))items.push(r);
+                var found=r.querySelectorAll(SEL);
+                for(var k=0;k<found.length;k++)items.push(found[k]);
+                continue;
+            }
+            var el=items.pop();
+            if(el.isConnected){visit(el,vh);n++;}
+        }
+        var dt=performance.now()-t0;
+        stats.nodes+=n;stats.frames++;stats.ms+=dt;
+        if(dt>stats.max_ms)stats.max_ms=dt;
+        if(items.length||ri<roots.length)schedule();
+        if(!reportTimer)reportTimer=setTimeout(report,2000);
+    };
+    var schedule=function(){if(sched)return;sched=true;requestAnimationFrame(run);};
+    new MutationObserver(function(records){
+        for(var i=0;i<records.length;i++){
+            var added=records[i].addedNodes;
+            for(var j=0;j<added.length;j++)if(added[j].nodeType===1)roots.push(added[j]);
+        }
+        schedule();
+    }).observe(document.documentElement,{childList:true,subtree:true});
+    schedule();
+    if(!document.getElementById('__cysra_s__')){
+        var s=document.createElement('style');
+        s.id='__cysra_s__';
+        s.textContent='html{overflow-x:hidden!important}*{box-sizing:border-box!important}'+
+            '.__cysra_cv>*{content-visibility:auto;contain-intrinsic-size:48px}';
+        (document.head||document.documentElement).appendChild(s);
+    }
+})(%d, %s);
+"""
+
+
+NAV_TIMING_JS = """
+(function(){
+    var n=performance.getEntriesByType('navigation')[0];
+    return n?Math.max(0,n.connectEnd-n.domainLookupStart):null;
+})();
+"""
+
+
+SECRET_JS = """
+(function(){
+    if(window.__cysra_secret__)return;
+    window.__cysra_secret__=true;
+    try{navigator.sendBeacon=function(){return false;};}catch(e){}
+})();
+"""
+
+
+CLICK_PATCH_JS = """
+(function() {
+    if (window.__cysra_patch_applied) return;
+    window.__cysra_patch_applied = true;
+    document.addEventListener('click', function(e) {
+        let target = e.target;
+        while (target && target !== document) {
+            if (target.tagName === 'BUTTON' || target.tagName === 'A' || target.onclick || target.getAttribute('role') === 'button') {
+                if (!e.isTrusted) return; 
+            }
+            target = target.parentNode;
+        }
+    }, true);
+})();
+"""
+
+
+# Finds the first password field a user could actually see and type into.
+_VISIBLE_PASSWORD_JS = """
+    var visible=function(el){
+        if(!el||el.disabled||el.readOnly)return false;
+        var r=el.getBoundingClientRect(), s=getComputedStyle(el);
+        return r.width>0&&r.height>0&&s.visibility!=='hidden'&&s.display!=='none'&&s.opacity!=='0';
+    };
+    var pf=null, all=document.querySelectorAll('input[type=password]');
+    for(var k=0;k<all.length;k++){if(visible(all[k])){pf=all[k];break;}}
+"""
+
+
+AUTOFILL_PROBE_JS = """
+(function(){""" + _VISIBLE_PASSWORD_JS + """
+    return !!pf && !pf.value;
+})();
+"""
+
+
+AUTOFILL_JS = """
+(function(user, pwd){""" + _VISIBLE_PASSWORD_JS + """
+    var set=function(el, v){
+        if(!el||el.value)return;
+        var d=Object.getOwnPropertyDescriptor(HTMLInputElement.prototype,'value');
+        d.set.call(el, v);
+        el.dispatchEvent(new Event('input',{bubbles:true}));
+        el.dispatchEvent(new Event('change',{bubbles:true}));
+    };
+    if(!pf)return;
+    var scope=pf.form||document;
+    var fields=Array.prototype.slice.call(scope.querySelectorAll('input'));
+    var uf=null;
+    for(var i=fields.indexOf(pf)-1;i>=0;i--){
+        var t=(fields[i].type||'text').toLowerCase();
+        if((t==='text'||t==='email'||t==='tel')&&visible(fields[i])){uf=fields[i];break;}
+    }
+    set(uf, user);
+    set(pf, pwd);
+})(%s, %s);
+"""
+
+
+DATA_SAVER_JS = """
+(function(MAX_PIXELS, MAX_BG_SCAN, TOKEN){
+    if(window.__cysra_saver__||!/^https?:$/.test(location.protocol))return;
+    window.__cysra_saver__=true;
+    var allow=function(urls){console.log('cysra:allow:'+TOKEN+' '+JSON.stringify(urls));};
+    var release=function(el){
+        var url=el.currentSrc||el.src;
+        if(!url||el._cysraReleased)return;
+        el._cysraReleased=true;
+        if(el.tagName==='IMG')el.removeAttribute('srcset');
+        url=el.src||url;
+        allow([url]);
+        setTimeout(function(){
+            if(el.tagName==='IMG'){el.src='';el.src=url;}else{el.load();}
+        },60);
+    };
+    var big=function(img){
+        var w=img.width||parseInt(img.getAttribute('width'))||0;
+        var h=img.height||parseInt(img.getAttribute('height'))||0;
+        return w*h>MAX_PIXELS;
+    };
+    var io=new IntersectionObserver(function(entries){
+        entries.forEach(function(e){
+            if(!e.isIntersecting)return;
+            io.unobserve(e.target);
+            if(big(e.target)){
+                e.target.title='Data saver: click to load image';
+                e.target.style.outline='1px dashed #888';
+                e.target.addEventListener('click',function(ev){
+                    if(!this._cysraReleased){ev.preventDefault();release(this);}
+                },{once:true});
+            }else{
+                release(e.target);
+            }
+        });
+    },{rootMargin:'200px'});
+    var watch=function(root){
+        (root.querySelectorAll?root.querySelectorAll('img'):[]).forEach(function(img){
+            if(!img._cysraWatched){img._cysraWatched=true;io.observe(img);}
+        });
+    };
+    watch(document);
+    new MutationObserver(function(records){
+        records.forEach(function(r){r.addedNodes.forEach(function(n){
+            if(n.tagName==='IMG'){if(!n._cysraWatched){n._cysraWatched=true;io.observe(n);}}
+            else if(n.nodeType===1)watch(n);
+        });});
+    }).observe(document.documentElement,{childList:true,subtree:true});
+    document.addEventListener('click',function(e){
+        var m=e.target.closest&&e.target.closest('video,audio');
+        if(m&&e.isTrusted)release(m);
+    },true);
+    document.querySelectorAll('video,audio').forEach(function(m){m.autoplay=false;m.preload='none';});
+    // CSS background images are blocked like any other image; they are let
+    // through once their element comes near the viewport, then re-applied.
+    var bgUrls=function(el){
+        var bg=getComputedStyle(el).backgroundImage, out=[], re=/url\(["']?([^"')]+)["']?\)/g, m;
+        if(bg==='none')return out;
+        while((m=re.exec(bg)))if(/^https?:/.test(m[1]))out.push(m[1]);
+        return out;
+    };
+    var bgio=new IntersectionObserver(function(entries){
+        entries.forEach(function(e){
+            if(!e.isIntersecting)return;
+            bgio.unobserve(e.target);
+            var el=e.target, urls=bgUrls(el);
+            if(!urls.length)return;
+            allow(urls);
+            setTimeout(function(){
+                var prev=el.style.backgroundImage;
+                el.style.backgroundImage='none';
+                void el.offsetWidth;
+                el.style.backgroundImage=prev;
+            },60);
+        });
+    },{rootMargin:'200px'});
+    var scanBg=function(){
+        var els=document.getElementsByTagName('*'), i=0;
+        var step=function(deadline){
+            while(i<els.length&&i<MAX_BG_SCAN&&deadline.timeRemaining()>1){
+                var el=els[i++];
+                if(!el._cysraBg&&bgUrls(el).length){el._cysraBg=true;bgio.observe(el);}
+            }
+            if(i<els.length&&i<MAX_BG_SCAN)requestIdleCallback(step);
+        };
+        requestIdleCallback(step);
+    };
+    if(document.readyState==='complete')scanBg();
+    else window.addEventListener('load',scanBg,{once:true});
+})(%d, %d, %s);
+"""
+
+
+# Pauses media in a tab that went to the background. When the page
+# lifecycle API is missing, freeze=true also holds back JS timers.
+BACKGROUND_JS = """
+(function(freeze){
+    document.querySelectorAll('video,audio').forEach(function(m){
+        if(!m.paused){m._cysraPaused=true;try{m.pause();}catch(e){}}
+    });
+    if(!freeze||window.__cysra_frozen__)return;
+    if(window.__cysra_frozen__===undefined){
+        var held=[];
+        var st=window.setTimeout,si=window.setInterval;
+        window.setTimeout=function(fn,ms){
+            var args=Array.prototype.slice.call(arguments,2);
+            return st(function(){
+                if(window.__cysra_frozen__)held.push(function(){fn.apply(window,args);});
+                else if(typeof fn==='function')fn.apply(window,args);
+            },ms);
+        };
+        window.setInterval=function(fn,ms){
+            var args=Array.prototype.slice.call(arguments,2);
+            return si(function(){
+                if(!window.__cysra_frozen__&&typeof fn==='function')fn.apply(window,args);
+            },ms);
+        };
+        window.__cysra_thaw__=function(){
+            var q=held;held=[];q.forEach(function(f){try{f();}catch(e){}});
+        };
+    }
+    window.__cysra_frozen__=true;
+})(%s);
+"""
+
+
+FOREGROUND_JS = """
+(function(){
+    if(window.__cysra_frozen__){window.__cysra_frozen__=false;window.__cysra_thaw__();}
+    document.querySelectorAll('video,audio').forEach(function(m){
+        if(m._cysraPaused){m._cysraPaused=false;try{m.play();}catch(e){}}
+    });
+})();
+"""
@@ -0,0 +1,112 @@
+import re
+import fnmatch
+
+from .domains import host_of
+
+PERF_MODES = ("lowest", "low", "medium", "high")
+
+# QWebEngineSettings attribute names per perf mode; tab.py resolves the names.
+PERF_ATTRS = {
+    "lowest": {
+        "JavascriptEnabled": True, "LocalContentCanAccessRemoteUrls": True,
+        "LocalContentCanAccessFileUrls": True, "AutoLoadImages": True,
+        "JavascriptCanOpenWindows": False, "JavascriptCanAccessClipboard": False,
+        "LinksIncludedInFocusChain": True, "FocusOnNavigationEnabled": False,
+        "PlaybackRequiresUserGesture": True, "FullScreenSupportEnabled": False,
+        "LocalStorageEnabled": True, "PluginsEnabled": False,
+        "ScrollAnimatorEnabled": False, "ErrorPageEnabled": True,
+        "WebGLEnabled": False, "Accelerated2dCanvasEnabled": False,
+    },
+    "low": {
+        "JavascriptEnabled": True, "LocalContentCanAccessRemoteUrls": True,
+        "LocalContentCanAccessFileUrls": True, "AutoLoadImages": True,
+        "JavascriptCanOpenWindows": True, "JavascriptCanAccessClipboard": True,
+        "LinksIncludedInFocusChain": True, "FocusOnNavigationEnabled": True,
+        "PlaybackRequiresUserGesture": False, "FullScreenSupportEnabled": True,
+        "LocalStorageEnabled": True, "PluginsEnabled": False,
+        "ScrollAnimatorEnabled": False, "ErrorPageEnabled": True,
+        "WebGLEnabled": True, "Accelerated2dCanvasEnabled": False,
+    },
+    "medium": {
+        "JavascriptEnabled": True, "LocalContentCanAccessRemoteUrls": True,
+        "LocalContentCanAccessFileUrls": True, "AutoLoadImages": True,
+        "JavascriptCanOpenWindows": True, "JavascriptCanAccessClipboard": True,
+        "LinksIncludedInFocusChain": True, "FocusOnNavigationEnabled": True,
+        "PlaybackRequiresUserGesture": False, "FullScreenSupportEnabled": True,
+        "LocalStorageEnabled": True, "PluginsEnabled": True,
+        "ScrollAnimatorEnabled": True, "ErrorPageEnabled": True,
+        "WebGLEnabled": True, "Accelerated2dCanvasEnabled": True,
+    },
+}
+PERF_ATTRS["high"] = PERF_ATTRS["medium"]
+
+# Rule feature -> (attribute, value meaning "feature on").
+FEATURES = {
+    "js":               ("JavascriptEnabled",           True),
+    "images":           ("AutoLoadImages",              True),
+    "webgl":            ("WebGLEnabled",                True),
+    "autoplay":         ("PlaybackRequiresUserGesture", False),
+    "plugins":          ("PluginsEnabled",              True),
+    "scroll_animation": ("ScrollAnimatorEnabled",       True),
+}
+
+
+def normalize_pattern(pattern):
+    pattern = (pattern or "").strip().lower()
+    if "://" in pattern or "/" in pattern:
+        pattern = host_of(pattern if "://" in pattern else "//" + pattern)
+    return pattern.rstrip(".")
+
+
+class SiteRules:
+    # Exact hosts and "*.suffix" patterns are dict lookups (one per host
+    # label); any other glob falls back to a single combined regex.
+    def __init__(self, rules=()):
+        self._exact = {}
+        self._suffix = {}
+        self._globs = []
+        self._cache = {}
+        for rule in rules:
+            pattern = normalize_pattern(rule.get("pattern"))
+            if not pattern:
+                continue
+            if pattern.startswith("*.") and not any(c in pattern[2:] for c in "*?["):
+                self._suffix[pattern[2:]] = rule
+            elif not any(c in pattern for c in "*?["):
+                self._exact[pattern] = rule
+            else:
+                self._globs.append((pattern, rule))
+        self._glob_re = None
+        if self._globs:
+            self._glob_re = re.compile("|".join(
+                "(?P<g%d>%s)" % (i, fnmatch.translate(pat)) for i, (pat, _) in enumerate(self._globs)
+            ))
+
+    def match(self, host):
+        host = (host or "").lower()
+        if host in self._cache:
+            return self._cache[host]
+        rule = self._exact.get(host)
+        if rule is None and self._suffix:
+            labels = host.split(".")
+            for i in range(len(labels)):
+                rule = self._suffix.get(".".join(labels[i:]))
+                if rule is not None:
+                    break
+        if rule is None and self._glob_re is not None:
+            m = self._glob_re.match(host)
+            if m:
+                rule = self._globs[int(m.lastgroup[1:])][1]
+        if len(self._cache) > 512:
+            self._cache.clear()
+        self._cache[host] = rule
+        return rule
+
+    def resolve(self, url, default_mode="medium"):
+        rule = self.match(host_of(url)) or {}
+        mode = rule.get("mode") if rule.get("mode") in PERF_ATTRS else default_mode
+        attrs = dict(PERF_ATTRS.get(mode, PERF_ATTRS["medium"]))
+        for feature, (attr, on_value) in FEATURES.items():
+            if rule.get(feature) is not None:
+                attrs[attr] = on_value if rule[feature] else not on_value
+        return attrs
@@ -0,0 +1,72 @@
+import time
+
+from PyQt5.QtCore import QObject, QTimer
+
+from .perf import perf_limit
+
+SPARE_IDLE_MS = 2000
+
+
+class SpareTabs(QObject):
+    # New tabs built ahead of time, home page already rendered, so Ctrl+T
+    # only has to insert one. The pool refills one tab per idle tick, which
+    # keeps each build a short stall and never lands during a page load.
+    def __init__(self, store, build, busy=None, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self._build = build
+        self._busy = busy
+        self._tabs = []
+        self.stats = {"built": 0, "used": 0, "cold": 0, "build_ms": 0.0}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(SPARE_IDLE_MS)
+        self._timer.timeout.connect(self._refill)
+
+    def limit(self):
+        return perf_limit(self.store.perf_mode, "spare_tabs")
+
+    def schedule(self):
+        if len(self._tabs) < self.limit():
+            self._timer.start()
+
+    def _refill(self):
+        if len(self._tabs) >= self.limit():
+            return
+        if self._busy is not None and self._busy():
+            self._timer.start()
+            return
+        start = time.perf_counter()
+        self._tabs.append(self._build())
+        self.stats["built"] += 1
+        self.stats["build_ms"] += (time.perf_counter() - start) * 1000
+        self.schedule()
+
+    def take(self):
+        # Returns a ready tab and hands ownership to the caller, or None.
+        tab = self._tabs.pop(0) if self._tabs else None
+        self.stats["used" if tab is not None else "cold"] += 1
+        self.schedule()
+        return tab
+
+    def trim(self):
+        limit = self.limit()
+        while len(self._tabs) > limit:
+            self._tabs.pop().deleteLater()
+        self.schedule()
+
+    def clear(self):
+        self._timer.stop()
+        tabs, self._tabs = self._tabs, []
+        for tab in tabs:
+            tab.deleteLater()
+
+    def summary(self):
+        st = self.stats
+        lines = [f"{len(self._tabs)} of {self.limit()} tabs ready"]
+        if st["built"]:
+            lines.append(f"{st['built']} built · avg {st['build_ms'] / st['built']:.0f} ms off the Ctrl+T path")
+        if st["used"] or st["cold"]:
+            total = st["used"] + st["cold"]
+            lines.append(f"{st['used']}/{total} new tabs served warm ({100.0 * st['used'] / total:.0f}%)")
+        return lines
@@ -0,0 +1,294 @@
+import os
+import re
+import shutil
+import struct
+
+from PyQt5.QtWebEngineWidgets import QWebEnginePage, QWebEngineSettings
+from PyQt5.QtNetwork import QNetworkCookie
+from PyQt5.QtCore import QObject, QTimer, QUrl, pyqtSignal
+
+from .domains import registrable_domain
+from .workers import submit
+
+CACHE_MIN = 20 * 1024 * 1024
+CACHE_GROWTH = 4        # the disk cache may grow up to 4x the perf-mode size...
+CACHE_FREE_SHARE = 100  # ...but never past 1/100 of the free disk space
+LRU_KEEP_SITES = 50
+PREWARM_TIMEOUT_MS = 15000
+
+# Chromium's simple cache keeps one "<hash>_0" file per entry whose header
+# carries the request key; "_1" and "_s" hold stream data for the same hash.
+_SIMPLE_FILE = re.compile(r"^([0-9a-f]{16})_[01s]$")
+_SIMPLE_MAGIC = 0xfcfb6d1ba7725c30
+_SIMPLE_HEADER = struct.Struct("<QIII")
+
+# Per-origin directories, e.g. "https_www.example.com_0.indexeddb.leveldb".
+_ORIGIN_DIR = re.compile(r"^(https?)_(.+)_(\d+)(\.indexeddb\.(?:leveldb|blob))?$")
+_ORIGIN_DIRS = (("IndexedDB", "idb"), ("databases", "websql"))
+
+
+def format_bytes(n):
+    n = float(n or 0)
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return (f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}")
+        n /= 1024
+
+
+def dir_size(path):
+    total = 0
+    try:
+        entries = list(os.scandir(path))
+    except OSError:
+        return 0
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                total += dir_size(entry.path)
+            else:
+                total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            pass
+    return total
+
+
+def free_bytes(path):
+    while path and not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    try:
+        return shutil.disk_usage(path or ".").free
+    except OSError:
+        return None
+
+
+def cache_budget(path, base):
+    free = free_bytes(path)
+    if free is None:
+        return base
+    return max(CACHE_MIN, min(base * CACHE_GROWTH, free // CACHE_FREE_SHARE))
+
+
+def _simple_entry_site(path):
+    try:
+        with open(path, "rb") as f:
+            head = f.read(_SIMPLE_HEADER.size)
+            if len(head) < _SIMPLE_HEADER.size:
+                return None
+            magic, _version, key_len, _hash = _SIMPLE_HEADER.unpack(head)
+            if magic != _SIMPLE_MAGIC or key_len > 8192:
+                return None
+            key = f.read(key_len).decode("utf-8", "replace")
+    except OSError:
+        return None
+    # Partitioned keys prefix the URL with isolation info; the URL comes last.
+    return registrable_domain(key.split()[-1]) if key.split() else None
+
+
+def cache_entries(cache_path):
+    # {hash: (site, [paths], size, mtime)} for simple-cache entries under path.
+    groups = {}
+    for root, _dirs, files in os.walk(cache_path):
+        for name in files:
+            m = _SIMPLE_FILE.match(name)
+            if not m:
+                continue
+            full = os.path.join(root, name)
+            try:
+                st = os.stat(full)
+            except OSError:
+                continue
+            group = groups.setdefault(m.group(1), [None, [], 0, 0])
+            group[1].append(full)
+            group[2] += st.st_size
+            group[3] = max(group[3], st.st_mtime)
+            if name.endswith("_0"):
+                group[0] = _simple_entry_site(full)
+    return groups
+
+
+def origin_dirs(storage_path):
+    for sub, kind in _ORIGIN_DIRS:
+        base = os.path.join(storage_path, sub)
+        try:
+            names = os.listdir(base)
+        except OSError:
+            continue
+        for name in names:
+            m = _ORIGIN_DIR.match(name)
+            if m:
+                yield os.path.join(base, name), registrable_domain(m.group(2)), kind
+
+
+def scan_storage(cache_path, storage_path):
+    sites = {}
+    for site, _paths, size, _mtime in cache_entries(cache_path).values():
+        if site:
+            usage = sites.setdefault(site, {})
+            usage["cache"] = usage.get("cache", 0) + size
+    for path, site, kind in origin_dirs(storage_path):
+        usage = sites.setdefault(site, {})
+        usage[kind] = usage.get(kind, 0) + dir_size(path)
+    return {
+        "cache_bytes":   dir_size(cache_path),
+        "storage_bytes": dir_size(storage_path),
+        "free_bytes":    free_bytes(cache_path),
+        "sites":         sites,
+    }
+
+
+def evict_site_files(cache_path, storage_path, sites):
+    sites = set(sites)
+    freed = 0
+    for site, paths, size, _mtime in cache_entries(cache_path).values():
+        if site in sites:
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            freed += size
+    for path, site, _kind in list(origin_dirs(storage_path)):
+        if site in sites:
+            size = dir_size(path)
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+            freed += size
+    return freed
+
+
+def evict_pending(store):
+    # Runs at startup before the profile exists, so Chromium has none of the
+    # files open while they are deleted.
+    pending = store.take_pending_eviction()
+    if not pending or not pending.get("sites"):
+        return 0
+    return evict_site_files(pending.get("cache", ""), pending.get("storage", ""), pending["sites"])
+
+
+class StorageManager(QObject):
+    scanned = pyqtSignal(dict)
+    evicted = pyqtSignal(int)
+
+    def __init__(self, profile, store, parent=None):
+        super().__init__(parent)
+        self.profile = profile
+        self.store = store
+        self._cookies = {}
+        self._report = None
+        self._prewarm_queue = []
+        self._prewarm_page = None
+        self._prewarm_timer = QTimer(self)
+        self._prewarm_timer.setSingleShot(True)
+        self._prewarm_timer.timeout.connect(self._prewarm_next)
+
+        cookies = profile.cookieStore()
+        cookies.cookieAdded.connect(self._cookie_added)
+        cookies.cookieRemoved.connect(self._cookie_removed)
+        cookies.loadAllCookies()
+
+    @staticmethod
+    def _cookie_key(cookie):
+        return (bytes(cookie.name()), cookie.domain(), cookie.path())
+
+    @staticmethod
+    def _cookie_site(cookie):
+        return registrable_domain(cookie.domain().lstrip("."))
+
+    def _cookie_added(self, cookie):
+        jar = self._cookies.setdefault(self._cookie_site(cookie), {})
+        jar[self._cookie_key(cookie)] = QNetworkCookie(cookie)
+
+    def _cookie_removed(self, cookie):
+        site = self._cookie_site(cookie)
+        jar = self._cookies.get(site)
+        if jar is not None:
+            jar.pop(self._cookie_key(cookie), None)
+            if not jar:
+                del self._cookies[site]
+
+    @property
+    def last_report(self):
+        return self._report
+
+    def scan(self):
+        submit(scan_storage, self.profile.cachePath(), self.profile.persistentStoragePath(),
+               on_done=self._scanned)
+
+    def _scanned(self, report):
+        for site, jar in self._cookies.items():
+            report["sites"].setdefault(site, {})["cookies"] = len(jar)
+        report["cache_budget"] = self.profile.httpCacheMaximumSize()
+        report["pending"] = self.store.pending_eviction_sites()
+        self._report = report
+        self.scanned.emit(report)
+
+    def evict_sites(self, sites):
+        sites = {s for s in sites if s}
+        jar = self.profile.cookieStore()
+        for site in sites:
+            for cookie in list(self._cookies.pop(site, {}).values()):
+                jar.deleteCookie(cookie)
+        # Cookies go through the cookie store now; the cache entries and
+        # databases are open in the running profile, so their files are
+        # deleted at the next start instead.
+        self.store.queue_eviction(self.profile.cachePath(), self.profile.persistentStoragePath(), sites)
+        self.evicted.emit(len(sites))
+        self.scan()
+
+    def lru_sites(self, keep=LRU_KEEP_SITES):
+        # History is newest-first, so the first sighting of a site is its
+        # last visit; favorites are always kept.
+        recent = []
+        for entry in self.store.history:
+            site = registrable_domain(entry.get("url", ""))
+            if site and site not in recent:
+                recent.append(site)
+                if len(recent) >= keep:
+                    break
+        kept = set(recent) | {registrable_domain(f.get("url", "")) for f in self.store.favorites}
+        known = set(self._cookies)
+        if self._report:
+            known |= set(self._report["sites"])
+        return sorted(known - kept)
+
+    def evict_lru(self, keep=LRU_KEEP_SITES):
+        sites = self.lru_sites(keep)
+        if sites:
+            self.evict_sites(sites)
+        return sites
+
+    def clear_cache(self):
+        self.profile.clearHttpCache()
+        QTimer.singleShot(500, self.scan)
+
+    def prewarm(self, urls):
+        if self._prewarm_queue or self._prewarm_page is not None:
+            return
+        self._prewarm_queue = [u for u in urls if u.startswith(("http://", "https://"))]
+        self._prewarm_next()
+
+    def _prewarm_next(self, _ok=None):
+        # One hidden page per URL, so a late loadFinished from an abandoned
+        # load can never advance the queue twice.
+        self._prewarm_timer.stop()
+        if self._prewarm_page is not None:
+            self._prewarm_page.loadFinished.disconnect(self._prewarm_next)
+            self._prewarm_page.deleteLater()
+            self._prewarm_page = None
+        if not self._prewarm_queue:
+            return
+        page = QWebEnginePage(self.profile, self)
+        page.setAudioMuted(True)
+        page.settings().setAttribute(QWebEngineSettings.JavascriptEnabled, False)
+        page.loadFinished.connect(self._prewarm_next)
+        self._prewarm_page = page
+        self._prewarm_timer.start(PREWARM_TIMEOUT_MS)
+        page.load(QUrl(self._prewarm_queue.pop(0)))
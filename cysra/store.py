@@ -0,0 +1,624 @@
+import os
+import json
+import base64
+import hmac
+from datetime import datetime
+from PyQt5.QtCore import QCoreApplication, QObject, QTimer, pyqtSignal
+
+from .crypto import (
+    BACKENDS, default_backend, derive_master, get_backend, new_kdf, sha256, split_master
+)
+from .domains import registrable_domain, site_origin
+from .history import HISTORY_LIMIT, is_recordable
+from .journal import Journal
+from .paths import DATA_FILE
+from .siteprofiles import FEATURES, SiteRules, normalize_pattern
+from .workers import submit
+
+VAULT_IDLE_SECS = 300
+
+
+class DataStore(QObject):
+    changed          = pyqtSignal()
+    history_added    = pyqtSignal(dict)
+    history_cleared  = pyqtSignal()
+    favorite_added   = pyqtSignal(dict)
+    favorite_removed = pyqtSignal(str)
+    favorite_updated = pyqtSignal(dict)
+    password_changed = pyqtSignal()
+    setting_changed  = pyqtSignal(str)
+    vault_locked     = pyqtSignal()
+
+    def __init__(self, path=None):
+        super().__init__()
+        self._path = path or DATA_FILE
+        self._data = {"history": [], "favorites": [], "passwords": [], "master_pwd": None, "perf_mode": "medium"}
+        self._keys = {}
+        self._fav_index = {}
+        self._vault_index = {}
+        self._lock_timer = None
+        self._site_rules = None
+        self._journal = Journal(self._path + ".journal")
+        self._load()
+
+    def _load(self):
+        try:
+            if os.path.exists(self._path):
+                with open(self._path, encoding="utf-8") as f:
+                    self._data = json.load(f)
+        except Exception:
+            self._data = {"history": [], "favorites": [], "passwords": [], "master_pwd": None, "perf_mode": "medium"}
+        self._reindex_favorites()
+        self._reindex_passwords()
+        ops = self._journal.read()
+        if ops:
+            for op in ops:
+                self._replay(op)
+            self._save()
+
+    def _save(self):
+        try:
+            with open(self._path, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, indent=2, ensure_ascii=False)
+            self._journal.clear()
+        except Exception:
+            pass
+
+    def _log(self, *ops):
+        try:
+            self._journal.append(*ops)
+        except Exception:
+            self._save()
+            return
+        if self._journal.needs_compaction():
+            self._save()
+
+    def _replay(self, op):
+        kind = op.get("op")
+        if kind == "fav_add":
+            self._fav_insert(op.get("entry") or {})
+        elif kind == "fav_remove":
+            self._fav_delete(op.get("url"))
+        elif kind == "fav_update":
+            entry = self._fav_index.get(op.get("url"))
+            if entry is not None:
+                self._fav_apply(entry, op.get("fields") or {})
+        elif kind == "history_add":
+            self._history_insert(op.get("entry") or {})
+        elif kind == "data_saved":
+            self._data["data_saved_bytes"] = self.data_saved_bytes + int(op.get("bytes") or 0)
+
+    def _reindex_favorites(self):
+        favs = self._data.setdefault("favorites", [])
+        self._fav_index = {}
+        unique = []
+        for f in favs:
+            url = f.get("url")
+            if url and url not in self._fav_index:
+                self._fav_index[url] = f
+                unique.append(f)
+        if len(unique) != len(favs):
+            self._data["favorites"] = unique
+
+    @property
+    def perf_mode(self):
+        return self._data.get("perf_mode", "medium")
+
+    @perf_mode.setter
+    def perf_mode(self, val):
+        if self._data.get("perf_mode") == val:
+            return
+        self._data["perf_mode"] = val
+        self._save()
+        self.setting_changed.emit("perf_mode")
+        self.changed.emit()
+
+    @property
+    def data_saver(self):
+        return bool(self._data.get("data_saver", False))
+
+    @data_saver.setter
+    def data_saver(self, on):
+        on = bool(on)
+        if self.data_saver == on:
+            return
+        self._data["data_saver"] = on
+        self._save()
+        self.setting_changed.emit("data_saver")
+        self.changed.emit()
+
+    @property
+    def prerender(self):
+        return bool(self._data.get("prerender", False))
+
+    @prerender.setter
+    def prerender(self, on):
+        on = bool(on)
+        if self.prerender == on:
+            return
+        self._data["prerender"] = on
+        self._save()
+        self.setting_changed.emit("prerender")
+        self.changed.emit()
+
+    @property
+    def secret_profiles(self):
+        return int(self._data.get("secret_profiles", 1))
+
+    @secret_profiles.setter
+    def secret_profiles(self, n):
+        n = max(1, int(n))
+        if self.secret_profiles == n:
+            return
+        self._data["secret_profiles"] = n
+        self._save()
+        self.setting_changed.emit("secret_profiles")
+        self.changed.emit()
+
+    @property
+    def data_saved_bytes(self):
+        return int(self._data.get("data_saved_bytes", 0))
+
+    def add_data_saved(self, n):
+        if n <= 0:
+            return
+        self._data["data_saved_bytes"] = self.data_saved_bytes + n
+        self._log({"op": "data_saved", "bytes": n})
+
+    def queue_eviction(self, cache_path, storage_path, sites):
+        pending = self._data.get("evict_pending") or {}
+        queued = set(pending.get("sites", [])) | set(sites)
+        self._data["evict_pending"] = {"cache": cache_path, "storage": storage_path,
+                                       "sites": sorted(queued)}
+        self._save()
+
+    def pending_eviction_sites(self):
+        return list((self._data.get("evict_pending") or {}).get("sites", []))
+
+    def take_pending_eviction(self):
+        pending = self._data.pop("evict_pending", None)
+        if pending is not None:
+            self._save()
+        return pending
+
+    @property
+    def site_rules(self):
+        return list(self._data.get("site_rules", []))
+
+    def set_site_rule(self, pattern, mode=None, **features):
+        pattern = normalize_pattern(pattern)
+        if not pattern:
+            return None
+        rule = {"pattern": pattern}
+        if mode:
+            rule["mode"] = mode
+        for key, val in features.items():
+            if key in FEATURES and val is not None:
+                rule[key] = bool(val)
+        rules = [r for r in self._data.get("site_rules", []) if r.get("pattern") != pattern]
+        rules.append(rule)
+        self._data["site_rules"] = rules
+        self._site_rules = None
+        self._save()
+        self.setting_changed.emit("site_rules")
+        self.changed.emit()
+        return rule
+
+    def remove_site_rule(self, pattern):
+        rules = self._data.get("site_rules", [])
+        kept = [r for r in rules if r.get("pattern") != pattern]
+        if len(kept) == len(rules):
+            return
+        self._data["site_rules"] = kept
+        self._site_rules = None
+        self._save()
+        self.setting_changed.emit("site_rules")
+        self.changed.emit()
+
+    def site_settings(self, url, mode=None):
+        if self._site_rules is None:
+            self._site_rules = SiteRules(self._data.get("site_rules", []))
+        return self._site_rules.resolve(url, mode or self.perf_mode)
+
+    def add_history(self, url, title=""):
+        if not is_recordable(url):
+            return
+        entry = {"url": url, "title": title or url, "ts": datetime.now().strftime("%d %b %H:%M")}
+        self._history_insert(entry)
+        self._log({"op": "history_add", "entry": entry})
+        self.history_added.emit(entry)
+        self.changed.emit()
+
+    def _history_insert(self, entry):
+        url = entry.get("url")
+        if not url:
+            return
+        history = [e for e in self._data.get("history", []) if e.get("url") != url]
+        history.insert(0, entry)
+        self._data["history"] = history[:HISTORY_LIMIT]
+
+    def clear_history(self):
+        self._data["history"] = []
+        self._save()
+        self.history_cleared.emit()
+        self.changed.emit()
+
+    @property
+    def history(self):
+        return self._data.get("history", [])
+
+    def _fav_insert(self, entry):
+        url = entry.get("url")
+        if not url or url in self._fav_index:
+            return None
+        entry = dict(entry)
+        self._data.setdefault("favorites", []).append(entry)
+        self._fav_index[url] = entry
+        return entry
+
+    def _fav_delete(self, url):
+        entry = self._fav_index.pop(url, None)
+        if entry is None:
+            return False
+        favs = self._data.get("favorites", [])
+        for i, f in enumerate(favs):
+            if f is entry:
+                del favs[i]
+                break
+        return True
+
+    @staticmethod
+    def _fav_apply(entry, fields):
+        for key, val in fields.items():
+            if val:
+                entry[key] = val
+            else:
+                entry.pop(key, None)
+
+    def add_favorite(self, url, title="", folder="", tags=None):
+        fav = {"url": url, "title": title or url}
+        if folder:
+            fav["folder"] = folder
+        if tags:
+            fav["tags"] = list(tags)
+        entry = self._fav_insert(fav)
+        if entry is not None:
+            self._log({"op": "fav_add", "entry": entry})
+            self.favorite_added.emit(entry)
+            self.changed.emit()
+
+    def remove_favorite(self, url):
+        if self._fav_delete(url):
+            self._log({"op": "fav_remove", "url": url})
+            self.favorite_removed.emit(url)
+            self.changed.emit()
+
+    def is_favorite(self, url):
+        return url in self._fav_index
+
+    def update_favorite(self, url, **fields):
+        entry = self._fav_index.get(url)
+        if entry is None:
+            return
+        fields = {k: v for k, v in fields.items() if k in ("title", "folder", "tags")}
+        if "tags" in fields:
+            fields["tags"] = sorted({t.strip() for t in (fields["tags"] or []) if t.strip()})
+        self._fav_apply(entry, fields)
+        self._log({"op": "fav_update", "url": url, "fields": fields})
+        self.favorite_updated.emit(entry)
+        self.changed.emit()
+
+    def import_favorites(self, entries):
+        added = []
+        for fav in entries:
+            entry = self._fav_insert(fav)
+            if entry is not None:
+                added.append({"op": "fav_add", "entry": entry})
+        if added:
+            self._log(*added)
+            for op in added:
+                self.favorite_added.emit(op["entry"])
+            self.changed.emit()
+        return len(added)
+
+    @property
+    def favorites(self):
+        return self._data.get("favorites", [])
+
+    def favorite_folders(self):
+        return sorted({f.get("folder") for f in self.favorites if f.get("folder")})
+
+    def _reindex_passwords(self):
+        self._vault_index = {}
+        for entry in self._data.setdefault("passwords", []):
+            key = registrable_domain(entry.get("site", "")) or entry.get("site", "")
+            self._vault_index.setdefault(key, []).append(entry)
+
+    def _vault_lookup(self, site):
+        return self._vault_index.get(registrable_domain(site) or site, [])
+
+    @property
+    def secret_backend(self):
+        return default_backend()
+
+    def _encrypt(self, plain):
+        backend = default_backend()
+        if backend is None or backend.name not in self._keys:
+            return None
+        ct = backend.protect((plain or "").encode("utf-8"), self._keys[backend.name])
+        return {"v": 1, "enc": backend.name, "ct": base64.b64encode(ct).decode("utf-8")}
+
+    def _decrypt(self, blob):
+        if isinstance(blob, str):
+            return base64.b64decode(blob.encode("utf-8")).decode("utf-8", errors="replace")
+        if not isinstance(blob, dict):
+            return ""
+        backend = get_backend(blob.get("enc"))
+        if backend is None or backend.name not in self._keys:
+            raise RuntimeError("no key for secret backend " + str(blob.get("enc")))
+        ct = base64.b64decode((blob.get("ct") or "").encode("utf-8"))
+        return backend.unprotect(ct, self._keys[backend.name]).decode("utf-8", errors="replace")
+
+    def add_password(self, site, user, pwd):
+        if not self._keys:
+            return False
+        enc_pwd = self._encrypt(pwd)
+        if enc_pwd is None:
+            return False
+        self._touch()
+        entry = {"site": site, "user": user, "pwd": enc_pwd}
+        self._data.setdefault("passwords", []).append(entry)
+        self._vault_index.setdefault(registrable_domain(site) or site, []).append(entry)
+        self._save()
+        self.password_changed.emit()
+        self.changed.emit()
+        return True
+
+    def remove_password(self, site, user):
+        bucket = self._vault_lookup(site)
+        gone = [e for e in bucket if e.get("site") == site and e.get("user") == user]
+        if not gone:
+            return
+        for e in gone:
+            bucket.remove(e)
+        if not bucket:
+            self._vault_index.pop(registrable_domain(site) or site, None)
+        gone_ids = {id(e) for e in gone}
+        self._data["passwords"] = [e for e in self._data.get("passwords", []) if id(e) not in gone_ids]
+        self._save()
+        self.password_changed.emit()
+        self.changed.emit()
+
+    @property
+    def passwords(self):
+        if not self._keys:
+            return []
+        self._touch()
+        return [{"site": p_.get("site", ""), "user": p_.get("user", "")}
+                for p_ in self._data.get("passwords", [])]
+
+    @property
+    def is_unlocked(self):
+        return bool(self._keys)
+
+    def credentials_for(self, url):
+        # Only logins saved for exactly this origin; the registrable-domain
+        # index just narrows the search.
+        if not self._keys:
+            return []
+        origin = site_origin(url)
+        return [{"site": e.get("site", ""), "user": e.get("user", "")}
+                for e in self._vault_lookup(url) if site_origin(e.get("site", "")) == origin]
+
+    def reveal_password(self, site, user, touch=True):
+        if not self._keys:
+            return None
+        if touch:
+            self._touch()
+        for p_ in self._vault_lookup(site):
+            if p_.get("site") == site and p_.get("user") == user:
+                try:
+                    return self._decrypt(p_.get("pwd"))
+                except Exception:
+                    return None
+        return None
+
+    @property
+    def vault_idle_secs(self):
+        return int(self._data.get("vault_idle_secs", VAULT_IDLE_SECS))
+
+    @vault_idle_secs.setter
+    def vault_idle_secs(self, secs):
+        secs = max(0, int(secs))
+        if self.vault_idle_secs == secs and "vault_idle_secs" in self._data:
+            return
+        self._data["vault_idle_secs"] = secs
+        self._save()
+        self._touch()
+        self.setting_changed.emit("vault_idle_secs")
+        self.changed.emit()
+
+    def _touch(self):
+        if not self._keys or QCoreApplication.instance() is None:
+            return
+        if self._lock_timer is None:
+            self._lock_timer = QTimer(self)
+            self._lock_timer.setSingleShot(True)
+            self._lock_timer.timeout.connect(self.lock_master)
+        if self.vault_idle_secs > 0:
+            self._lock_timer.start(self.vault_idle_secs * 1000)
+        else:
+            self._lock_timer.stop()
+
+    def _new_kdf(self):
+        cost = dict(self._data.get("kdf_cost") or {})
+        algo = cost.pop("algo", "scrypt")
+        try:
+            return new_kdf(algo, cost)
+        except ValueError:
+            return new_kdf()
+
+    def _set_master_key(self, key):
+        self._keys = {b.name: b.derive_key(key) for b in BACKENDS.values() if b.available()}
+
+    def _backends_in_use(self):
+        return {p_["pwd"].get("enc") for p_ in self._data.get("passwords", [])
+                if isinstance(p_.get("pwd"), dict)}
+
+    def _rekey(self, key):
+        plain = {}
+        for p_ in self._data.get("passwords", []):
+            try:
+                plain[id(p_)] = self._decrypt(p_.get("pwd"))
+            except Exception:
+                pass
+        self._set_master_key(key)
+        for p_ in self._data.get("passwords", []):
+            if id(p_) in plain:
+                enc = self._encrypt(plain[id(p_)])
+                if enc is not None:
+                    p_["pwd"] = enc
+
+    def _prepare_set_master(self, pwd):
+        kdf = self._new_kdf()
+        return lambda: (kdf, derive_master(pwd, kdf))
+
+    def _complete_set_master(self, result):
+        # Replacing an existing master needs the current keys to rekey the
+        # vault; a fresh key would leave every saved password undecryptable.
+        if self.has_master_pwd and not self._keys:
+            return False
+        kdf, raw = result
+        check, key = split_master(raw)
+        kdf["check"] = check
+        if self._keys:
+            self._rekey(key)
+        else:
+            self._set_master_key(key)
+        self._data["master_kdf"] = kdf
+        self._data.pop("master_pwd", None)
+        self._data.pop("vault_salt", None)
+        self._migrate_passwords_if_needed()
+        self._save()
+        self._touch()
+        self.password_changed.emit()
+        return True
+
+    def set_master_pwd(self, pwd):
+        if self.has_master_pwd and not self._keys:
+            return False
+        return self._complete_set_master(self._prepare_set_master(pwd)())
+
+    def set_master_pwd_async(self, pwd, on_done):
+        if self.has_master_pwd and not self._keys:
+            on_done(False)
+            return
+        submit(self._prepare_set_master(pwd),
+               on_done=lambda res: on_done(self._complete_set_master(res)),
+               on_error=lambda exc: on_done(False))
+
+    def check_master_pwd(self, pwd):
+        kdf = self._data.get("master_kdf")
+        if kdf:
+            check, _ = split_master(derive_master(pwd, kdf))
+            return hmac.compare_digest(check, kdf.get("check", ""))
+        if not self._data.get("master_pwd"):
+            return True
+        return sha256(pwd).hexdigest() == self._data["master_pwd"]
+
+    @property
+    def has_master_pwd(self):
+        return bool(self._data.get("master_kdf") or self._data.get("master_pwd"))
+
+    def _prepare_unlock(self, pwd):
+        # Runs on a worker thread, so it only sees copies of what it needs.
+        kdf = self._data.get("master_kdf")
+        if kdf:
+            kdf = dict(kdf)
+            new = self._new_kdf()
+            if all(new[k] == kdf.get(k) for k in new if k != "salt"):
+                return lambda: ("kdf", kdf, derive_master(pwd, kdf), None, None)
+            return lambda: ("kdf", kdf, derive_master(pwd, kdf), new, derive_master(pwd, new))
+        legacy = self._data.get("master_pwd")
+        if not legacy:
+            # Nothing to unlock yet; creating a master is set_master_pwd's job.
+            return lambda: ("bad",)
+        salt = base64.b64decode((self._data.get("vault_salt") or "").encode("utf-8"))
+        names = self._backends_in_use()
+        new = self._new_kdf()
+
+        def work():
+            if sha256(pwd).hexdigest() != legacy:
+                return ("bad",)
+            old_keys = {}
+            for name in names:
+                b = get_backend(name)
+                if b is not None and b.available():
+                    old_keys[name] = b.legacy_key(pwd, salt)
+            return ("legacy", new, derive_master(pwd, new), old_keys)
+        return work
+
+    def _complete_unlock(self, result):
+        kind = result[0]
+        if kind == "kdf":
+            kdf, raw, new, new_raw = result[1:]
+            check, key = split_master(raw)
+            if not hmac.compare_digest(check, kdf.get("check", "")):
+                return False
+            self._set_master_key(key)
+            if new is not None:
+                new["check"], new_key = split_master(new_raw)
+                self._rekey(new_key)
+                self._data["master_kdf"] = new
+                self._save()
+            self._migrate_passwords_if_needed()
+        elif kind == "legacy":
+            kdf, raw, old_keys = result[1], result[2], result[3]
+            check, key = split_master(raw)
+            kdf["check"] = check
+            self._keys = old_keys
+            self._rekey(key)
+            self._data["master_kdf"] = kdf
+            self._data.pop("master_pwd", None)
+            self._data.pop("vault_salt", None)
+            self._migrate_passwords_if_needed()
+            self._save()
+        else:
+            return False
+        self._touch()
+        return True
+
+    def unlock_master(self, pwd):
+        return self._complete_unlock(self._prepare_unlock(pwd)())
+
+    def unlock_master_async(self, pwd, on_done):
+        submit(self._prepare_unlock(pwd),
+               on_done=lambda res: on_done(self._complete_unlock(res)),
+               on_error=lambda exc: on_done(False))
+
+    def lock_master(self):
+        was_unlocked = bool(self._keys)
+        self._keys = {}
+        if self._lock_timer is not None:
+            self._lock_timer.stop()
+        if was_unlocked:
+            self.vault_locked.emit()
+
+    def _migrate_passwords_if_needed(self):
+        if not self._keys:
+            return False
+        changed = False
+        for p_ in self._data.get("passwords", []):
+            blob = p_.get("pwd")
+            if isinstance(blob, str):
+                try:
+                    plain = base64.b64decode(blob.encode("utf-8")).decode("utf-8", errors="replace")
+                except Exception:
+                    plain = ""
+                enc = self._encrypt(plain)
+                if enc is not None:
+                    p_["pwd"] = enc
+                    changed = True
+        if changed:
+            self._save()
+        return changed
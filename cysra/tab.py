@@ -0,0 +1,642 @@
+import os
+import json
+import secrets
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QFrame, QProgressBar, QToolButton
+)
+from PyQt5.QtWebEngineWidgets import (
+    QWebEngineView, QWebEngineProfile, QWebEngineSettings, QWebEnginePage
+)
+from PyQt5.QtCore import QUrl, Qt, QTimer, pyqtSignal, QSize
+
+from .home import HOME_URL, home_data, is_home_url, scheme_registered
+from .icons import get_svg_icon
+from .injection import ISOLATED, READY, sync_scripts
+from .cpu import process_cpu_seconds
+from .network import SAVER_MAX_BG_SCAN, SAVER_MAX_PIXELS, DataSaverInterceptor
+from .paths import HOME_HTML, ICONS_DIR
+from .perf import perf_limit
+from .scripts import (
+    AUTOFILL_JS, AUTOFILL_PROBE_JS, BACKGROUND_JS, DATA_SAVER_JS, FOREGROUND_JS,
+    NAV_TIMING_JS, OPT_JS
+)
+from .theme import p
+from .ui.addressbar import AddressBar
+from .ui.favorites import FavoriteDialog
+
+HAS_LIFECYCLE = hasattr(QWebEnginePage, "setLifecycleState")
+BFCACHE_SCHEMES = ("http", "https", "file", "cysra")
+# A prerendered page was loaded with a plain GET, so it can only stand in for
+# a link click or a typed URL; form posts, reloads, back/forward and
+# redirects always go to the network.
+PRERENDER_NAV_TYPES = (QWebEnginePage.NavigationTypeLinkClicked,
+                       QWebEnginePage.NavigationTypeTyped)
+
+
+class SecurePage(QWebEnginePage):
+    def __init__(self, profile, parent=None):
+        super().__init__(profile, parent)
+        self.before_navigate = None
+        self.on_message = None
+        self.token = secrets.token_hex(8)
+
+    def acceptNavigationRequest(self, url, nav_type, is_main_frame):
+        # before_navigate may veto by returning False, e.g. to swap in a page.
+        if is_main_frame and self.before_navigate is not None:
+            if self.before_navigate(url, nav_type) is False:
+                return False
+        return super().acceptNavigationRequest(url, nav_type, is_main_frame)
+
+    def javaScriptConsoleMessage(self, level, msg, line, src):
+        # Injected scripts report back as "cysra:<kind>[:<token>] <payload>".
+        # Isolated-world scripts sign with this page's token, which page
+        # scripts cannot read, so forged messages arrive unsigned.
+        if msg.startswith("cysra:") and self.on_message is not None:
+            head, _, payload = msg[6:].partition(" ")
+            kind, _, token = head.partition(":")
+            self.on_message(kind, payload, token == self.token)
+
+    def javaScriptAlert(self, url, msg):
+        pass
+
+    def certificateError(self, error):
+        return False
+
+    def probe_autofill(self, store, done):
+        # Reports whether this exact origin has a saved login and a visible,
+        # empty password field; nothing is filled until the user asks.
+        url = self.url().toString()
+        if not url.startswith("https://") or not store.is_unlocked or not store.credentials_for(url):
+            done(False)
+            return
+        self.runJavaScript(AUTOFILL_PROBE_JS, ISOLATED,
+                           lambda found: done(bool(found) and self.url().toString() == url))
+
+    def autofill(self, store):
+        url = self.url().toString()
+        if not url.startswith("https://") or not store.is_unlocked:
+            return
+        creds = store.credentials_for(url)
+        if not creds:
+            return
+        site, user = creds[0]["site"], creds[0]["user"]
+        pwd = store.reveal_password(site, user, touch=False)
+        if pwd is not None:
+            self.runJavaScript(AUTOFILL_JS % (json.dumps(user), json.dumps(pwd)), ISOLATED)
+
+
+class BrowserTab(QWidget):
+    titleChanged = pyqtSignal(str)
+    urlChanged   = pyqtSignal(str)
+
+    def __init__(self, main_window, store, secret=False, opt=False):
+        super().__init__()
+        self.mw     = main_window
+        self.store  = store
+        self.secret = secret
+        self._opt   = opt
+        self._background = False
+        self._home_stale = False
+        self._build()
+        if self._home_stale:
+            self._url_changed(self.view.url())
+        else:
+            self.load_home()
+
+    def _build(self):
+        if self.secret:
+            profile = self.mw.private_sessions.acquire()
+        else:
+            profile = QWebEngineProfile.defaultProfile()
+        self.profile = profile
+
+        self.view = QWebEngineView(self)
+        self.page = None
+        self._back = []
+        self._forward = []
+        self._fresh_url = None
+        self._perf_mode = self.store.perf_mode
+        self.saver = None
+        self.opt_stats = None
+        warm = None if self.secret else self.mw.prerender.take_home(profile)
+        if warm is not None:
+            # A home page rendered ahead of time; its data may be a little
+            # old, so it is refreshed once the tab is wired up.
+            page, loaded = warm
+            self._attach_page(page)
+            self._home_stale = True
+            if loaded:
+                QTimer.singleShot(0, lambda: self._load_done(True))
+        else:
+            self._attach_page(SecurePage(profile, self))
+        self._apply_data_saver()
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(0, 0, 0, 0)
+        root.setSpacing(0)
+
+        bar = QFrame()
+        bar.setObjectName("toolbar")
+        bar.setFixedHeight(48)
+        bl  = QHBoxLayout(bar)
+        bl.setContentsMargins(8, 0, 8, 0)
+        bl.setSpacing(4)
+
+        icons_path = ICONS_DIR
+
+        nav_items = [
+            ("back",    "back.svg",    self.go_back),
+            ("forward", "forward.svg", self.go_forward),
+            ("reload",  "reload.svg",  self.view.reload),
+            ("home",    "home.svg",    self.load_home),
+        ]
+        self._nav_btns = {}
+        for key, icon_name, fn in nav_items:
+            btn = QToolButton()
+            btn.setObjectName("navBtn")
+            btn.setFixedSize(32, 32)
+            btn.setCursor(Qt.PointingHandCursor)
+            icon_file = os.path.join(icons_path, icon_name)
+            if os.path.exists(icon_file):
+                btn.setIcon(get_svg_icon(icon_file, p("accent")))
+            else:
+                btn.setText(key[0].upper())
+            btn.clicked.connect(fn)
+            bl.addWidget(btn)
+            self._nav_btns[key] = (btn, icon_file)
+
+        self.addr = AddressBar(self)
+        self.addr.navigateRequested.connect(self.navigate)
+        self.addr.favoriteToggled.connect(self._toggle_favorite)
+        self.addr.autofillRequested.connect(self._autofill)
+        if not self.secret:
+            self.addr.typing.connect(self.mw.predictor.predict)
+        bl.addWidget(self.addr, 1)
+
+        self.code_btn = QToolButton()
+        self.code_btn.setObjectName("navBtn")
+        self.code_btn.setFixedSize(32, 32)
+        btn_icon = os.path.join(icons_path, "code.svg")
+        if os.path.exists(btn_icon):
+            self.code_btn.setIcon(get_svg_icon(btn_icon, p("accent")))
+        self.code_btn.clicked.connect(self._view_source)
+        bl.addWidget(self.code_btn)
+
+        self.opt_btn = QToolButton()
+        self.opt_btn.setObjectName("navBtn")
+        self.opt_btn.setFixedSize(32, 32)
+        opt_icon = os.path.join(icons_path, "opt.svg")
+        if os.path.exists(opt_icon):
+            self.opt_btn.setIcon(get_svg_icon(opt_icon, p("accent")))
+        self.opt_btn.setCheckable(True)
+        self.opt_btn.toggled.connect(self._on_opt)
+        bl.addWidget(self.opt_btn)
+
+        self.dl_btn = QToolButton()
+        self.dl_btn.setObjectName("navBtn")
+        self.dl_btn.setFixedSize(32, 32)
+        dl_icon = os.path.join(icons_path, "downloads.svg")
+        if os.path.exists(dl_icon):
+            self.dl_btn.setIcon(get_svg_icon(dl_icon, p("accent")))
+        self.dl_btn.setToolTip("Downloads  (Ctrl+J)")
+        self.dl_btn.clicked.connect(lambda: self.mw._on_icon_clicked("dl"))
+        bl.addWidget(self.dl_btn)
+
+        root.addWidget(bar)
+
+        self.prog = QProgressBar()
+        self.prog.setFixedHeight(3)
+        self.prog.setTextVisible(False)
+        self.prog.setRange(0, 100)
+        self.prog.setValue(0)
+        root.addWidget(self.prog)
+
+        root.addWidget(self.view, 1)
+
+        self.view.urlChanged.connect(self._url_changed)
+        self.view.titleChanged.connect(self.titleChanged)
+        self.view.loadStarted.connect(lambda: self.prog.setValue(10))
+        self.view.loadProgress.connect(self.prog.setValue)
+        self.view.loadFinished.connect(self._load_done)
+        if not self.secret:
+            self.view.iconChanged.connect(
+                lambda icon: self.mw.favicons.capture(self.view.url().toString(), icon))
+
+        self._bg_timer = QTimer(self)
+        self._bg_timer.setSingleShot(True)
+        self._bg_timer.timeout.connect(lambda: self.set_background(True))
+        self.store.favorite_added.connect(self._on_favorite_added)
+        self.store.favorite_removed.connect(self._on_favorite_removed)
+        self.store.setting_changed.connect(self._on_setting_changed)
+
+    def _attach_page(self, page):
+        # Any page shown by this tab - fresh, prerendered or restored - goes
+        # through here so hooks, interceptor, settings and scripts match.
+        page.setParent(self)
+        page.before_navigate = self._before_navigate
+        page.on_message = self._on_page_message
+        page.fullScreenRequested.connect(self._handle_fullscreen)
+        page.setAudioMuted(False)
+        if HAS_LIFECYCLE and page.lifecycleState() != QWebEnginePage.Active:
+            page.setLifecycleState(QWebEnginePage.Active)
+        self.page = page
+        self.view.setPage(page)
+        self._applied = {}
+        if self.saver is not None:
+            page.setUrlRequestInterceptor(self.saver)
+        self.apply_perf_mode(self._perf_mode)
+
+    def _detach_page(self):
+        page = self.page
+        page.before_navigate = None
+        page.on_message = None
+        page.fullScreenRequested.disconnect(self._handle_fullscreen)
+        if self.saver is not None:
+            page.setUrlRequestInterceptor(None)
+        page.setAudioMuted(True)
+        return page
+
+    def _suspend(self, page):
+        if HAS_LIFECYCLE and not page.isVisible():
+            page.setLifecycleState(QWebEnginePage.Frozen)
+
+    def _show_page(self, page, loaded=True):
+        old = self._detach_page()
+        self._attach_page(page)
+        self.opt_stats = None
+        if not page.url().isEmpty():
+            self._url_changed(page.url())
+            self.titleChanged.emit(page.title())
+        if loaded:
+            self._load_done(True)
+        return old
+
+    def _swap_prerendered(self, url, nav_type):
+        if self.secret or nav_type not in PRERENDER_NAV_TYPES:
+            return False
+        taken = self.mw.prerender.take(url, self.profile)
+        if taken is None:
+            return False
+        # Swapping inside acceptNavigationRequest would replace the page
+        # mid-callback; the navigation is vetoed and the swap runs next tick.
+        QTimer.singleShot(0, lambda: self._adopt(*taken))
+        return True
+
+    def _swap_fresh(self, url, nav_type):
+        # Typed URLs and links on the home page open in a new page so the one
+        # being left can wait frozen in the back/forward cache. Neither sends
+        # a Referer and both start a new branch of history anyway; ordinary
+        # link clicks stay in place with Chromium's own history.
+        current = self.page.url()
+        from_home = (nav_type == QWebEnginePage.NavigationTypeLinkClicked
+                     and is_home_url(current.toString()))
+        if (not (nav_type == QWebEnginePage.NavigationTypeTyped or from_home)
+                or url.scheme() not in BFCACHE_SCHEMES
+                or self.mw.bfcache.limit() <= 0):
+            return False
+        if current.isEmpty() or (url.adjusted(QUrl.RemoveFragment)
+                                 == current.adjusted(QUrl.RemoveFragment)):
+            return False
+        target = QUrl(url)
+        QTimer.singleShot(0, lambda: self._open_fresh(target))
+        return True
+
+    def _open_fresh(self, url):
+        self._fresh_url = url
+        self._adopt(SecurePage(self.profile, self), False)
+        self.page.load(url)
+
+    def _adopt(self, page, loaded):
+        for entry in self._forward:
+            self.mw.bfcache.release(entry)
+        self._forward = []
+        self._stash(self._back, self._show_page(page, loaded))
+
+    def _stash(self, stack, page):
+        entry = self.mw.bfcache.push(stack, page)
+        QTimer.singleShot(0, lambda: entry["page"] is page and self._suspend(page))
+
+    def _restore(self, entry, stack):
+        # The page being left goes onto the opposite stack; one the cache
+        # already dropped is loaded again from its URL.
+        page = self.mw.bfcache.restore(entry)
+        if page is not None:
+            old = self._show_page(page, False)
+            if is_home_url(page.url().toString()):
+                self._push_home_data()
+        else:
+            old = self._show_page(SecurePage(self.profile, self), False)
+            self.page.load(entry["url"])
+        if stack is None:
+            old.deleteLater()
+        else:
+            self._stash(stack, old)
+
+    def go_back(self):
+        if self.page.history().canGoBack() or not self._back:
+            self.view.back()
+            return
+        self._restore(self._back.pop(), self._forward)
+
+    def go_forward(self):
+        if self.page.history().canGoForward() or not self._forward:
+            self.view.forward()
+            return
+        self._restore(self._forward.pop(), self._back)
+
+    def release_cached(self):
+        for entry in self._back + self._forward:
+            self.mw.bfcache.release(entry)
+        self._back, self._forward = [], []
+
+    def apply_perf_mode(self, mode):
+        self._perf_mode = mode
+        self._apply_site_settings(self.view.url())
+        self._sync_page_scripts()
+
+    def _sync_page_scripts(self):
+        # Per-tab scripts live on the page; Chromium injects them on every
+        # load, so nothing is re-sent from here after the first install.
+        budget = perf_limit(self._perf_mode, "opt_budget_ms")
+        token = json.dumps(self.page.token)
+        sync_scripts(self.page.scripts(), {
+            "cysra-opt":   (OPT_JS % (budget, token), READY, ISOLATED, False) if self._opt else None,
+            "cysra-saver": (DATA_SAVER_JS % (SAVER_MAX_PIXELS, SAVER_MAX_BG_SCAN, token),
+                            READY, ISOLATED, False) if self.saver is not None else None,
+        })
+
+    def _apply_site_settings(self, url):
+        s = self.view.settings()
+        attrs = self.store.site_settings(url.toString(), self._perf_mode)
+        if self.saver is not None:
+            attrs["PlaybackRequiresUserGesture"] = True
+        for name, val in attrs.items():
+            if self._applied.get(name) != val:
+                s.setAttribute(getattr(QWebEngineSettings, name), val)
+                self._applied[name] = val
+
+    def set_foreground(self, on):
+        if on:
+            self._bg_timer.stop()
+            self.set_background(False)
+        elif not self._background:
+            self._bg_timer.start(perf_limit(self.store.perf_mode, "throttle_delay_ms"))
+
+    def set_background(self, on):
+        if on == self._background:
+            return
+        self._background = on
+        if on:
+            self.page.runJavaScript(BACKGROUND_JS % ("false" if HAS_LIFECYCLE else "true"),
+                                    self._freeze)
+        else:
+            if HAS_LIFECYCLE and self.page.lifecycleState() != QWebEnginePage.Active:
+                self.page.setLifecycleState(QWebEnginePage.Active)
+            self.page.runJavaScript(FOREGROUND_JS)
+
+    def _freeze(self, _result=None):
+        # A visible page cannot be frozen; the tab may have come back meanwhile.
+        if self._background and HAS_LIFECYCLE and not self.view.isVisible():
+            self.page.setLifecycleState(QWebEnginePage.Frozen)
+
+    def state_label(self):
+        if not self._background:
+            return "active" if self.view.isVisible() else "hidden"
+        if HAS_LIFECYCLE and self.page.lifecycleState() == QWebEnginePage.Frozen:
+            return "frozen"
+        return "throttled"
+
+    def is_loading(self):
+        return 0 < self.prog.value() < 100
+
+    def cpu_pid(self):
+        try:
+            return self.page.renderProcessPid()
+        except AttributeError:
+            return 0
+
+    def cpu_seconds(self):
+        return process_cpu_seconds(self.cpu_pid())
+
+    def _before_navigate(self, url, nav_type):
+        if self._swap_prerendered(url.toString(), nav_type) or self._swap_fresh(url, nav_type):
+            return False
+        self.opt_stats = None
+        if self.saver is not None:
+            self.saver.reset_page()
+        self._apply_site_settings(url)
+
+    def _on_setting_changed(self, key):
+        if key == "site_rules":
+            self._apply_site_settings(self.view.url())
+        elif key == "data_saver":
+            self._apply_data_saver()
+            self._apply_site_settings(self.view.url())
+
+    def _apply_data_saver(self):
+        if self.store.data_saver and self.saver is None:
+            self.saver = DataSaverInterceptor(self)
+            self.page.setUrlRequestInterceptor(self.saver)
+        elif not self.store.data_saver and self.saver is not None:
+            self.page.setUrlRequestInterceptor(None)
+            self.saver.reset_page()
+            self.store.add_data_saved(self.saver.take_pending())
+            self.saver.deleteLater()
+            self.saver = None
+        else:
+            return
+        self._sync_page_scripts()
+
+    def _on_page_message(self, kind, payload, signed):
+        # allow and opt come from isolated-world scripts; unsigned copies
+        # were logged by the page itself.
+        if kind == "allow" and signed and self.saver is not None:
+            try:
+                urls = json.loads(payload)
+            except ValueError:
+                return
+            if isinstance(urls, list):
+                self.saver.allow(u for u in urls if isinstance(u, str))
+        elif kind == "prerender" and not self.secret and is_home_url(self.view.url().toString()):
+            try:
+                url = json.loads(payload)
+            except ValueError:
+                return
+            if isinstance(url, str):
+                self.mw.prerender.start(url, self.profile)
+        elif kind == "opt" and signed:
+            try:
+                stats = json.loads(payload)
+            except ValueError:
+                return
+            if isinstance(stats, dict):
+                self.opt_stats = stats
+
+    def _refresh_icons(self):
+        icons_path = ICONS_DIR
+        for key, (btn, icon_file) in self._nav_btns.items():
+            if os.path.exists(icon_file):
+                btn.setIcon(get_svg_icon(icon_file, p("accent")))
+                btn.setIconSize(QSize(18, 18))
+        for btn, svg_name in [
+            (self.code_btn, "code.svg"),
+            (self.opt_btn,  "opt.svg"),
+            (self.dl_btn,   "downloads.svg"),
+        ]:
+            icon_file = os.path.join(icons_path, svg_name)
+            if os.path.exists(icon_file):
+                btn.setIcon(get_svg_icon(icon_file, p("accent")))
+                btn.setIconSize(QSize(18, 18))
+
+    def _url_changed(self, url):
+        s      = url.toString()
+        is_h   = is_home_url(s) or s in ("about:blank", "", "about:")
+        self.addr.set_url(s, is_h)
+        self.addr.set_autofill(False)
+        is_fav = self.store.is_favorite(s) if not is_h else False
+        self.addr.set_favorite(is_fav)
+        self.urlChanged.emit(s)
+        if not self.secret and not is_h:
+            title = self.view.title() or s
+            self.store.add_history(s, title)
+
+    def _on_favorite_added(self, fav):
+        if fav.get("url") == self.view.url().toString():
+            self.addr.set_favorite(True)
+
+    def _on_favorite_removed(self, url):
+        if url == self.view.url().toString():
+            self.addr.set_favorite(False)
+
+    def _load_done(self, ok):
+        self.prog.setValue(100)
+        QTimer.singleShot(300, lambda: self.prog.setValue(0))
+        if not ok:
+            if (self.page.url().isEmpty() and self._back
+                    and self.page.requestedUrl() == self._fresh_url):
+                # Nothing was committed, as with a link that turned into a
+                # download, so the page that was left comes straight back.
+                QTimer.singleShot(0, lambda: self._back and self._restore(self._back.pop(), None))
+                return
+            self.view.setHtml(self._error_html())
+            return
+        url = self.view.url().toString()
+        if not self.secret:
+            self.page.probe_autofill(self.store, self.addr.set_autofill)
+            if url.startswith(("http://", "https://")):
+                self.page.runJavaScript(NAV_TIMING_JS, ISOLATED,
+                                        lambda ms: self.mw.predictor.record_navigation(url, ms))
+        if self.saver is not None:
+            self.store.add_data_saved(self.saver.take_pending())
+        # cysra://home arrives with its data embedded; only the file:// page
+        # and pre-rendered copies need a push.
+        if is_home_url(url) and (self._home_stale or not url.startswith(HOME_URL)):
+            self._push_home_data()
+        self._home_stale = False
+
+    def _push_home_data(self):
+        data = json.dumps(home_data(
+            self.store, self.mw.favicons, self.mw.predictor, self.secret,
+            self.saver.saved_bytes if self.saver is not None else 0,
+        ))
+        self.page.runJavaScript(
+            "(function(){window._CYSRA=" + data + ";"
+            "if(typeof window.onCysraData==='function')"
+            "window.onCysraData(window._CYSRA);})();"
+        )
+
+    def _toggle_favorite(self):
+        url  = self.view.url().toString()
+        if not url or url.startswith("about:") or is_home_url(url):
+            return
+        if self.store.is_favorite(url):
+            FavoriteDialog(self.store, url, self.mw).exec_()
+            self.addr.set_favorite(self.store.is_favorite(url))
+        else:
+            title = self.view.title() or url
+            self.store.add_favorite(url, title)
+            self.addr.set_favorite(True)
+
+    def _autofill(self):
+        self.addr.set_autofill(False)
+        self.page.autofill(self.store)
+
+    def _view_source(self):
+        url = self.view.url().toString()
+        if url and not url.startswith("view-source:"):
+            self.view.setUrl(QUrl("view-source:" + url))
+
+    def _on_opt(self, on):
+        self._opt = on
+        self._sync_page_scripts()
+        if on:
+            self.page.runJavaScript(OPT_JS % (perf_limit(self._perf_mode, "opt_budget_ms"),
+                                              json.dumps(self.page.token)), ISOLATED)
+
+    def set_opt(self, on):
+        self.opt_btn.setChecked(on)
+
+    def load_home(self):
+        if scheme_registered():
+            self.view.setUrl(QUrl(HOME_URL))
+        elif os.path.exists(HOME_HTML):
+            self.view.setUrl(QUrl.fromLocalFile(HOME_HTML))
+        else:
+            self.view.setHtml(self._fallback_home())
+
+    def navigate(self, url):
+        if not url: return
+        if not url.startswith(("http://", "https://", "file://", "view-source:")):
+            if "." in url and " " not in url:
+                url = "https://" + url
+            else:
+                url = "https://www.google.com/search?q=" + url.replace(" ", "+")
+        self.addr.url_input.setText(url)
+        self.view.setUrl(QUrl(url))
+
+    def _handle_fullscreen(self, request):
+        request.accept()
+        if request.toggleOn():
+            self.mw.showFullScreen()
+        else:
+            self.mw.showNormal()
+
+    def focus_address(self):
+        self.addr.focus()
+
+    def _fallback_home(self):
+        return (
+            "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+            "<style>*{margin:0;padding:0;box-sizing:border-box}"
+            "body{background:" + p("bg") + ";color:" + p("text") + ";"
+            "font-family:-apple-system,'Segoe UI',sans-serif;"
+            "display:flex;flex-direction:column;align-items:center;"
+            "justify-content:center;height:100vh;gap:20px;}"
+            "h1{font-size:32px;font-weight:200;color:" + p("accent") + ";}"
+            "p{color:" + p("text2") + ";font-size:13px;}"
+            "input{background:" + p("input_bg") + ";color:" + p("text") + ";"
+            "border:1px solid " + p("input_bdr") + ";border-radius:28px;"
+            "padding:13px 22px;font-size:14px;width:500px;outline:none;font-family:inherit;}"
+            "input:focus{border-color:" + p("accent") + ";}"
+            "</style></head><body>"
+            "<h1>Cysra Anome</h1>"
+            "<p>Your browser. Your rules.</p>"
+            "<input type='text' placeholder='Search or enter an address' id='q'"
+            " onkeydown=\"if(event.key==='Enter')window.location="
+            "'https://www.google.com/search?q='+encodeURIComponent(this.value)\">"
+            "</body></html>"
+        )
+
+    def _error_html(self):
+        return (
+            "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+            "<style>body{background:" + p("bg") + ";color:" + p("text") + ";"
+            "font-family:-apple-system,'Segoe UI',sans-serif;"
+            "display:flex;flex-direction:column;align-items:center;"
+            "justify-content:center;height:100vh;gap:10px;}"
+            "h2{font-size:20px;font-weight:500;}p{color:" + p("text2") + ";font-size:13px;}"
+            "</style></head><body>"
+            "<h2>Page could not be loaded</h2>"
+            "<p>Check the address or your connection and try again.</p>"
+            "</body></html>"
+        )
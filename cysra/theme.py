@@ -0,0 +1,304 @@
+PALETTES = {
+    "dark": {
+        "bg":             "#0b0b0e",
+        "toolbar":        "rgba(26, 26, 30, 0.4)",
+        "sidebar":        "rgba(19, 19, 23, 0.7)",
+        "tab_strip":      "transparent",
+        "tab_bg":         "transparent",
+        "tab_active":     "rgba(255, 255, 255, 0.08)",
+        "tab_text":       "#a0a0a5",
+        "tab_active_txt": "#ffffff",
+        "url_bg":         "rgba(255, 255, 255, 0.05)",
+        "url_focus_bg":   "rgba(255, 255, 255, 0.1)",
+        "url_focus_bdr":  "#7aa2f7",
+        "btn_hover":      "rgba(255, 255, 255, 0.08)",
+        "accent":         "#7aa2f7",
+        "accent2":        "#9abcfc",
+        "text":           "#c0caf5",
+        "text2":          "#9499b8",
+        "text3":          "#565f89",
+        "border":         "rgba(255, 255, 255, 0.08)",
+        "card":           "rgba(30, 30, 36, 0.6)",
+        "icon_bar":       "transparent",
+        "panel_bg":       "#131317",
+        "panel_hdr":      "#1a1a1e",
+        "input_bg":       "rgba(255, 255, 255, 0.05)",
+        "input_bdr":      "rgba(255, 255, 255, 0.1)",
+        "success":        "#9ece6a",
+        "warning":        "#e0af68",
+        "danger":         "#f7768e",
+        "scrollbar":      "rgba(255, 255, 255, 0.1)",
+        "selection":      "#364a82",
+        "star_off":       "#565f89",
+        "star_on":        "#e0af68",
+        "tag_bg":         "rgba(122, 162, 247, 0.15)",
+        "ext_colors":     ["#7aa2f7", "#9ece6a", "#f7768e", "#e0af68",
+                           "#bb9af7", "#7dcfff", "#b4f9f8", "#ff9e64"],
+    },
+    "light": {
+        "bg":             "#fdfdfe",
+        "toolbar":        "rgba(255, 255, 255, 0.7)",
+        "sidebar":        "rgba(255, 255, 255, 0.8)",
+        "tab_strip":      "transparent",
+        "tab_bg":         "transparent",
+        "tab_active":     "#ffffff",
+        "tab_text":       "#5f6368",
+        "tab_active_txt": "#1a73e8",
+        "url_bg":         "#f1f3f4",
+        "url_focus_bg":   "#ffffff",
+        "url_focus_bdr":  "#1a73e8",
+        "btn_hover":      "rgba(0, 0, 0, 0.06)",
+        "accent":         "#1a73e8",
+        "accent2":        "#4285f4",
+        "text":           "#202124",
+        "text2":          "#5f6368",
+        "text3":          "#9aa0a6",
+        "border":         "rgba(0, 0, 0, 0.06)",
+        "card":           "rgba(255, 255, 255, 0.8)",
+        "icon_bar":       "transparent",
+        "panel_bg":       "#ffffff",
+        "panel_hdr":      "#f4f5f8",
+        "input_bg":       "#ffffff",
+        "input_bdr":      "#d8dee9",
+        "success":        "#a3be8c",
+        "warning":        "#ebcb8b",
+        "danger":         "#bf616a",
+        "scrollbar":      "rgba(0, 0, 0, 0.1)",
+        "selection":      "#d8dee9",
+        "star_off":       "#4c566a",
+        "star_on":        "#ebcb8b",
+        "tag_bg":         "rgba(94, 129, 172, 0.15)",
+        "ext_colors":     ["#5e81ac", "#a3be8c", "#bf616a", "#ebcb8b",
+                           "#b48ead", "#88c0d0", "#8fbcbb", "#d08770"],
+    },
+}
+
+_theme = "dark"
+
+
+def p(k):
+    return PALETTES[_theme][k]
+
+
+def set_theme(name):
+    global _theme
+    _theme = name
+
+
+def current_theme():
+    return _theme
+
+
+def build_stylesheet(perf_mode="medium"):
+    theme_palette = dict(PALETTES[_theme])
+    if perf_mode in ("lowest", "low"):
+        if _theme == "dark":
+            theme_palette["toolbar"] = "#1a1a1e"
+            theme_palette["sidebar"] = "#131317"
+            theme_palette["card"] = "#1e1e24"
+        else:
+            theme_palette["toolbar"] = "#ffffff"
+            theme_palette["sidebar"] = "#ffffff"
+            theme_palette["card"] = "#ffffff"
+    elif perf_mode == "high":
+        if _theme == "dark":
+            theme_palette["toolbar"] = "rgba(26, 26, 30, 0.45)"
+            theme_palette["sidebar"] = "rgba(19, 19, 23, 0.55)"
+            theme_palette["card"] = "rgba(30, 30, 36, 0.55)"
+        else:
+            theme_palette["toolbar"] = "rgba(255, 255, 255, 0.45)"
+            theme_palette["sidebar"] = "rgba(255, 255, 255, 0.55)"
+            theme_palette["card"] = "rgba(255, 255, 255, 0.55)"
+
+    return (
+        """
+QWidget {{
+    background: {bg};
+    color: {text};
+    font-family: 'Inter', -apple-system, sans-serif;
+    font-size: 13px;
+    outline: none;
+}}
+QLineEdit, QTextEdit, QComboBox {{
+    background: {input_bg};
+    color: {text};
+    border: 1px solid {input_bdr};
+    border-radius: 16px;
+    padding: 10px 12px;
+}}
+QLineEdit:focus, QTextEdit:focus, QComboBox:focus {{
+    border-color: {accent};
+}}
+QLineEdit::placeholder, QTextEdit::placeholder {{
+    color: {text3};
+}}
+QLabel#sectionHead {{ background: transparent; color: {accent}; }}
+QPushButton#accentBtn {{
+    background: {accent};
+    color: #ffffff;
+    border: none;
+    border-radius: 16px;
+    font-weight: 700;
+}}
+QPushButton#accentBtn:hover {{ background: {accent2}; }}
+QPushButton#accentBtn:pressed {{ background: {accent}; }}
+QPushButton#dangerBtn {{ background: {danger}; color: #ffffff; font-weight: 700; }}
+QPushButton#dangerBtn:hover {{ background: {danger}cc; }}
+QLabel#mutedLabel {{ color: {text3}; background: transparent; }}
+QMainWindow {{ background: {bg}; }}
+
+QFrame#sidebar {{
+    background: {sidebar};
+    border-right: 1px solid {border};
+}}
+
+QFrame#tabPanel {{
+    background: {sidebar};
+    border-left: 1px solid {border};
+    border-top-left-radius: 20px;
+    border-bottom-left-radius: 20px;
+}}
+
+QWidget#tabPanelHeader {{
+    background: transparent;
+}}
+
+QListWidget#tabList {{
+    background: transparent;
+    border: none;
+    padding: 12px;
+}}
+QListWidget#tabList::item {{
+    background: transparent;
+    color: {tab_text};
+    border-radius: 20px;
+    margin-bottom: 4px;
+    padding: 0;
+}}
+QListWidget#tabList::item:selected {{
+    background: {tab_active};
+    color: {tab_active_txt};
+}}
+QListWidget#tabList::item:hover:!selected {{
+    background: {btn_hover};
+}}
+
+QPushButton#tabCloseBtn {{
+    border-radius: 10px;
+    background: transparent;
+    color: {text3};
+    font-size: 16px;
+    padding: 0;
+}}
+QPushButton#tabCloseBtn:hover {{
+    background: {danger};
+    color: #ffffff;
+}}
+
+QFrame#toolbar {{
+    background: {toolbar};
+    border-bottom: 1px solid {border};
+    border-radius: 24px;
+    margin: 6px 10px;
+}}
+QFrame#iconBar {{
+    background: transparent;
+    border: none;
+}}
+QFrame#slidePanel {{
+    background: {panel_bg};
+    border-right: 1px solid {border};
+    border-top-right-radius: 20px;
+    border-bottom-right-radius: 20px;
+}}
+QFrame#panelHeader {{
+    background: {panel_hdr};
+    border-bottom: 1px solid {border};
+}}
+QFrame#card {{
+    background: {card};
+    border: 1px solid {border};
+    border-radius: 24px;
+}}
+QFrame#urlFrame {{
+    background: {url_bg};
+    border: 1px solid transparent;
+    border-radius: 24px;
+}}
+QFrame#urlFrame[focused="true"] {{
+    border-color: {accent};
+    background: {url_focus_bg};
+}}
+
+QPushButton {{
+    background: transparent;
+    color: {text2};
+    border: none;
+    border-radius: 16px;
+    padding: 10px 18px;
+}}
+QPushButton:hover {{ background: {btn_hover}; color: {text}; }}
+QPushButton:pressed {{ background: {btn_hover}; }}
+
+QToolButton#navBtn {{
+    background: transparent;
+    border: none;
+    border-radius: 18px;
+}}
+QToolButton#navBtn:hover {{ background: {btn_hover}; }}
+
+QPushButton#iconBtn {{
+    border-radius: 14px;
+    background: transparent;
+    color: {text3};
+    padding: 0;
+}}
+QPushButton#iconBtn:hover {{
+    background: {btn_hover};
+}}
+QPushButton#iconBtn[active="true"] {{
+    background: {tag_bg};
+    color: {accent};
+    border: 1.5px solid {accent}26;
+}}
+
+QProgressBar {{ background: transparent; height: 2px; }}
+QProgressBar::chunk {{ background: {accent}; }}
+
+QScrollBar:vertical {{ background: transparent; width: 4px; }}
+QScrollBar::handle:vertical {{ background: {scrollbar}; border-radius: 2px; }}
+
+QMenu {{
+    background: {card};
+    border: 1px solid {border};
+    border-radius: 20px;
+    padding: 8px;
+}}
+QMenu::item {{ padding: 10px 24px; border-radius: 12px; }}
+QMenu::item:selected {{ background: {btn_hover}; }}
+"""
+    ).format(
+        bg=theme_palette["bg"],
+        toolbar=theme_palette["toolbar"],
+        sidebar=theme_palette["sidebar"],
+        tab_active=theme_palette["tab_active"],
+        tab_text=theme_palette["tab_text"],
+        tab_active_txt=theme_palette["tab_active_txt"],
+        url_bg=theme_palette["url_bg"],
+        url_focus_bg=theme_palette["url_focus_bg"],
+        btn_hover=theme_palette["btn_hover"],
+        accent=theme_palette["accent"],
+        accent2=theme_palette["accent2"],
+        text=theme_palette["text"],
+        text2=theme_palette["text2"],
+        text3=theme_palette["text3"],
+        border=theme_palette["border"],
+        card=theme_palette["card"],
+        panel_bg=theme_palette["panel_bg"],
+        panel_hdr=theme_palette["panel_hdr"],
+        input_bg=theme_palette["input_bg"],
+        input_bdr=theme_palette["input_bdr"],
+        danger=theme_palette["danger"],
+        scrollbar=theme_palette["scrollbar"],
+        tag_bg=theme_palette["tag_bg"],
+    )
@@ -0,0 +1,46 @@
+import sys
+import json
+import time
+
+from .paths import TRACE_FILE
+
+
+class StartupTrace:
+    def __init__(self, t0):
+        self.enabled = False
+        self.phases = []
+        self._t0 = t0
+        self._last = t0
+        self._done = False
+
+    def start(self):
+        self._t0 = self._last = time.perf_counter()
+
+    def mark(self, phase):
+        if not self.enabled or self._done:
+            return
+        now = time.perf_counter()
+        self.phases.append({
+            "phase":   phase,
+            "ms":      round((now - self._last) * 1000.0, 2),
+            "at_ms":   round((now - self._t0) * 1000.0, 2),
+        })
+        self._last = now
+
+    def finish(self, phase="first paint"):
+        if not self.enabled or self._done:
+            return
+        self.mark(phase)
+        self._done = True
+        lines = ["Cysra startup trace:"]
+        for ph in self.phases:
+            lines.append(f"  {ph['phase']:<28}{ph['ms']:>10.1f} ms{ph['at_ms']:>10.1f} ms")
+        sys.stderr.write("\n".join(lines) + "\n")
+        try:
+            with open(TRACE_FILE, "w", encoding="utf-8") as f:
+                json.dump({"phases": self.phases}, f, indent=2)
+        except Exception:
+            pass
+
+
+STARTUP_TRACE = StartupTrace(time.perf_counter())
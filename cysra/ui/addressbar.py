@@ -0,0 +1,189 @@
+import os
+from PyQt5.QtWidgets import (
+    QHBoxLayout, QPushButton, QLineEdit, QLabel, QFrame,
+    QGraphicsDropShadowEffect
+)
+from PyQt5.QtCore import QUrl, Qt, pyqtSignal, QSize, QTimer
+from PyQt5.QtGui import QColor
+
+from ..calc import looks_like_math, safe_eval
+from ..icons import get_svg_icon
+from ..paths import ICONS_DIR
+from ..theme import p
+from ..workers import submit
+
+
+class AddressBar(QFrame):
+    navigateRequested = pyqtSignal(str)
+    favoriteToggled   = pyqtSignal()
+    autofillRequested = pyqtSignal()
+    typing            = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("urlFrame")
+        self._is_favorite = False
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(16, 0, 12, 0)
+        layout.setSpacing(8)
+        
+        self.sec_label = QLabel()
+        self.sec_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.sec_label)
+
+        self.url_input = QLineEdit()
+        self.url_input.setObjectName("urlInput")
+        self.url_input.setPlaceholderText("Search or enter web address")
+        self.url_input.setStyleSheet("background: transparent; border: none; padding: 0;")
+        self.url_input.returnPressed.connect(
+            lambda: self.navigateRequested.emit(self.url_input.text().strip())
+        )
+        layout.addWidget(self.url_input, 1)
+
+        self.calc_label = QLabel()
+        self.calc_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.calc_label.setStyleSheet(
+            "font-size:12px;font-weight:700;background:transparent;"
+            "color:" + p("accent") + ";padding:0 2px;"
+        )
+        self.calc_label.hide()
+        layout.addWidget(self.calc_label)
+
+        self._calc_timer = QTimer(self)
+        self._calc_timer.setSingleShot(True)
+        self._calc_timer.setInterval(120)
+        self._calc_timer.timeout.connect(self._run_calc)
+        self.url_input.textEdited.connect(self._on_text_edited)
+
+        self._typing_timer = QTimer(self)
+        self._typing_timer.setSingleShot(True)
+        self._typing_timer.setInterval(150)
+        self._typing_timer.timeout.connect(lambda: self.typing.emit(self.url_input.text()))
+
+        self.key_btn = QPushButton("")
+        self.key_btn.setFixedSize(28, 28)
+        self.key_btn.setCursor(Qt.PointingHandCursor)
+        self.key_btn.setToolTip("Fill saved login")
+        self.key_btn.setStyleSheet("background:transparent;border:none;")
+        self.key_btn.clicked.connect(lambda: self.autofillRequested.emit())
+        self.key_btn.hide()
+        layout.addWidget(self.key_btn)
+
+        self.star_btn = QPushButton("")
+        self.star_btn.setFixedSize(28, 28)
+        self.star_btn.setCursor(Qt.PointingHandCursor)
+        self.star_btn.clicked.connect(lambda: self.favoriteToggled.emit())
+        layout.addWidget(self.star_btn)
+
+        def on_focus_in(ev):
+            self.setProperty("focused", True)
+            self.style().unpolish(self)
+            self.style().polish(self)
+            self.url_input.selectAll()
+            QLineEdit.focusInEvent(self.url_input, ev)
+            
+            perf = "medium"
+            try:
+                perf = self.parent().store.perf_mode
+            except Exception:
+                pass
+            if perf in ("medium", "high"):
+                glow = QGraphicsDropShadowEffect(self)
+                glow.setBlurRadius(15 if perf == "high" else 8)
+                glow.setColor(QColor(p("accent")))
+                glow.setOffset(0, 0)
+                self.setGraphicsEffect(glow)
+
+        def on_focus_out(ev):
+            self.setProperty("focused", False)
+            self.style().unpolish(self)
+            self.style().polish(self)
+            QLineEdit.focusOutEvent(self.url_input, ev)
+            self.setGraphicsEffect(None)
+
+        self.url_input.focusInEvent = on_focus_in
+        self.url_input.focusOutEvent = on_focus_out
+
+    def _on_text_edited(self, text):
+        self._typing_timer.start()
+        if looks_like_math(text):
+            self._calc_timer.start()
+        else:
+            self._calc_timer.stop()
+            self.calc_label.hide()
+
+    def _run_calc(self):
+        expr = self.url_input.text()
+        submit(safe_eval, expr, on_done=lambda res: self._show_calc(expr, res))
+
+    def _show_calc(self, expr, result):
+        if expr != self.url_input.text():
+            return
+        if isinstance(result, str) or result is None:
+            self.calc_label.hide()
+            return
+        if isinstance(result, float):
+            result = round(result, 10)
+        self.calc_label.setText("= " + str(result))
+        self.calc_label.show()
+
+    def set_url(self, url_str, is_home=False):
+        self.calc_label.hide()
+        self.url_input.setText("" if is_home else url_str)
+        scheme = QUrl(url_str).scheme() if url_str else ""
+        if scheme == "https":
+            self.sec_label.setText("HTTPS")
+            self.sec_label.setStyleSheet(
+                "font-size:10px;font-weight:700;background:transparent;"
+                "color:" + p("success") + ";padding:0 2px;"
+            )
+        elif scheme == "http":
+            self.sec_label.setText("HTTP")
+            self.sec_label.setStyleSheet(
+                "font-size:10px;font-weight:700;background:transparent;"
+                "color:" + p("warning") + ";padding:0 2px;"
+            )
+        else:
+            self.sec_label.setText("")
+            self.sec_label.setStyleSheet(
+                "font-size:10px;font-weight:700;background:transparent;"
+                "color:" + p("text3") + ";padding:0 2px;"
+            )
+
+    def set_favorite(self, on):
+        self._is_favorite = on
+        icons_path = ICONS_DIR
+        if on:
+            icon_file = os.path.join(icons_path, "fav.svg")
+            color = p("star_on")
+        else:
+            icon_file = os.path.join(icons_path, "fav_outline.svg")
+            color = p("star_off")
+        
+        if os.path.exists(icon_file):
+            self.star_btn.setIcon(get_svg_icon(icon_file, color))
+            self.star_btn.setIconSize(QSize(18, 18))
+        else:
+            self.star_btn.setText("★" if on else "☆")
+
+        self.star_btn.setStyleSheet(
+            "QPushButton#starBtn{background:transparent;border:none;border-radius:14px;}"
+            "QPushButton#starBtn:hover{background:" + p("btn_hover") + ";}"
+        )
+        tip = "Edit Favorite (Ctrl+D)" if on else "Add to Favorites (Ctrl+D)"
+        self.star_btn.setToolTip(tip)
+
+    def set_autofill(self, available):
+        if available:
+            icon_file = os.path.join(ICONS_DIR, "key.svg")
+            if os.path.exists(icon_file):
+                self.key_btn.setIcon(get_svg_icon(icon_file, p("accent")))
+                self.key_btn.setIconSize(QSize(16, 16))
+            else:
+                self.key_btn.setText("⚿")
+        self.key_btn.setVisible(available)
+
+    def focus(self):
+        self.url_input.selectAll()
+        self.url_input.setFocus()
@@ -0,0 +1,90 @@
+import os
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QListWidget,
+    QListWidgetItem, QProgressBar
+)
+
+from ..theme import p
+
+
+class DownloadsPage(QWidget):
+    def __init__(self):
+        super().__init__()
+        self._items = []
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(12, 10, 12, 10)
+        lay.setSpacing(8)
+
+        top = QHBoxLayout()
+        lbl = QLabel("Downloads")
+        lbl.setObjectName("sectionHead")
+        top.addWidget(lbl)
+        top.addStretch()
+        clr = QPushButton("Clear List")
+        clr.setObjectName("dangerBtn")
+        top.addWidget(clr)
+        lay.addLayout(top)
+
+        self.list = QListWidget()
+        clr.clicked.connect(self._clear_list)
+        lay.addWidget(self.list)
+
+    def _clear_list(self):
+        self.list.clear()
+        self._items.clear()
+
+    def add_item(self, download_item):
+        filename = os.path.basename(download_item.path())
+        item = QListWidgetItem()
+        self.list.insertItem(0, item)
+        self._items.append((item, download_item))
+        
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(5, 5, 5, 5)
+        
+        name_lbl = QLabel(filename)
+        name_lbl.setStyleSheet("font-weight: bold;")
+        layout.addWidget(name_lbl)
+        
+        prog = QProgressBar()
+        prog.setRange(0, 100)
+        prog.setValue(0)
+        prog.setFixedHeight(4)
+        prog.setTextVisible(False)
+        layout.addWidget(prog)
+        
+        status_lbl = QLabel("Starting...")
+        status_lbl.setStyleSheet("font-size: 10px; color: " + p("text3") + ";")
+        layout.addWidget(status_lbl)
+        
+        item.setSizeHint(container.sizeHint())
+        self.list.setItemWidget(item, container)
+        
+        def update_progress(received, total):
+            try:
+                if not prog.isVisible():
+                    return
+                if total > 0:
+                    val = int((received / total) * 100)
+                    prog.setValue(val)
+                    status_lbl.setText(f"{val}% - {received//1024}KB / {total//1024}KB")
+                else:
+                    status_lbl.setText(f"{received//1024}KB downloaded")
+            except RuntimeError:
+                pass
+
+        def finished():
+            try:
+                if not prog.isVisible():
+                    return
+                prog.setValue(100)
+                prog.hide()
+                status_lbl.setText("Completed")
+                status_lbl.setStyleSheet("font-size: 10px; color: " + p("success") + ";")
+            except RuntimeError:
+                pass
+
+        download_item.downloadProgress.connect(update_progress)
+        download_item.finished.connect(finished)
+        return item
@@ -0,0 +1,142 @@
+import os
+import traceback
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QMessageBox,
+    QFrame, QScrollArea, QDialog
+)
+from PyQt5.QtCore import Qt, pyqtSignal, QSize
+
+from ..icons import get_svg_icon, make_letter_pixmap
+from ..paths import APPS_DIR, ICONS_DIR
+from ..plugins import list_plugins, load_plugin
+from ..theme import build_stylesheet, p
+
+
+class ExtensionsPage(QWidget):
+    navigate = pyqtSignal(str)
+
+    def __init__(self, main_window):
+        super().__init__()
+        self.mw = main_window
+
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(12, 10, 12, 10)  
+        lay.setSpacing(8)
+
+        top = QHBoxLayout()
+        lbl = QLabel("Extensions")
+        lbl.setObjectName("sectionHead")
+        top.addWidget(lbl)
+        top.addStretch()
+        ref = QPushButton("Refresh")
+        ref.clicked.connect(self.refresh)
+        top.addWidget(ref)
+        lay.addLayout(top)
+
+        store_btn = QPushButton("  Open Chrome Web Store")
+        store_icon = os.path.join(ICONS_DIR, "extensions.svg")
+        if os.path.exists(store_icon):
+            store_btn.setIcon(get_svg_icon(store_icon, p("accent")))
+            store_btn.setIconSize(QSize(16, 16))
+        store_btn.setObjectName("accentBtn")
+        store_btn.setCursor(Qt.PointingHandCursor)
+        store_btn.setFixedHeight(36)
+        store_btn.setStyleSheet(
+            "QPushButton{background:" + p("tag_bg") + ";color:" + p("accent") + ";"
+            "border:1px solid " + p("accent") + "40;border-radius:12px;"
+            "padding:0 14px;font-size:12px;font-weight:600;text-align:left;}"
+            "QPushButton:hover{background:" + p("accent") + "20;}"
+        )
+        store_btn.clicked.connect(lambda: self.navigate.emit("https://chromewebstore.google.com/"))
+        lay.addWidget(store_btn)
+
+        hint2 = QLabel("Extensions from Google Chrome Web Store doesnt working due to technical limitations, but you can create custom ones by putting .py files with an AppWidget class in the myapps/ folder.")
+        hint2.setObjectName("mutedLabel")
+        hint2.setWordWrap(True)
+        hint2.setStyleSheet("font-size:10px;color:" + p("text3") + ";background:transparent;")
+        lay.addWidget(hint2)
+
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setFrameShape(QFrame.NoFrame)
+        inner = QWidget()
+        self._inner_lay = QVBoxLayout(inner)
+        self._inner_lay.setSpacing(6)
+        scroll.setWidget(inner)
+        lay.addWidget(scroll)
+        self.refresh()
+
+    def refresh(self):
+        while self._inner_lay.count():
+            child = self._inner_lay.takeAt(0)
+            if child.widget():
+                child.widget().deleteLater()
+
+        files = list_plugins()
+
+        colors = p("ext_colors")
+        if not files:
+            hint = QLabel("Put .py files with an AppWidget class\nin the  myapps/  folder.")
+            hint.setObjectName("mutedLabel")
+            hint.setAlignment(Qt.AlignCenter)
+            hint.setWordWrap(True)
+            self._inner_lay.addWidget(hint)
+        else:
+            for idx, fname in enumerate(files):
+                name = fname.replace(".py", "")
+                color = colors[idx % len(colors)]
+                path = os.path.join(APPS_DIR, fname)
+                row = self._make_row(name, color, path)
+                self._inner_lay.addWidget(row)
+        self._inner_lay.addStretch()
+
+    def _make_row(self, name, color, path):
+        btn = QPushButton()
+        btn.setFixedHeight(52)
+        btn.setCursor(Qt.PointingHandCursor)
+        btn.setStyleSheet(
+            "QPushButton{background:" + p("card") + ";border:1px solid " + p("border") + ";"
+            "border-radius:10px;text-align:left;padding:0 12px;}"
+            "QPushButton:hover{background:" + p("btn_hover") + ";border-color:" + p("accent") + ";}"
+        )
+
+        row_lay = QHBoxLayout(btn)
+        row_lay.setContentsMargins(0, 0, 0, 0)
+        row_lay.setSpacing(12)
+
+        avatar = QLabel()
+        avatar.setPixmap(make_letter_pixmap(name[0], color, 32))
+        avatar.setFixedSize(32, 32)
+        avatar.setAttribute(Qt.WA_TransparentForMouseEvents)
+        row_lay.addWidget(avatar)
+
+        lbl = QLabel(name)
+        lbl.setStyleSheet("font-size:13px;font-weight:600;color:" + p("text") + ";background:transparent;")
+        lbl.setAttribute(Qt.WA_TransparentForMouseEvents)
+        row_lay.addWidget(lbl, 1)
+
+        arrow = QLabel("›")
+        arrow.setStyleSheet("color:" + p("text2") + ";font-size:18px;background:transparent;")
+        arrow.setAttribute(Qt.WA_TransparentForMouseEvents)
+        row_lay.addWidget(arrow)
+
+        btn.clicked.connect(lambda _=False, p_=path, n=name, c=color: self._launch(p_, n, c))
+        return btn
+
+    def _launch(self, path, name, color):
+        try:
+            mod = load_plugin(path)
+            if hasattr(mod, "AppWidget"):
+                widget = mod.AppWidget()
+                dlg = QDialog(self.mw, Qt.Dialog)
+                dlg.setWindowTitle(name)
+                dlg.setMinimumSize(400, 300)
+                dlg.setStyleSheet(build_stylesheet(self.mw.store.perf_mode))
+                dlg_lay = QVBoxLayout(dlg)
+                dlg_lay.setContentsMargins(0, 0, 0, 0)
+                dlg_lay.addWidget(widget)
+                dlg.show()
+            else:
+                QMessageBox.information(self, name, "This extension has no AppWidget class.")
+        except Exception:
+            QMessageBox.critical(self, "Extension Error", traceback.format_exc())
@@ -0,0 +1,58 @@
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit, QComboBox, QPushButton
+)
+from PyQt5.QtCore import Qt
+
+from ..theme import build_stylesheet
+
+
+class FavoriteDialog(QDialog):
+    # Opened from the star of a page that is already a favorite: edits its
+    # title, folder and tags, or removes it.
+    def __init__(self, store, url, parent=None):
+        super().__init__(parent, Qt.Dialog)
+        self.store = store
+        self.url = url
+        fav = next((f for f in store.favorites if f.get("url") == url), {})
+        self.setWindowTitle("Edit Favorite")
+        self.setMinimumWidth(380)
+        self.setStyleSheet(build_stylesheet(store.perf_mode))
+
+        lay = QVBoxLayout(self)
+        form = QFormLayout()
+        self.title_in = QLineEdit(fav.get("title", url))
+        form.addRow("Title", self.title_in)
+        self.folder_in = QComboBox()
+        self.folder_in.setEditable(True)
+        self.folder_in.addItem("")
+        self.folder_in.addItems(store.favorite_folders())
+        self.folder_in.setCurrentText(fav.get("folder", ""))
+        form.addRow("Folder", self.folder_in)
+        self.tags_in = QLineEdit(", ".join(fav.get("tags") or []))
+        self.tags_in.setPlaceholderText("comma separated")
+        form.addRow("Tags", self.tags_in)
+        lay.addLayout(form)
+
+        row = QHBoxLayout()
+        remove_btn = QPushButton("Remove")
+        remove_btn.clicked.connect(self._remove)
+        row.addWidget(remove_btn)
+        row.addStretch()
+        save_btn = QPushButton("Save")
+        save_btn.setDefault(True)
+        save_btn.clicked.connect(self._save)
+        row.addWidget(save_btn)
+        lay.addLayout(row)
+
+    def _save(self):
+        self.store.update_favorite(
+            self.url,
+            title=self.title_in.text().strip() or self.url,
+            folder=self.folder_in.currentText().strip(),
+            tags=self.tags_in.text().split(","),
+        )
+        self.accept()
+
+    def _remove(self):
+        self.store.remove_favorite(self.url)
+        self.accept()
@@ -0,0 +1,112 @@
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QLabel,
+    QMessageBox, QListWidget, QListWidgetItem
+)
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+
+from ..history import HISTORY_LIMIT, entry_matches
+
+PRERENDER_DWELL_MS = 400
+
+
+class HistoryPage(QWidget):
+    navigate = pyqtSignal(str)
+    prerender = pyqtSignal(str)
+
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+        self._entries = []
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(12, 10, 12, 10)
+        lay.setSpacing(8)
+
+        top = QHBoxLayout()
+        self.search = QLineEdit()
+        self.search.setPlaceholderText("Filter…")
+        self.search.textChanged.connect(self._filter)
+        top.addWidget(self.search)
+
+        clr = QPushButton("Clear All")
+        clr.setObjectName("dangerBtn")
+        clr.clicked.connect(self._clear)
+        top.addWidget(clr)
+        lay.addLayout(top)
+
+        self.list = QListWidget()
+        self.list.itemDoubleClicked.connect(lambda i: self.navigate.emit(i.data(Qt.UserRole)))
+        self.list.currentItemChanged.connect(lambda *_: self._dwell.start())
+        lay.addWidget(self.list)
+
+        self._dwell = QTimer(self)
+        self._dwell.setSingleShot(True)
+        self._dwell.setInterval(PRERENDER_DWELL_MS)
+        self._dwell.timeout.connect(self._on_dwell)
+
+        hint = QLabel("Double-click to revisit")
+        hint.setObjectName("mutedLabel")
+        hint.setAlignment(Qt.AlignCenter)
+        lay.addWidget(hint)
+
+        store.history_added.connect(self._on_history_added)
+        store.history_cleared.connect(self._on_history_cleared)
+        self.refresh()
+
+    def _on_dwell(self):
+        item = self.list.currentItem()
+        if item is not None and not item.isHidden():
+            self.prerender.emit(item.data(Qt.UserRole))
+
+    def _make_item(self, entry):
+        item = QListWidgetItem()
+        title = entry.get("title", "") or entry.get("url", "")
+        if len(title) > 46:
+            title = title[:44] + "…"
+        item.setText(title + "\n" + entry.get("ts", ""))
+        item.setData(Qt.UserRole, entry.get("url", ""))
+        item.setToolTip(entry.get("url", ""))
+        return item
+
+    def refresh(self):
+        self.list.clear()
+        self._entries = list(self.store.history)
+        for entry in self._entries:
+            self.list.addItem(self._make_item(entry))
+        if self.search.text():
+            self._filter(self.search.text())
+
+    def _on_history_added(self, entry):
+        url = entry.get("url")
+        for i, old in enumerate(self._entries):
+            if old.get("url") == url:
+                del self._entries[i]
+                self.list.takeItem(i)
+                break
+        self._entries.insert(0, entry)
+        item = self._make_item(entry)
+        self.list.insertItem(0, item)
+        item.setHidden(not entry_matches(entry, self.search.text().lower()))
+        while len(self._entries) > HISTORY_LIMIT:
+            self._entries.pop()
+            self.list.takeItem(self.list.count() - 1)
+
+    def _on_history_cleared(self):
+        self._entries = []
+        self.list.clear()
+
+    def _filter(self, text):
+        t = (text or "").lower()
+        for i, entry in enumerate(self._entries):
+            item = self.list.item(i)
+            if item is not None:
+                item.setHidden(not entry_matches(entry, t))
+
+    def _clear(self):
+        reply = QMessageBox.question(
+            self, "Clear History",
+            "Delete all browsing history?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No,
+        )
+        if reply == QMessageBox.Yes:
+            self.store.clear_history()
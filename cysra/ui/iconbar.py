@@ -0,0 +1,89 @@
+import os
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QFrame
+from PyQt5.QtCore import Qt, pyqtSignal, QSize
+
+from ..icons import get_svg_icon
+from ..paths import ICONS_DIR
+from ..theme import p
+
+
+class IconBar(QFrame):
+    icon_clicked = pyqtSignal(str)
+    ITEMS = [
+        ("history",  "history",    "History"),
+        ("dl",       "downloads",  "Downloads"),
+        ("pass",     "lock",       "Passwords"),
+        ("ext",      "extensions", "Extensions"),
+        ("perf",     "perf",       "Performance"),
+        ("storage",  "storage",    "Storage"),
+        ("settings", "settings",   "Settings"),
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("iconBar")
+        self._active = None
+        self._buttons = {}
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addStretch(1)
+
+        inner = QWidget()
+        inner.setAttribute(Qt.WA_TranslucentBackground)
+        inner_lay = QVBoxLayout(inner)
+        inner_lay.setContentsMargins(8, 0, 8, 0)
+        inner_lay.setSpacing(4)
+        inner_lay.setAlignment(Qt.AlignHCenter)
+
+        icons_dir = ICONS_DIR
+        for key, svg_name, label_text in self.ITEMS:
+            btn = QPushButton()
+            btn.setObjectName("iconBtn")
+            btn.setProperty("active", False)
+            btn.setToolTip(label_text)
+            btn.setCursor(Qt.PointingHandCursor)
+            btn.setFixedSize(52, 52)
+            btn.setIconSize(QSize(26, 26))
+
+            icon_path = os.path.join(icons_dir, f"{svg_name}.svg")
+            if os.path.exists(icon_path):
+                btn.setIcon(get_svg_icon(icon_path, p("accent")))
+            else:
+                btn.setText(label_text[0])
+                btn.setStyleSheet("font-size:20px; font-weight:700;")
+
+            inner_lay.addWidget(btn, 0, Qt.AlignHCenter)
+            self._buttons[key] = (btn, icon_path)
+            btn.clicked.connect(lambda checked=False, k=key: self._on_click(k))
+
+        layout.addWidget(inner, 0, Qt.AlignHCenter)
+        layout.addStretch(1)
+
+    def _on_click(self, key):
+        self.icon_clicked.emit(key)
+
+    def refresh_icons(self):
+        for key, (btn, icon_path) in self._buttons.items():
+            if os.path.exists(icon_path):
+                btn.setIcon(get_svg_icon(icon_path, p("accent")))
+
+    def set_active(self, key):
+        self._active = key
+        for k, (btn, icon_path) in self._buttons.items():
+            is_active = (k == key)
+            btn.setProperty("active", is_active)
+            btn.style().unpolish(btn)
+            btn.style().polish(btn)
+            if os.path.exists(icon_path):
+                btn.setIcon(get_svg_icon(icon_path, p("accent")))
+
+    def clear_active(self):
+        self._active = None
+        for k, (btn, icon_path) in self._buttons.items():
+            btn.setProperty("active", False)
+            btn.style().unpolish(btn)
+            btn.style().polish(btn)
+            if os.path.exists(icon_path):
+                btn.setIcon(get_svg_icon(icon_path, p("accent")))
@@ -0,0 +1,182 @@
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QPlainTextEdit, QLabel,
+    QLineEdit, QListWidget, QListWidgetItem, QMessageBox
+)
+from PyQt5.QtCore import Qt, QTimer
+
+from ..notes import NotesStore
+from ..workers import submit
+
+AUTOSAVE_MS = 800
+
+
+class NotesPage(QWidget):
+    def __init__(self, store=None):
+        super().__init__()
+        self.notes = store or NotesStore()
+        self._current = None
+        self._version = 0
+        self._dirty = False
+        self._loading = False
+
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(12, 10, 12, 10)
+        lay.setSpacing(8)
+
+        top = QHBoxLayout()
+        lbl = QLabel("Notes")
+        lbl.setObjectName("sectionHead")
+        top.addWidget(lbl)
+        top.addStretch()
+        new_btn = QPushButton("New")
+        new_btn.setObjectName("accentBtn")
+        new_btn.setFixedHeight(28)
+        new_btn.clicked.connect(self._new)
+        top.addWidget(new_btn)
+        del_btn = QPushButton("Delete")
+        del_btn.setFixedHeight(28)
+        del_btn.clicked.connect(self._delete)
+        top.addWidget(del_btn)
+        lay.addLayout(top)
+
+        self.search = QLineEdit()
+        self.search.setPlaceholderText("Search notes…")
+        self.search.textChanged.connect(lambda _: self._search_timer.start())
+        lay.addWidget(self.search)
+
+        self.list = QListWidget()
+        self.list.setMaximumHeight(140)
+        self.list.currentItemChanged.connect(self._on_selected)
+        lay.addWidget(self.list)
+
+        self.editor = QPlainTextEdit()
+        self.editor.setPlaceholderText("Write anything…")
+        self.editor.textChanged.connect(self._on_edited)
+        lay.addWidget(self.editor, 1)
+
+        self.status = QLabel("")
+        self.status.setObjectName("mutedLabel")
+        lay.addWidget(self.status)
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(AUTOSAVE_MS)
+        self._save_timer.timeout.connect(self._flush)
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self._run_search)
+
+        self._populate(self.notes.notes())
+        if self.list.count():
+            self.list.setCurrentRow(0)
+
+    def _populate(self, notes):
+        self.list.blockSignals(True)
+        self.list.clear()
+        for note in notes:
+            item = QListWidgetItem(note.get("title") or "Untitled")
+            item.setData(Qt.UserRole, note["id"])
+            if note.get("snippet"):
+                item.setToolTip(note["snippet"])
+            self.list.addItem(item)
+            if note["id"] == self._current:
+                self.list.setCurrentItem(item)
+        self.list.blockSignals(False)
+
+    def _run_search(self):
+        query = self.search.text()
+        submit(self.notes.search, query,
+               on_done=lambda hits: self.search.text() == query and self._populate(hits))
+
+    def _on_selected(self, item, _prev=None):
+        if item is None:
+            return
+        note_id = item.data(Qt.UserRole)
+        if note_id == self._current:
+            return
+        self._flush()
+        self._open(note_id)
+
+    def _open(self, note_id):
+        self._current = note_id
+        if self.notes.is_large(note_id):
+            self._loading = True
+            self.editor.setReadOnly(True)
+            self._set_text("")
+            self.status.setText("Loading…")
+            submit(self.notes.read, note_id, on_done=lambda text: self._opened(note_id, text))
+        else:
+            self._opened(note_id, self.notes.read(note_id))
+
+    def _opened(self, note_id, text):
+        if note_id != self._current:
+            return
+        self._loading = False
+        self.editor.setReadOnly(False)
+        self._set_text(text)
+        self.status.setText("")
+
+    def _set_text(self, text):
+        self.editor.blockSignals(True)
+        self.editor.setPlainText(text)
+        self.editor.blockSignals(False)
+        self._dirty = False
+
+    def _on_edited(self):
+        if self._loading:
+            return
+        if self._current is None:
+            self._current = self.notes.create()
+            self._populate(self.notes.notes())
+        self._dirty = True
+        self.status.setText("Editing…")
+        self._save_timer.start()
+
+    def _flush(self):
+        self._save_timer.stop()
+        if not self._dirty or self._current is None:
+            return
+        self._dirty = False
+        self._version += 1
+        note_id, text = self._current, self.editor.toPlainText()
+        self.status.setText("Saving…")
+        submit(self.notes.write, note_id, text, self._version,
+               on_done=lambda _: self._saved(note_id),
+               on_error=lambda exc: self.status.setText("Could not save: " + str(exc)))
+
+    def _saved(self, note_id):
+        if note_id == self._current and not self._dirty:
+            self.status.setText("Saved")
+        meta = self.notes.meta(note_id)
+        for i in range(self.list.count()):
+            item = self.list.item(i)
+            if item.data(Qt.UserRole) == note_id and meta:
+                item.setText(meta.get("title") or "Untitled")
+
+    def _new(self):
+        self._flush()
+        self._current = self.notes.create()
+        self._set_text("")
+        self.search.clear()
+        self._populate(self.notes.notes())
+        self.editor.setFocus()
+
+    def _delete(self):
+        if self._current is None:
+            return
+        if QMessageBox.question(self, "Notes", "Delete this note?") != QMessageBox.Yes:
+            return
+        self._save_timer.stop()
+        self._dirty = False
+        self.notes.delete(self._current)
+        self._current = None
+        self._set_text("")
+        self._populate(self.notes.notes())
+        if self.list.count():
+            self.list.setCurrentRow(0)
+
+    def hideEvent(self, event):
+        self._flush()
+        super().hideEvent(event)
@@ -0,0 +1,190 @@
+import os
+from PyQt5.QtWidgets import (
+    QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QFrame, QStackedWidget
+)
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QSize, QPropertyAnimation, QEasingCurve
+)
+
+from ..icons import get_svg_icon
+from ..paths import ICONS_DIR
+from ..theme import p
+from .extensions import ExtensionsPage
+from .history import HistoryPage
+from .notes import NotesPage
+from .passwords import PasswordManagerPage
+from .performance import PerformancePage
+from .storage import StoragePage
+from .settings import SettingsPage
+from .translate import TranslatePage
+
+
+class SlidePanel(QFrame):
+    navigate = pyqtSignal(str)
+    prerender = pyqtSignal(str)
+
+    def __init__(self, store, downloads_page, main_window, parent=None):
+        super().__init__(parent)
+        self.mw = main_window
+        self.setObjectName("slidePanel")
+        self.setFixedWidth(0)
+
+        outer = QVBoxLayout(self)
+        outer.setContentsMargins(0, 0, 0, 0)
+        outer.setSpacing(0)
+
+        self._header_lbl = QLabel("")
+        self._header_lbl.setStyleSheet(
+            "font-weight: 800; font-size: 11px; letter-spacing: 1.5px;"
+            "color: " + p("accent") + "; background: transparent;"
+        )
+        hdr = QFrame()
+        hdr.setObjectName("panelHeader")
+        hdr.setFixedHeight(44)
+        hdr_lay = QHBoxLayout(hdr)
+        hdr_lay.setContentsMargins(16, 0, 10, 0)
+        hdr_lay.setSpacing(8)
+        hdr_lay.addWidget(self._header_lbl)
+        hdr_lay.addStretch()
+        close_btn = QPushButton()
+        close_btn.setFixedSize(28, 28)
+        close_icon_path = os.path.join(ICONS_DIR, "close.svg")
+        if os.path.exists(close_icon_path):
+            close_btn.setIcon(get_svg_icon(close_icon_path, p("accent")))
+            close_btn.setIconSize(QSize(14, 14))
+        else:
+            close_btn.setText("✕")
+        close_btn.setStyleSheet(
+            "QPushButton{background:transparent;color:" + p("text2") + ";"
+            "border:none;border-radius:14px;font-size:13px;}"
+            "QPushButton:hover{background:" + p("btn_hover") + ";color:" + p("text") + ";}"
+        )
+        close_btn.setCursor(Qt.PointingHandCursor)
+        close_btn.clicked.connect(self._request_close)
+        hdr_lay.addWidget(close_btn)
+        outer.addWidget(hdr)
+
+        self.stack = QStackedWidget()
+        outer.addWidget(self.stack, 1)
+
+        self._set_page  = None
+        self._pages     = {}
+        self._factories = {
+            "history":   (lambda: HistoryPage(store),          "History"),
+            "pass":      (lambda: PasswordManagerPage(store),  "Passwords"),
+            "ext":       (lambda: ExtensionsPage(main_window), "Extensions"),
+            "translate": (lambda: TranslatePage(),             "Translate"),
+            "notes":     (lambda: NotesPage(),                 "Notes"),
+            "settings":  (lambda: SettingsPage(store),         "Settings"),
+            "perf":      (lambda: PerformancePage(main_window), "Performance"),
+            "storage":   (lambda: StoragePage(main_window),     "Storage"),
+        }
+
+        self._dl_page = downloads_page
+        self._pages["dl"] = (downloads_page, "Downloads")
+        self.stack.addWidget(downloads_page)
+
+        self._anim = QPropertyAnimation(self, b"maximumWidth")
+        self._anim.setEasingCurve(QEasingCurve.OutCubic)
+
+        self._open_width = 290
+        self._is_open    = False
+        self._close_cb   = None
+
+    def set_close_callback(self, cb):
+        self._close_cb = cb
+
+    def _request_close(self):
+        self.close_panel()
+        if self._close_cb:
+            self._close_cb()
+
+    def _page(self, key):
+        if key in self._pages:
+            return self._pages[key]
+        if key not in self._factories:
+            return None
+        factory, label = self._factories[key]
+        page = factory()
+        self._pages[key] = (page, label)
+        self.stack.addWidget(page)
+        if key in ("history", "ext"):
+            page.navigate.connect(self.navigate)
+        if key == "history":
+            page.prerender.connect(self.prerender)
+        elif key == "settings":
+            self._set_page = page
+            page.theme_changed.connect(self._apply_theme)
+            page.perf_changed.connect(self._apply_perf_mode)
+        return self._pages[key]
+
+    def show_page(self, key):
+        entry = self._page(key)
+        if entry is None:
+            return
+        page, label = entry
+        self._header_lbl.setText(label.upper())
+        self.stack.setCurrentWidget(page)
+        if hasattr(page, "on_show"):
+            page.on_show()
+        if not self._is_open:
+            self._is_open = True
+            perf = "medium"
+            try:
+                perf = self.mw.store.perf_mode
+            except Exception:
+                pass
+            if perf in ("lowest", "low"):
+                self.setMaximumWidth(self._open_width)
+                self.show()
+            else:
+                self._anim.setStartValue(0)
+                self._anim.setEndValue(self._open_width)
+                self._anim.setDuration(160 if perf == "medium" else 240)
+                self.setMaximumWidth(0)
+                self.show()
+                self._anim.start()
+
+    def close_panel(self):
+        if not self._is_open:
+            return
+        self._is_open = False
+        perf = "medium"
+        try:
+            perf = self.mw.store.perf_mode
+        except Exception:
+            pass
+        if perf in ("lowest", "low"):
+            self.hide()
+            self._on_close_done()
+        else:
+            self._anim.setStartValue(self._open_width)
+            self._anim.setEndValue(0)
+            self._anim.setDuration(160 if perf == "medium" else 240)
+            self._anim.start()
+            self._anim.finished.connect(self._on_close_done)
+
+    def _on_close_done(self):
+        try:
+            self._anim.finished.disconnect(self._on_close_done)
+        except Exception:
+            pass
+        if not self._is_open:
+            self.hide()
+
+    def is_open(self):
+        return self._is_open
+
+    def current_key(self):
+        for key, (page, _) in self._pages.items():
+            if self.stack.currentWidget() is page:
+                return key
+        return None
+
+    def _apply_theme(self, theme_name):
+        self.mw._set_theme(theme_name)
+        if self._set_page is not None:
+            self._set_page.refresh_theme()
+
+    def _apply_perf_mode(self, mode):
+        self.mw._apply_perf_mode(mode)
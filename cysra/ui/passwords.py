@@ -0,0 +1,195 @@
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QLabel,
+    QMessageBox, QListWidget, QListWidgetItem, QMenu, QApplication
+)
+from PyQt5.QtCore import Qt
+
+
+class PasswordManagerPage(QWidget):
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+        self._authed = False
+        self._busy_widgets = ()
+        self.lay = QVBoxLayout(self)
+        self.lay.setContentsMargins(12, 10, 12, 10)
+        self.lay.setSpacing(8)
+
+        top = QHBoxLayout()
+        lbl = QLabel("Password Manager")
+        lbl.setObjectName("sectionHead")
+        top.addWidget(lbl)
+        top.addStretch()
+        ref = QPushButton("Refresh")
+        ref.clicked.connect(self.refresh)
+        top.addWidget(ref)
+        self.lay.addLayout(top)
+
+        self.list = QListWidget()
+        self.lay.addWidget(self.list)
+
+        self.store.vault_locked.connect(self._on_locked)
+        self.refresh()
+
+    def refresh(self):
+        while self.lay.count():
+            item = self.lay.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+            elif item.layout():
+                self._clear_layout(item.layout())
+
+        if not self._authed:
+            self._show_auth()
+        else:
+            self._show_manager()
+
+    def _clear_layout(self, layout):
+        while layout.count():
+            item = layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+            elif item.layout():
+                self._clear_layout(item.layout())
+
+    def _on_locked(self):
+        if self._authed:
+            self._authed = False
+            self.refresh()
+
+    def on_show(self):
+        self._authed = False
+        self.store.lock_master()
+        self.refresh()
+
+    def _show_auth(self):
+        lbl = QLabel("Password Manager")
+        lbl.setObjectName("sectionHead")
+        self.lay.addWidget(lbl)
+        if not self.store.has_master_pwd:
+            msg = QLabel("Setup a Master Password to protect your data.")
+            msg.setWordWrap(True)
+            self.lay.addWidget(msg)
+            pwd_in = QLineEdit()
+            pwd_in.setPlaceholderText("Create Master Password")
+            pwd_in.setEchoMode(QLineEdit.Password)
+            pwd_in.returnPressed.connect(lambda: self._setup(pwd_in.text()))
+            self.lay.addWidget(pwd_in)
+            btn = QPushButton("Set Password")
+            btn.setObjectName("accentBtn")
+            btn.clicked.connect(lambda: self._setup(pwd_in.text()))
+            self.lay.addWidget(btn)
+            self._busy_widgets = (pwd_in, btn)
+        else:
+            msg = QLabel("Enter Master Password to unlock.")
+            self.lay.addWidget(msg)
+            pwd_in = QLineEdit()
+            pwd_in.setPlaceholderText("Master Password")
+            pwd_in.setEchoMode(QLineEdit.Password)
+            pwd_in.returnPressed.connect(lambda: self._auth(pwd_in.text()))
+            self.lay.addWidget(pwd_in)
+            btn = QPushButton("Unlock")
+            btn.setObjectName("accentBtn")
+            btn.clicked.connect(lambda: self._auth(pwd_in.text()))
+            self.lay.addWidget(btn)
+            self._busy_widgets = (pwd_in, btn)
+        self.lay.addStretch()
+
+    def _set_busy(self, busy):
+        for w in self._busy_widgets:
+            try:
+                w.setEnabled(not busy)
+            except RuntimeError:
+                pass
+
+    def _setup(self, pwd):
+        if pwd:
+            self._set_busy(True)
+            self.store.set_master_pwd_async(pwd, self._on_unlocked)
+
+    def _auth(self, pwd):
+        self._set_busy(True)
+        self.store.unlock_master_async(pwd, self._on_unlocked)
+
+    def _on_unlocked(self, ok):
+        if ok:
+            self._authed = True
+            self.refresh()
+        else:
+            self._set_busy(False)
+            QMessageBox.warning(self, "Auth", "Invalid Master Password")
+
+    def _show_manager(self):
+        lbl = QLabel("Passwords")
+        lbl.setObjectName("sectionHead")
+        self.lay.addWidget(lbl)
+        self.list = QListWidget()
+        for p_ in self.store.passwords:
+            item = QListWidgetItem(f"{p_.get('site','')} | {p_.get('user','')}")
+            item.setToolTip("Right-click to copy, double-click to delete")
+            item.setData(Qt.UserRole, (p_.get("site", ""), p_.get("user", "")))
+            self.list.addItem(item)
+        self.lay.addWidget(self.list)
+        form = QHBoxLayout()
+        self.site_in = QLineEdit()
+        self.site_in.setPlaceholderText("Site")
+        self.user_in = QLineEdit()
+        self.user_in.setPlaceholderText("User")
+        self.pwd_in = QLineEdit()
+        self.pwd_in.setPlaceholderText("Pass")
+        self.pwd_in.setEchoMode(QLineEdit.Password)
+        add_btn = QPushButton("Add")
+        add_btn.setObjectName("accentBtn")
+        add_btn.clicked.connect(self._add)
+        form.addWidget(self.site_in)
+        form.addWidget(self.user_in)
+        form.addWidget(self.pwd_in)
+        form.addWidget(add_btn)
+        self.lay.addLayout(form)
+        if self.store.secret_backend is None:
+            warn = QLabel("No secret backend available. Install 'cryptography' to store passwords.")
+            warn.setWordWrap(True)
+            warn.setObjectName("mutedLabel")
+            self.lay.addWidget(warn)
+        hint = QLabel("Right-click to copy, double-click to remove")
+        hint.setObjectName("mutedLabel")
+        hint.setAlignment(Qt.AlignCenter)
+        self.lay.addWidget(hint)
+        self.list.itemDoubleClicked.connect(self._remove)
+        self.list.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.list.customContextMenuRequested.connect(self._context_menu)
+
+    def _add(self):
+        site, user, pwd = self.site_in.text(), self.user_in.text(), self.pwd_in.text()
+        if site and user and pwd:
+            if not self.store.add_password(site, user, pwd):
+                QMessageBox.warning(self, "Passwords",
+                                    "Could not encrypt the password. Install 'cryptography' (pip install cryptography).")
+                return
+            self.refresh()
+
+    def _context_menu(self, pos):
+        item = self.list.itemAt(pos)
+        if item is None:
+            return
+        menu = QMenu(self)
+        copy_act = menu.addAction("Copy Password")
+        del_act = menu.addAction("Delete")
+        act = menu.exec_(self.list.mapToGlobal(pos))
+        if act == copy_act:
+            self._copy(item)
+        elif act == del_act:
+            self._remove(item)
+
+    def _copy(self, item):
+        site, user = item.data(Qt.UserRole)
+        pwd = self.store.reveal_password(site, user)
+        if pwd is None:
+            QMessageBox.warning(self, "Passwords", "Could not decrypt this entry.")
+            return
+        QApplication.clipboard().setText(pwd)
+
+    def _remove(self, item):
+        site, user = item.data(Qt.UserRole)
+        self.store.remove_password(site, user)
+        self.refresh()
@@ -0,0 +1,114 @@
+import time
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QListWidget,
+    QListWidgetItem
+)
+from PyQt5.QtCore import Qt, QTimer
+
+from ..cpu import CpuSampler
+
+REFRESH_MS = 2000
+
+
+class PerformancePage(QWidget):
+    def __init__(self, main_window):
+        super().__init__()
+        self.mw = main_window
+        self._cpu = CpuSampler()
+        self._sections = [
+            ("Tabs", self._tab_lines),
+            ("Page optimiser", self._opt_lines),
+            ("Predictor", lambda: self.mw.predictor.summary()),
+            ("Prerender", lambda: self.mw.prerender.summary()),
+            ("Spare tabs", lambda: self.mw.spare_tabs.summary()),
+            ("Back/forward cache", lambda: self.mw.bfcache.summary()),
+        ]
+
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(12, 10, 12, 10)
+        lay.setSpacing(8)
+
+        top = QHBoxLayout()
+        lbl = QLabel("Performance")
+        lbl.setObjectName("sectionHead")
+        top.addWidget(lbl)
+        top.addStretch()
+        ref = QPushButton("Refresh")
+        ref.clicked.connect(self.refresh)
+        top.addWidget(ref)
+        lay.addLayout(top)
+
+        self.list = QListWidget()
+        self.list.setWordWrap(True)
+        lay.addWidget(self.list, 1)
+
+        hint = QLabel("CPU is per renderer process; tabs on the same site may share one.")
+        hint.setObjectName("mutedLabel")
+        hint.setWordWrap(True)
+        lay.addWidget(hint)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    def _tab_lines(self):
+        lines = []
+        now = time.monotonic()
+        for tab in self._tabs():
+            pid = tab.cpu_pid()
+            secs, pct = self._cpu.sample(pid, now)
+            parts = [tab.state_label(), "pid " + str(pid or "–")]
+            if secs is not None:
+                parts.append(f"{secs:.1f} s CPU")
+            if pct is not None:
+                parts.append(f"{pct:.1f}%")
+            lines.append(self._short_title(tab) + "\n" + " · ".join(parts))
+        return lines
+
+    def _tabs(self):
+        tabs = self.mw.tabs
+        for i in range(tabs.count()):
+            tab = tabs.widget(i)
+            if hasattr(tab, "cpu_pid"):
+                yield tab
+
+    @staticmethod
+    def _short_title(tab):
+        title = tab.view.title() or "New Tab"
+        return title if len(title) <= 40 else title[:38] + "…"
+
+    def _opt_lines(self):
+        lines = []
+        for tab in self._tabs():
+            st = getattr(tab, "opt_stats", None)
+            if not st:
+                continue
+            lines.append(self._short_title(tab) + "\n" + " · ".join([
+                f"{st.get('nodes', 0)} nodes in {st.get('ms', 0)} ms",
+                f"max {st.get('max_ms', 0)} ms/frame",
+                f"{st.get('lazy', 0)} lazy",
+                f"{st.get('lists', 0)} lists",
+                f"{st.get('videos', 0)} videos paused",
+            ]))
+        return lines
+
+    def refresh(self):
+        self.list.clear()
+        for title, provider in self._sections:
+            head = QListWidgetItem(title.upper())
+            head.setFlags(Qt.NoItemFlags)
+            self.list.addItem(head)
+            try:
+                lines = provider()
+            except Exception as exc:
+                lines = ["unavailable: " + str(exc)]
+            for line in lines or ["—"]:
+                self.list.addItem(QListWidgetItem(line))
+
+    def on_show(self):
+        self.refresh()
+        self._timer.start()
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
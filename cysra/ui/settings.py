@@ -0,0 +1,362 @@
+import os
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QComboBox,
+    QFrame, QFileDialog, QMessageBox, QLineEdit, QListWidget, QListWidgetItem,
+    QCheckBox, QGridLayout
+)
+from PyQt5.QtCore import Qt, pyqtSignal, QSize
+
+from ..bookmarks import export_netscape, parse_netscape
+from ..icons import get_svg_icon
+from ..paths import ICONS_DIR
+from ..siteprofiles import FEATURES, PERF_MODES
+from ..theme import current_theme, p
+
+
+class SettingsPage(QWidget):
+    theme_changed = pyqtSignal(str)
+    perf_changed = pyqtSignal(str)
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(16, 16, 16, 16)
+        lay.setSpacing(20)
+
+        app_lbl = QLabel("Appearance")
+        app_lbl.setObjectName("sectionHead")
+        app_lbl.setStyleSheet(
+            "font-size:10px;font-weight:800;letter-spacing:1px;"
+            "color:" + p("accent") + ";background:transparent;"
+        )
+        lay.addWidget(app_lbl)
+
+        theme_row = QFrame()
+        theme_row.setObjectName("card")
+        theme_row.setStyleSheet(
+            "QFrame#card{background:" + p("card") + ";border:1px solid "
+            + p("border") + ";border-radius:16px;}"
+        )
+        tr_lay = QVBoxLayout(theme_row)
+        tr_lay.setContentsMargins(16, 12, 16, 12)
+        tr_lay.setSpacing(10)
+
+        tr_title = QLabel("Theme")
+        tr_title.setStyleSheet("font-size:12px;font-weight:700;color:" + p("text") + ";background:transparent;")
+        tr_lay.addWidget(tr_title)
+
+        btn_row = QHBoxLayout()
+        btn_row.setSpacing(10)
+
+        self._dark_btn  = QPushButton("  Dark")
+        self._light_btn = QPushButton("  Light")
+        
+        icons_path = ICONS_DIR
+        self._moon_icon = os.path.join(icons_path, "moon.svg")
+        self._sun_icon  = os.path.join(icons_path, "sun.svg")
+        
+        for btn, theme_name in [(self._dark_btn, "dark"), (self._light_btn, "light")]:
+            btn.setFixedHeight(38)
+            btn.setCursor(Qt.PointingHandCursor)
+            btn.setIconSize(QSize(16, 16))
+            btn.setCheckable(False)
+            btn.clicked.connect(lambda _, t=theme_name: self.theme_changed.emit(t))
+        self._update_theme_btns()
+
+        btn_row.addWidget(self._dark_btn)
+        btn_row.addWidget(self._light_btn)
+        tr_lay.addLayout(btn_row)
+        lay.addWidget(theme_row)
+
+        perf_lbl = QLabel("Performance")
+        perf_lbl.setObjectName("sectionHead")
+        perf_lbl.setStyleSheet(
+            "font-size:10px;font-weight:800;letter-spacing:1px;"
+            "color:" + p("accent") + ";background:transparent;"
+        )
+        lay.addWidget(perf_lbl)
+
+        perf_row = QFrame()
+        perf_row.setObjectName("card")
+        perf_row.setStyleSheet(
+            "QFrame#card{background:" + p("card") + ";border:1px solid "
+            + p("border") + ";border-radius:16px;}"
+        )
+        pr_lay = QVBoxLayout(perf_row)
+        pr_lay.setContentsMargins(16, 12, 16, 12)
+        pr_lay.setSpacing(10)
+
+        pr_title = QLabel("Performance Mode")
+        pr_title.setStyleSheet("font-size:12px;font-weight:700;color:" + p("text") + ";background:transparent;")
+        pr_lay.addWidget(pr_title)
+
+        self.perf_combo = QComboBox()
+        self.perf_combo.addItem("Lowest (Not Recommended)", "lowest")
+        self.perf_combo.addItem("Low", "low")
+        self.perf_combo.addItem("Medium (Default)", "medium")
+        self.perf_combo.addItem("High (Enhanced Visuals)", "high")
+        self.perf_combo.setCurrentIndex(self.perf_combo.findData(self.store.perf_mode))
+        self.perf_combo.currentIndexChanged.connect(self._on_perf_changed)
+        pr_lay.addWidget(self.perf_combo)
+
+        self.perf_note = QLabel("")
+        self.perf_note.setWordWrap(True)
+        self.perf_note.setStyleSheet("font-size:10px;color:" + p("text3") + ";background:transparent;")
+        pr_lay.addWidget(self.perf_note)
+        self._update_perf_note(self.store.perf_mode)
+
+        self.saver_check = QCheckBox("Data saver")
+        self.saver_check.setChecked(self.store.data_saver)
+        self.saver_check.setToolTip("Skip web fonts, hold back autoplaying media and load images only when they scroll into view")
+        self.saver_check.toggled.connect(lambda on: setattr(self.store, "data_saver", on))
+        pr_lay.addWidget(self.saver_check)
+
+        self.prerender_check = QCheckBox("Prerender on hover")
+        self.prerender_check.setChecked(self.store.prerender)
+        self.prerender_check.setToolTip("Start loading a favorite or history entry in the background after a short hover, so opening it is instant")
+        self.prerender_check.toggled.connect(lambda on: setattr(self.store, "prerender", on))
+        pr_lay.addWidget(self.prerender_check)
+
+        sess_title = QLabel("Secret tab sessions")
+        sess_title.setStyleSheet("font-size:12px;font-weight:700;color:" + p("text") + ";background:transparent;")
+        pr_lay.addWidget(sess_title)
+
+        self.sessions_combo = QComboBox()
+        self.sessions_combo.setToolTip("Secret tabs share these off-the-record profiles; all are wiped when the last secret tab closes")
+        for label, n in (("One shared session", 1), ("2 sessions", 2), ("3 sessions", 3), ("4 sessions", 4)):
+            self.sessions_combo.addItem(label, n)
+        idx = self.sessions_combo.findData(self.store.secret_profiles)
+        self.sessions_combo.setCurrentIndex(idx if idx >= 0 else 0)
+        self.sessions_combo.currentIndexChanged.connect(
+            lambda i: setattr(self.store, "secret_profiles", self.sessions_combo.itemData(i)))
+        pr_lay.addWidget(self.sessions_combo)
+        lay.addWidget(perf_row)
+
+        sp_row = QFrame()
+        sp_row.setObjectName("card")
+        sp_row.setStyleSheet(
+            "QFrame#card{background:" + p("card") + ";border:1px solid "
+            + p("border") + ";border-radius:16px;}"
+        )
+        sp_lay = QVBoxLayout(sp_row)
+        sp_lay.setContentsMargins(16, 12, 16, 12)
+        sp_lay.setSpacing(8)
+
+        sp_title = QLabel("Site Profiles")
+        sp_title.setStyleSheet("font-size:12px;font-weight:700;color:" + p("text") + ";background:transparent;")
+        sp_lay.addWidget(sp_title)
+
+        self.rule_list = QListWidget()
+        self.rule_list.setMaximumHeight(110)
+        self.rule_list.setToolTip("Double-click to remove")
+        self.rule_list.itemDoubleClicked.connect(self._remove_site_rule)
+        sp_lay.addWidget(self.rule_list)
+
+        self.rule_pattern = QLineEdit()
+        self.rule_pattern.setPlaceholderText("Host, e.g. *.youtube.com")
+        sp_lay.addWidget(self.rule_pattern)
+
+        self.rule_mode = QComboBox()
+        self.rule_mode.addItem("Global mode", None)
+        for mode in PERF_MODES:
+            self.rule_mode.addItem(mode.title(), mode)
+        sp_lay.addWidget(self.rule_mode)
+
+        grid = QGridLayout()
+        grid.setSpacing(4)
+        self.rule_checks = {}
+        labels = {"js": "JavaScript", "images": "Images", "webgl": "WebGL",
+                  "autoplay": "Autoplay", "plugins": "Plugins", "scroll_animation": "Smooth scroll"}
+        for i, feature in enumerate(FEATURES):
+            cb = QCheckBox(labels.get(feature, feature))
+            cb.setTristate(True)
+            cb.setCheckState(Qt.PartiallyChecked)
+            cb.setToolTip("Partially checked keeps the mode's default")
+            grid.addWidget(cb, i // 2, i % 2)
+            self.rule_checks[feature] = cb
+        sp_lay.addLayout(grid)
+
+        add_rule = QPushButton("Add Rule")
+        add_rule.setCursor(Qt.PointingHandCursor)
+        add_rule.clicked.connect(self._add_site_rule)
+        sp_lay.addWidget(add_rule)
+        self._refresh_site_rules()
+        lay.addWidget(sp_row)
+
+        bm_lbl = QLabel("Bookmarks")
+        bm_lbl.setObjectName("sectionHead")
+        bm_lbl.setStyleSheet(
+            "font-size:10px;font-weight:800;letter-spacing:1px;"
+            "color:" + p("accent") + ";background:transparent;"
+        )
+        lay.addWidget(bm_lbl)
+
+        bm_row = QFrame()
+        bm_row.setObjectName("card")
+        bm_row.setStyleSheet(
+            "QFrame#card{background:" + p("card") + ";border:1px solid "
+            + p("border") + ";border-radius:16px;}"
+        )
+        bm_lay = QHBoxLayout(bm_row)
+        bm_lay.setContentsMargins(16, 12, 16, 12)
+        bm_lay.setSpacing(10)
+        import_btn = QPushButton("Import HTML")
+        import_btn.setCursor(Qt.PointingHandCursor)
+        import_btn.clicked.connect(self._import_bookmarks)
+        export_btn = QPushButton("Export HTML")
+        export_btn.setCursor(Qt.PointingHandCursor)
+        export_btn.clicked.connect(self._export_bookmarks)
+        bm_lay.addWidget(import_btn)
+        bm_lay.addWidget(export_btn)
+        lay.addWidget(bm_row)
+
+        vault_lbl = QLabel("Password Vault")
+        vault_lbl.setObjectName("sectionHead")
+        vault_lbl.setStyleSheet(
+            "font-size:10px;font-weight:800;letter-spacing:1px;"
+            "color:" + p("accent") + ";background:transparent;"
+        )
+        lay.addWidget(vault_lbl)
+
+        vault_row = QFrame()
+        vault_row.setObjectName("card")
+        vault_row.setStyleSheet(
+            "QFrame#card{background:" + p("card") + ";border:1px solid "
+            + p("border") + ";border-radius:16px;}"
+        )
+        vr_lay = QVBoxLayout(vault_row)
+        vr_lay.setContentsMargins(16, 12, 16, 12)
+        vr_lay.setSpacing(10)
+
+        vr_title = QLabel("Auto-lock after inactivity")
+        vr_title.setStyleSheet("font-size:12px;font-weight:700;color:" + p("text") + ";background:transparent;")
+        vr_lay.addWidget(vr_title)
+
+        self.lock_combo = QComboBox()
+        for label, secs in (("1 minute", 60), ("5 minutes", 300), ("15 minutes", 900),
+                            ("1 hour", 3600), ("Never", 0)):
+            self.lock_combo.addItem(label, secs)
+        idx = self.lock_combo.findData(self.store.vault_idle_secs)
+        self.lock_combo.setCurrentIndex(idx if idx >= 0 else 1)
+        self.lock_combo.currentIndexChanged.connect(
+            lambda i: setattr(self.store, "vault_idle_secs", self.lock_combo.itemData(i)))
+        vr_lay.addWidget(self.lock_combo)
+        lay.addWidget(vault_row)
+
+        about_lbl = QLabel("About")
+        about_lbl.setObjectName("sectionHead")
+        about_lbl.setStyleSheet(
+            "font-size:10px;font-weight:800;letter-spacing:1px;"
+            "color:" + p("accent") + ";background:transparent;"
+        )
+        lay.addWidget(about_lbl)
+
+        about_row = QFrame()
+        about_row.setObjectName("card")
+        about_row.setStyleSheet(
+            "QFrame#card{background:" + p("card") + ";border:1px solid "
+            + p("border") + ";border-radius:16px;}"
+        )
+        ar_lay = QVBoxLayout(about_row)
+        ar_lay.setContentsMargins(16, 12, 16, 12)
+        ar_lay.setSpacing(4)
+        name_lbl = QLabel("Cysra Anome 7.3")
+        name_lbl.setStyleSheet("font-weight:700;font-size:13px;color:" + p("text") + ";background:transparent;")
+        built_lbl = QLabel("Built on PyQt5 + Chromium")
+        built_lbl.setStyleSheet("font-size:11px;color:" + p("text3") + ";background:transparent;")
+        ar_lay.addWidget(name_lbl)
+        ar_lay.addWidget(built_lbl)
+        lay.addWidget(about_row)
+
+        lay.addStretch()
+
+    def _import_bookmarks(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Import Bookmarks", "", "Bookmarks (*.html *.htm)")
+        if not path:
+            return
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                added = self.store.import_favorites(parse_netscape(f.read()))
+            QMessageBox.information(self, "Bookmarks", f"Imported {added} bookmark(s).")
+        except Exception as exc:
+            QMessageBox.critical(self, "Bookmarks", "Could not import:\n" + str(exc))
+
+    def _export_bookmarks(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Bookmarks", "bookmarks.html", "Bookmarks (*.html)")
+        if not path:
+            return
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(export_netscape(self.store.favorites))
+        except Exception as exc:
+            QMessageBox.critical(self, "Bookmarks", "Could not export:\n" + str(exc))
+
+    def _refresh_site_rules(self):
+        self.rule_list.clear()
+        for rule in self.store.site_rules:
+            parts = [rule.get("mode") or "global"]
+            parts += [k + (" on" if v else " off") for k, v in rule.items() if k in FEATURES]
+            item = QListWidgetItem(rule["pattern"] + "  →  " + ", ".join(parts))
+            item.setData(Qt.UserRole, rule["pattern"])
+            self.rule_list.addItem(item)
+
+    def _add_site_rule(self):
+        features = {}
+        for feature, cb in self.rule_checks.items():
+            state = cb.checkState()
+            if state != Qt.PartiallyChecked:
+                features[feature] = state == Qt.Checked
+        if self.store.set_site_rule(self.rule_pattern.text(), self.rule_mode.currentData(), **features):
+            self.rule_pattern.clear()
+            self._refresh_site_rules()
+
+    def _remove_site_rule(self, item):
+        self.store.remove_site_rule(item.data(Qt.UserRole))
+        self._refresh_site_rules()
+
+    def _on_perf_changed(self, idx):
+        mode = self.perf_combo.itemData(idx)
+        self._update_perf_note(mode)
+        self.perf_changed.emit(mode)
+
+    def _update_perf_note(self, mode):
+        if mode == "lowest":
+            self.perf_note.setText("Lowest (Not Recommended): Aggressively optimize everything. Disable non-essential web engine attributes, hardware acceleration, and plugins to maximize raw speed, even if it means some YouTube videos or complex websites fail to render.")
+        elif mode == "low":
+            self.perf_note.setText("Low: Optimize general application performance, but keep essential rendering features intact so most websites and important content still load correctly.")
+        elif mode == "medium":
+            self.perf_note.setText("Medium: Standard default settings. Everything operates normally with a balance of performance and visual quality.")
+        elif mode == "high":
+            self.perf_note.setText("High: Enable full hardware acceleration and beautiful UI enhancements like glow/bloom effects, translucent panels, and smooth animations. Not recommended for low-end PCs.")
+
+    def _update_theme_btns(self):
+        active_style = (
+            "background:" + p("accent") + ";color:#ffffff;"
+            "border:none;border-radius:12px;font-weight:700;font-size:12px;"
+            "text-align:center;padding:0 12px;"
+        )
+        inactive_style = (
+            "background:" + p("card") + ";color:" + p("text2") + ";"
+            "border:1px solid " + p("border") + ";border-radius:12px;font-size:12px;"
+            "text-align:center;padding:0 12px;"
+        )
+        hover_style = (
+            "QPushButton:hover{background:" + p("btn_hover") + ";color:" + p("text") + ";}"
+            "QPushButton:pressed{background:" + p("btn_hover") + ";}"
+        )
+        theme = current_theme()
+        
+        self._dark_btn.setStyleSheet((active_style if theme == "dark" else inactive_style) + hover_style)
+        self._light_btn.setStyleSheet((active_style if theme == "light" else inactive_style) + hover_style)
+        
+        dark_color = "#ffffff" if theme == "dark" else p("accent")
+        light_color = "#ffffff" if theme == "light" else p("accent")
+        
+        if os.path.exists(self._moon_icon):
+            self._dark_btn.setIcon(get_svg_icon(self._moon_icon, dark_color))
+        if os.path.exists(self._sun_icon):
+            self._light_btn.setIcon(get_svg_icon(self._sun_icon, light_color))
+
+    def refresh_theme(self):
+        self._update_theme_btns()
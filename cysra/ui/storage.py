@@ -0,0 +1,111 @@
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QListWidget,
+    QListWidgetItem, QAbstractItemView, QGridLayout
+)
+from PyQt5.QtCore import Qt
+
+from ..perf import perf_limit
+from ..storage import format_bytes
+
+_KINDS = (("cookies", "cookies"), ("cache", "cache"), ("idb", "IndexedDB"), ("websql", "WebSQL"))
+
+
+class StoragePage(QWidget):
+    def __init__(self, main_window):
+        super().__init__()
+        self.mw = main_window
+        self.storage = main_window.storage
+        self.storage.scanned.connect(self._render)
+        self.storage.evicted.connect(
+            lambda n: self.status.setText(
+                f"Cookies removed for {n} sites · cached files and databases go at next start"))
+
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(12, 10, 12, 10)
+        lay.setSpacing(8)
+
+        top = QHBoxLayout()
+        lbl = QLabel("Storage")
+        lbl.setObjectName("sectionHead")
+        top.addWidget(lbl)
+        top.addStretch()
+        ref = QPushButton("Refresh")
+        ref.clicked.connect(self.storage.scan)
+        top.addWidget(ref)
+        lay.addLayout(top)
+
+        self.summary = QLabel("Scanning…")
+        self.summary.setObjectName("mutedLabel")
+        self.summary.setWordWrap(True)
+        lay.addWidget(self.summary)
+
+        self.list = QListWidget()
+        self.list.setWordWrap(True)
+        self.list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        lay.addWidget(self.list, 1)
+
+        grid = QGridLayout()
+        grid.setSpacing(6)
+        for i, (text, fn) in enumerate((
+            ("Evict selected",     self._evict_selected),
+            ("Evict unused sites", self._evict_lru),
+            ("Clear cache",        self.storage.clear_cache),
+            ("Pre-warm favorites", self._prewarm),
+        )):
+            btn = QPushButton(text)
+            btn.clicked.connect(fn)
+            grid.addWidget(btn, i // 2, i % 2)
+        lay.addLayout(grid)
+
+        self.status = QLabel("")
+        self.status.setObjectName("mutedLabel")
+        self.status.setWordWrap(True)
+        lay.addWidget(self.status)
+
+    def _render(self, report):
+        budget = report.get("cache_budget") or 0
+        parts = ["HTTP cache " + format_bytes(report.get("cache_bytes"))
+                 + (" of " + format_bytes(budget) if budget else "")]
+        parts.append("site data " + format_bytes(report.get("storage_bytes")))
+        if report.get("free_bytes") is not None:
+            parts.append(format_bytes(report["free_bytes"]) + " free on disk")
+        if report.get("pending"):
+            parts.append(f"{len(report['pending'])} sites cleared at next start")
+        self.summary.setText(" · ".join(parts))
+
+        def weight(item):
+            return sum(v for k, v in item[1].items() if k != "cookies")
+
+        self.list.clear()
+        for site, usage in sorted(report.get("sites", {}).items(), key=weight, reverse=True):
+            details = []
+            for key, label in _KINDS:
+                if usage.get(key):
+                    val = usage[key]
+                    details.append(f"{val} {label}" if key == "cookies" else f"{format_bytes(val)} {label}")
+            item = QListWidgetItem(site + "\n" + " · ".join(details))
+            item.setData(Qt.UserRole, site)
+            self.list.addItem(item)
+
+    def _evict_selected(self):
+        sites = [item.data(Qt.UserRole) for item in self.list.selectedItems()]
+        if sites:
+            self.status.setText("Evicting " + ", ".join(sites[:3]) + ("…" if len(sites) > 3 else ""))
+            self.storage.evict_sites(sites)
+
+    def _evict_lru(self):
+        if not self.storage.evict_lru():
+            self.status.setText("Nothing to evict")
+
+    def _prewarm(self):
+        store = self.mw.store
+        count = perf_limit(store.perf_mode, "prewarm_favorites") or 5
+        urls = [f.get("url", "") for f in store.favorites[:count]]
+        self.storage.prewarm(urls)
+        self.status.setText(f"Pre-warming {len(urls)} favorites in the background")
+
+    def on_show(self):
+        report = self.storage.last_report
+        if report is not None:
+            self._render(report)
+        self.storage.scan()
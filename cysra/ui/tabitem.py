@@ -0,0 +1,50 @@
+import os
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QPushButton, QLabel
+from PyQt5.QtCore import Qt, pyqtSignal, QSize
+
+from ..icons import get_svg_icon
+from ..paths import ICONS_DIR
+from ..theme import p
+
+
+class TabItemWidget(QWidget):
+    closeRequested = pyqtSignal()
+    
+    def __init__(self, title, fav_icon=None, parent=None):
+        super().__init__(parent)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(8, 4, 8, 4)
+        layout.setSpacing(8)
+        
+        self.icon_label = QLabel()
+        self.icon_label.setFixedSize(18, 18)
+        self.icon_label.setScaledContents(True)
+        if fav_icon:
+            self.icon_label.setPixmap(fav_icon.pixmap(18, 18))
+        else:
+            self.icon_label.setStyleSheet("background: palette(mid); border-radius: 4px;")
+        layout.addWidget(self.icon_label)
+        
+        self.title_label = QLabel(title)
+        self.title_label.setStyleSheet("background: transparent; border: none; font-weight: 500;")
+        layout.addWidget(self.title_label, 1)
+        
+        self.close_btn = QPushButton()
+        self.close_btn.setObjectName("tabCloseBtn")
+        self.close_btn.setFixedSize(20, 20)
+        close_icon = os.path.join(ICONS_DIR, "close.svg")
+        if os.path.exists(close_icon):
+            self.close_btn.setIcon(get_svg_icon(close_icon, p("text3")))
+            self.close_btn.setIconSize(QSize(10, 10))
+        else:
+            self.close_btn.setText("×")
+        self.close_btn.setCursor(Qt.PointingHandCursor)
+        self.close_btn.clicked.connect(self.closeRequested.emit)
+        layout.addWidget(self.close_btn)
+
+    def set_title(self, title):
+        self.title_label.setText(title)
+        
+    def set_icon(self, icon):
+        if icon:
+            self.icon_label.setPixmap(icon.pixmap(18, 18))
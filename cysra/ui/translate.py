@@ -0,0 +1,75 @@
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit, QLabel,
+    QComboBox
+)
+from PyQt5.QtCore import Qt
+
+from ..lazy import lazy
+
+
+def _load_translator():
+    from deep_translator import GoogleTranslator
+    return GoogleTranslator
+
+
+class TranslatePage(QWidget):
+    LANGS = {
+        "auto": "Auto Detect", "en": "English", "tr": "Turkish",
+        "de": "German", "fr": "French", "es": "Spanish",
+        "ru": "Russian", "zh-CN": "Chinese", "ar": "Arabic",
+        "ja": "Japanese", "ko": "Korean", "pt": "Portuguese", "it": "Italian",
+    }
+
+    def __init__(self):
+        super().__init__()
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(12, 10, 12, 10)
+        lay.setSpacing(8)
+
+        row = QHBoxLayout()
+        row.setSpacing(6)
+        self.src_combo = QComboBox()
+        self.tgt_combo = QComboBox()
+        for k, v in self.LANGS.items():
+            self.src_combo.addItem(v, k)
+            if k != "auto":
+                self.tgt_combo.addItem(v, k)
+        arrow = QLabel("→")
+        arrow.setAlignment(Qt.AlignCenter)
+        arrow.setFixedWidth(18)
+        row.addWidget(self.src_combo, 1)
+        row.addWidget(arrow)
+        row.addWidget(self.tgt_combo, 1)
+        lay.addLayout(row)
+
+        self.src_text = QTextEdit()
+        self.src_text.setPlaceholderText("Source text…")
+        self.src_text.setMaximumHeight(110)
+        lay.addWidget(self.src_text)
+
+        go_btn = QPushButton("Translate")
+        go_btn.setObjectName("accentBtn")
+        go_btn.clicked.connect(self._go)
+        lay.addWidget(go_btn)
+
+        self.out_text = QTextEdit()
+        self.out_text.setReadOnly(True)
+        self.out_text.setPlaceholderText("Translation…")
+        lay.addWidget(self.out_text, 1)
+
+    def _go(self):
+        GoogleTranslator = lazy("translator", _load_translator)
+        if GoogleTranslator is None:
+            self.out_text.setPlainText(
+                "deep-translator not installed.\n"
+                "Run:  pip install deep-translator"
+            )
+            return
+        try:
+            result = GoogleTranslator(
+                source=self.src_combo.currentData(),
+                target=self.tgt_combo.currentData()
+            ).translate(self.src_text.toPlainText())
+            self.out_text.setPlainText(result or "")
+        except Exception as exc:
+            self.out_text.setPlainText("Error: " + str(exc))
@@ -0,0 +1,448 @@
+import os
+import gc
+from PyQt5.QtWidgets import (
+    QMainWindow, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QFileDialog, QListWidget, QListWidgetItem, QFrame, QShortcut,
+    QGraphicsDropShadowEffect, QAbstractItemView, QToolButton
+)
+from PyQt5.QtWebEngineWidgets import QWebEngineProfile, QWebEngineSettings
+from PyQt5.QtCore import Qt, QTimer, QSize
+from PyQt5.QtGui import QColor, QKeySequence
+
+from .icons import get_svg_icon
+from .bfcache import BackForwardCache
+from .favicons import FaviconStore
+from .home import HOME_SCHEME, HomeSchemeHandler, home_data, is_home_url, scheme_registered
+from .injection import install_profile_scripts
+from .memory import MemoryManager
+from .paths import ICONS_DIR
+from .plugins import install_extensions
+from .perf import perf_limit
+from .predictor import Predictor
+from .prerender import Prerenderer
+from .private import PrivateSessions
+from .spare import SpareTabs
+from .storage import StorageManager
+from .store import DataStore
+from .tab import BrowserTab
+from .theme import PALETTES, build_stylesheet, current_theme, p, set_theme
+from .trace import STARTUP_TRACE
+from .workers import submit
+from .ui.downloads import DownloadsPage
+from .ui.iconbar import IconBar
+from .ui.panel import SlidePanel
+from .ui.tabitem import TabItemWidget
+
+
+PREWARM_DELAY_MS = 30000
+
+
+class MainWindow(QMainWindow):
+    def __init__(self, store=None):
+        super().__init__()
+        self.setWindowTitle("Cysra Anome 7.3 Biscuit")
+        self.setMinimumSize(1000, 650)
+        self.setGeometry(50, 50, 1440, 900)
+
+        self.store = store if store is not None else DataStore()
+        self._secret = False
+        self._opt = False
+        self._fg_tab = None
+
+        self._dl_page = DownloadsPage()
+
+        profile = QWebEngineProfile.defaultProfile()
+        profile.downloadRequested.connect(self._handle_download)
+        install_profile_scripts(profile)
+        if hasattr(QWebEngineSettings, "DnsPrefetchEnabled"):
+            profile.settings().setAttribute(QWebEngineSettings.DnsPrefetchEnabled, True)
+        self.predictor = Predictor(self.store, self)
+        self.prerender = Prerenderer(self.store, self)
+        self.bfcache = BackForwardCache(self.store, self)
+        self.favicons = FaviconStore()
+        self._install_home(profile)
+        self.private_sessions = PrivateSessions(self._handle_download, self.store.secret_profiles, self,
+                                                on_profile=lambda prof: self._install_home(prof, True))
+        self.storage = StorageManager(profile, self.store, self)
+        self.spare_tabs = SpareTabs(
+            self.store, lambda: BrowserTab(self, self.store, opt=self._opt), self._tabs_busy, self)
+        self.store.setting_changed.connect(self._on_setting_changed)
+        self.store.favorite_updated.connect(lambda _fav: self._refresh_home_tabs())
+
+        self.memory_manager = MemoryManager(self)
+        self.memory_manager.apply_perf_mode(self.store.perf_mode)
+        STARTUP_TRACE.mark("memory manager")
+
+        self._build()
+        STARTUP_TRACE.mark("window shell")
+        self._shortcuts()
+        self._apply_perf_mode(self.store.perf_mode)
+        STARTUP_TRACE.mark("stylesheet + perf mode")
+        QTimer.singleShot(0, self._finish_startup)
+
+    def _finish_startup(self):
+        STARTUP_TRACE.mark("window shown")
+        tab = self.add_tab()
+        STARTUP_TRACE.mark("first tab built")
+        if scheme_registered():
+            QTimer.singleShot(0, lambda: self.prerender.warm_home(QWebEngineProfile.defaultProfile()))
+        if STARTUP_TRACE.enabled:
+            tab.view.loadFinished.connect(lambda _ok: STARTUP_TRACE.finish())
+        self._load_extensions()
+        STARTUP_TRACE.mark("extensions installed")
+        QTimer.singleShot(PREWARM_DELAY_MS, self._prewarm_favorites)
+        submit(self.favicons.prune)
+        self.spare_tabs.schedule()
+
+    def _install_home(self, profile, secret=False):
+        if not scheme_registered():
+            return
+        handler = HomeSchemeHandler(
+            lambda: home_data(self.store, self.favicons, self.predictor, secret), profile)
+        profile.installUrlSchemeHandler(HOME_SCHEME, handler)
+
+    def _prewarm_favorites(self):
+        count = perf_limit(self.store.perf_mode, "prewarm_favorites")
+        if count and not self.store.data_saver:
+            self.storage.prewarm([f.get("url", "") for f in self.store.favorites[:count]])
+
+    def _tabs_busy(self):
+        for i in range(self.tabs.count()):
+            tab = self.tabs.widget(i)
+            if isinstance(tab, BrowserTab) and tab.is_loading():
+                return True
+        return False
+
+    def _handle_download(self, item):
+        try:
+            suggested = item.path() if hasattr(item, "path") else ""
+            if not suggested:
+                suggested = item.downloadFileName() if hasattr(item, "downloadFileName") else "file"
+            path, _ = QFileDialog.getSaveFileName(self, "Save File", suggested)
+            if path:
+                item.setPath(path)
+                item.accept()
+                self._dl_page.add_item(item)
+            else:
+                item.cancel()
+        except Exception:
+            pass
+
+    def _build(self):
+        self.tabs = QTabWidget()
+        self.tabs.tabBar().hide()
+        self.tabs.setDocumentMode(True)
+        self.tabs.currentChanged.connect(self._on_tab_switched)
+
+        central = QWidget()
+        self.setCentralWidget(central)
+        main_lay = QHBoxLayout(central)
+        main_lay.setContentsMargins(0, 0, 0, 0)
+        main_lay.setSpacing(0)
+
+        self.sidebar = QFrame()
+        self.sidebar.setObjectName("sidebar")
+        self.sidebar.setFixedWidth(76)
+        side_lay = QVBoxLayout(self.sidebar)
+        side_lay.setContentsMargins(0, 0, 0, 0)
+        side_lay.setSpacing(0)
+
+        self.icon_bar = IconBar(self)
+        self.icon_bar.icon_clicked.connect(self._on_icon_clicked)
+        side_lay.addWidget(self.icon_bar, 1)
+
+        main_lay.addWidget(self.sidebar)
+
+        self.slide_panel = SlidePanel(self.store, self._dl_page, self)
+        self.slide_panel.navigate.connect(self._navigate_current)
+        self.slide_panel.prerender.connect(self._prerender_current)
+        self.slide_panel.set_close_callback(self.icon_bar.clear_active)
+        self.slide_panel.hide()
+        main_lay.addWidget(self.slide_panel)
+
+        main_lay.addWidget(self.tabs, 1)
+
+        self.tab_panel = QFrame()
+        self.tab_panel.setObjectName("tabPanel")
+        self.tab_panel.setFixedWidth(220)
+        tp_lay = QVBoxLayout(self.tab_panel)
+        tp_lay.setContentsMargins(0, 0, 0, 0)
+        tp_lay.setSpacing(0)
+
+        hdr_w = QWidget()
+        hdr_w.setObjectName("tabPanelHeader")
+        hdr_w.setFixedHeight(52)
+        hdr_lay = QHBoxLayout(hdr_w)
+        hdr_lay.setContentsMargins(16, 0, 10, 0)
+        hdr_lay.setSpacing(8)
+
+        logo = QLabel("ANOME 7.3")
+        logo.setStyleSheet(
+            "font-weight:800;font-size:14px;letter-spacing:2px;"
+            "color:" + p("accent") + ";background:transparent;"
+        )
+        hdr_lay.addWidget(logo)
+        hdr_lay.addStretch()
+
+        self.new_btn = QToolButton()
+        self.new_btn.setObjectName("navBtn")
+        self.new_btn.setFixedSize(32, 32)
+        self.new_btn.setIconSize(QSize(16, 16))
+        plus_icon = os.path.join(ICONS_DIR, "plus.svg")
+        if os.path.exists(plus_icon):
+            self.new_btn.setIcon(get_svg_icon(plus_icon, p("accent")))
+        else:
+            self.new_btn.setText("+")
+            self.new_btn.setStyleSheet("font-size:18px;font-weight:300;")
+        self.new_btn.setCursor(Qt.PointingHandCursor)
+        self.new_btn.setToolTip("New Tab  (Ctrl+T)")
+        self.new_btn.clicked.connect(self.add_tab)
+        hdr_lay.addWidget(self.new_btn)
+
+        tp_lay.addWidget(hdr_w)
+
+        div = QFrame()
+        div.setFrameShape(QFrame.HLine)
+        div.setStyleSheet("background:" + p("border") + ";max-height:1px;border:none;")
+        tp_lay.addWidget(div)
+
+        self.tab_list = QListWidget()
+        self.tab_list.setObjectName("tabList")
+        self.tab_list.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.tab_list.currentRowChanged.connect(self.tabs.setCurrentIndex)
+        tp_lay.addWidget(self.tab_list, 1)
+
+        main_lay.addWidget(self.tab_panel)
+
+    def _on_tab_switched(self, idx):
+        self.tab_list.blockSignals(True)
+        self.tab_list.setCurrentRow(idx)
+        self.tab_list.blockSignals(False)
+        tab = self.tabs.widget(idx)
+        prev = self._fg_tab
+        if prev is not None and prev is not tab and self.tabs.indexOf(prev) >= 0:
+            prev.set_foreground(False)
+        self._fg_tab = tab if isinstance(tab, BrowserTab) else None
+        if isinstance(tab, BrowserTab):
+            tab.set_foreground(True)
+            self.setWindowTitle(tab.view.title() + "  —  Cysra Anome 7.3 Biscuit")
+
+    def add_tab(self, secret=False):
+        secret = secret or self._secret
+        tab = None if secret else self._take_spare()
+        if tab is None:
+            tab = BrowserTab(self, self.store, secret=secret, opt=self._opt)
+        tab.titleChanged.connect(lambda title, ref=tab: self._update_tab_ui(ref, title))
+        idx = self.tabs.addTab(tab, "New Tab")
+        item = QListWidgetItem(self.tab_list)
+        item.setSizeHint(QSize(0, 48))
+        tw = TabItemWidget("New Tab")
+        tw.closeRequested.connect(lambda: self._close_tab(self.tabs.indexOf(tab)))
+        self.tab_list.addItem(item)
+        self.tab_list.setItemWidget(item, tw)
+        self.tabs.setCurrentIndex(idx)
+        return tab
+
+    def _take_spare(self):
+        # Theme, perf mode or home data may have moved on since the tab
+        # was built; all of that is cheap to bring up to date.
+        tab = self.spare_tabs.take()
+        if tab is None:
+            return None
+        tab._refresh_icons()
+        tab.apply_perf_mode(self.store.perf_mode)
+        if is_home_url(tab.view.url().toString()):
+            tab._push_home_data()
+        return tab
+
+    def _update_tab_ui(self, tab, title):
+        idx = self.tabs.indexOf(tab)
+        if idx >= 0:
+            item = self.tab_list.item(idx)
+            if item:
+                tw = self.tab_list.itemWidget(item)
+                if tw:
+                    tw.set_title(title if title else "New Tab")
+            if self.tabs.currentIndex() == idx:
+                self.setWindowTitle((title if title else "New Tab") + "  —  Cysra Anome 7.3 Biscuit")
+
+    def _close_tab(self, idx):
+        if self.tabs.count() <= 1:
+            return
+        w = self.tabs.widget(idx)
+        if w is self._fg_tab:
+            self._fg_tab = None
+        self.tabs.removeTab(idx)
+        self.tab_list.takeItem(idx)
+        if w:
+            if isinstance(w, BrowserTab):
+                w.release_cached()
+            w.deleteLater()
+            if getattr(w, "secret", False):
+                self.private_sessions.release(w.profile)
+        QTimer.singleShot(1000, gc.collect)
+
+    def _on_setting_changed(self, key):
+        if key == "secret_profiles":
+            self.private_sessions.set_size(self.store.secret_profiles)
+        elif key in ("prerender", "data_saver", "perf_mode") and self.prerender.limit() == 0:
+            self.prerender.clear()
+        if key == "perf_mode" and perf_limit(self.store.perf_mode, "warm_home") <= 0:
+            self.prerender.drop_home()
+        if key == "perf_mode":
+            self.spare_tabs.trim()
+            self.bfcache.trim()
+
+    def _refresh_home_tabs(self):
+        for i in range(self.tabs.count()):
+            tab = self.tabs.widget(i)
+            if isinstance(tab, BrowserTab) and is_home_url(tab.view.url().toString()):
+                tab._push_home_data()
+
+    def _load_extensions(self):
+        install_extensions(QWebEngineProfile.defaultProfile())
+
+    def _on_icon_clicked(self, key):
+        if self.slide_panel.is_open() and self.slide_panel.current_key() == key:
+            self.slide_panel.close_panel()
+            self.icon_bar.clear_active()
+        else:
+            self.slide_panel.show_page(key)
+            self.icon_bar.set_active(key)
+
+    def _cycle_theme(self):
+        themes = list(PALETTES.keys())
+        idx    = themes.index(current_theme())
+        next_t = themes[(idx + 1) % len(themes)]
+        self._set_theme(next_t)
+
+    def _set_theme(self, theme_name):
+        set_theme(theme_name)
+        self.setStyleSheet(build_stylesheet(self.store.perf_mode))
+        self.icon_bar.refresh_icons()
+        if hasattr(self, "slide_panel"):
+            lbl = self.slide_panel._header_lbl
+            lbl.setStyleSheet(
+                "font-weight: 800; font-size: 11px; letter-spacing: 1.5px;"
+                "color: " + p("accent") + "; background: transparent;"
+            )
+        for i in range(self.tabs.count()):
+            t = self.tabs.widget(i)
+            if isinstance(t, BrowserTab):
+                t._refresh_icons()
+                if is_home_url(t.view.url().toString()):
+                    t._push_home_data()
+
+    def _apply_perf_mode(self, mode):
+        self.store.perf_mode = mode
+        self.memory_manager.apply_perf_mode(mode)
+        
+        self.setStyleSheet(build_stylesheet(mode))
+        
+        self.slide_panel.setGraphicsEffect(None)
+        self.tab_panel.setGraphicsEffect(None)
+        
+        if mode == "high":
+            shadow_panel = QGraphicsDropShadowEffect(self.slide_panel)
+            shadow_panel.setBlurRadius(25)
+            shadow_panel.setColor(QColor(0, 0, 0, 120))
+            shadow_panel.setOffset(4, 0)
+            self.slide_panel.setGraphicsEffect(shadow_panel)
+            
+            shadow_tab = QGraphicsDropShadowEffect(self.tab_panel)
+            shadow_tab.setBlurRadius(25)
+            shadow_tab.setColor(QColor(0, 0, 0, 120))
+            shadow_tab.setOffset(-4, 0)
+            self.tab_panel.setGraphicsEffect(shadow_tab)
+        elif mode == "medium":
+            shadow_panel = QGraphicsDropShadowEffect(self.slide_panel)
+            shadow_panel.setBlurRadius(10)
+            shadow_panel.setColor(QColor(0, 0, 0, 60))
+            shadow_panel.setOffset(2, 0)
+            self.slide_panel.setGraphicsEffect(shadow_panel)
+            
+            shadow_tab = QGraphicsDropShadowEffect(self.tab_panel)
+            shadow_tab.setBlurRadius(10)
+            shadow_tab.setColor(QColor(0, 0, 0, 60))
+            shadow_tab.setOffset(-2, 0)
+            self.tab_panel.setGraphicsEffect(shadow_tab)
+
+        for i in range(self.tabs.count()):
+            tab = self.tabs.widget(i)
+            if isinstance(tab, BrowserTab):
+                tab.apply_perf_mode(mode)
+                if is_home_url(tab.view.url().toString()):
+                    tab._push_home_data()
+
+    def _shortcuts(self):
+        for seq, fn in [
+            ("Ctrl+T",       self.add_tab),
+            ("Ctrl+W",       lambda: self._close_tab(self.tabs.currentIndex())),
+            ("Ctrl+Shift+N", lambda: self.add_tab(secret=True)),
+            ("Ctrl+L",       self._focus_address),
+            ("F5",           self._reload),
+            ("Ctrl+R",       self._reload),
+            ("Ctrl+U",       self._view_source),
+            ("Alt+Left",     lambda: self._view_action("back")),
+            ("Alt+Right",    lambda: self._view_action("forward")),
+            ("Alt+Home",     self._go_home),
+            ("Ctrl+D",       self._toggle_favorite),
+            ("Ctrl+H",       lambda: self._on_icon_clicked("history")),
+            ("Ctrl+J",       lambda: self._on_icon_clicked("dl")),
+        ]:
+            QShortcut(QKeySequence(seq), self, fn)
+
+    def _current_tab(self):
+        idx = self.tabs.currentIndex()
+        if idx < 0:
+            return None
+        t = self.tabs.widget(idx)
+        return t if isinstance(t, BrowserTab) else None
+
+    def _focus_address(self):
+        t = self._current_tab()
+        if t:
+            t.focus_address()
+
+    def _reload(self):
+        t = self._current_tab()
+        if t:
+            t.view.reload()
+
+    def _view_source(self):
+        t = self._current_tab()
+        if t:
+            t._view_source()
+
+    def _go_home(self):
+        t = self._current_tab()
+        if t:
+            t.load_home()
+
+    def _view_action(self, action):
+        t = self._current_tab()
+        if t:
+            getattr(t, "go_" + action)()
+
+    def _toggle_favorite(self):
+        t = self._current_tab()
+        if t:
+            t._toggle_favorite()
+
+    def _prerender_current(self, url):
+        t = self._current_tab()
+        if t and not t.secret:
+            self.prerender.start(url, t.profile)
+
+    def _navigate_current(self, url):
+        t = self._current_tab()
+        if t:
+            t.navigate(url)
+        else:
+            new_tab = self.add_tab()
+            QTimer.singleShot(100, lambda: new_tab.navigate(url))
+
+    def closeEvent(self, ev):
+        self.spare_tabs.clear()
+        gc.collect()
+        super().closeEvent(ev)
@@ -0,0 +1,42 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+_PENDING = set()
+
+
+class _Signals(QObject):
+    done  = pyqtSignal(object)
+    error = pyqtSignal(object)
+
+
+class _Task(QRunnable):
+    def __init__(self, fn, args, kwargs):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _Signals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as exc:
+            self.signals.error.emit(exc)
+        else:
+            self.signals.done.emit(result)
+
+
+def submit(fn, *args, on_done=None, on_error=None, **kwargs):
+    # Signals are created on the calling (GUI) thread, so callbacks run there.
+    task = _Task(fn, args, kwargs)
+    _PENDING.add(task)
+
+    def finish(cb, value):
+        _PENDING.discard(task)
+        if cb is not None:
+            cb(value)
+
+    task.signals.done.connect(lambda res: finish(on_done, res))
+    task.signals.error.connect(lambda exc: finish(on_error, exc))
+    QThreadPool.globalInstance().start(task)
+    return task
@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from bench_import import LAZY_MODULES, measure  # noqa: E402
+
+
+# -X importtime in a fresh interpreter per module: anything listed in
+# LAZY_MODULES showing up there means a lazy import regressed to eager.
+@pytest.mark.parametrize("module", ["cysra.crypto", "cysra.store", "cysrabrowser"])
+def test_lazy_modules_stay_lazy(module):
+    try:
+        res = measure(module, 1)
+    except RuntimeError as exc:
+        pytest.skip(f"cannot import {module}: {exc}")
+    eager = [m for m in LAZY_MODULES if m in res["imported"]]
+    assert not eager, f"{module} imports {', '.join(eager)} at startup"
@@ -0,0 +1,40 @@
+import pytest
+
+tab = pytest.importorskip("cysra.tab", exc_type=ImportError)
+QWebEnginePage = tab.QWebEnginePage
+
+
+class _Prerender:
+    def __init__(self):
+        self.taken = []
+
+    def take(self, url, profile):
+        self.taken.append(url)
+        return None
+
+
+class _Tab:
+    secret = False
+    profile = None
+
+    def __init__(self):
+        self.mw = type("MW", (), {"prerender": _Prerender()})()
+
+
+@pytest.mark.parametrize("nav_type", [
+    QWebEnginePage.NavigationTypeFormSubmitted,
+    QWebEnginePage.NavigationTypeReload,
+    QWebEnginePage.NavigationTypeBackForward,
+    QWebEnginePage.NavigationTypeRedirect,
+])
+def test_prerender_not_adopted_for_posts_reloads_or_history(nav_type):
+    t = _Tab()
+    assert tab.BrowserTab._swap_prerendered(t, "https://example.com/", nav_type) is False
+    assert t.mw.prerender.taken == []
+
+
+@pytest.mark.parametrize("nav_type", list(tab.PRERENDER_NAV_TYPES))
+def test_prerender_looked_up_for_links_and_typed_urls(nav_type):
+    t = _Tab()
+    tab.BrowserTab._swap_prerendered(t, "https://example.com/", nav_type)
+    assert t.mw.prerender.taken == ["https://example.com/"]
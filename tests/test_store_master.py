@@ -0,0 +1,38 @@
+import pytest
+
+from cysra.store import DataStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = DataStore(str(tmp_path / "data.json"))
+    # Cheapest scrypt cost the store accepts, so the tests stay fast.
+    s._data["kdf_cost"] = {"algo": "scrypt", "n": 2 ** 4}
+    return s
+
+
+def test_locked_vault_refuses_new_master(store):
+    assert store.set_master_pwd("first")
+    assert store.add_password("https://example.com", "me", "secret")
+    store.lock_master()
+    kdf = dict(store._data["master_kdf"])
+
+    assert not store.set_master_pwd("second")
+    results = []
+    store.set_master_pwd_async("second", results.append)
+    assert results == [False]
+
+    assert store._data["master_kdf"] == kdf
+    assert not store.unlock_master("second")
+    assert store.unlock_master("first")
+    assert store.reveal_password("https://example.com", "me") == "secret"
+
+
+def test_unlocked_vault_changes_master(store):
+    assert store.set_master_pwd("first")
+    assert store.add_password("https://example.com", "me", "secret")
+    assert store.set_master_pwd("second")
+    store.lock_master()
+    assert not store.unlock_master("first")
+    assert store.unlock_master("second")
+    assert store.reveal_password("https://example.com", "me") == "secret"